@@ -78,7 +78,12 @@ def setup_logging():
 
 def register_extensions(app):
     """Register Flask extensions with the app"""
+    from app.infrastructure.persistence.sqlite_tuning import tune_sqlite_engine
+
     db.init_app(app)
+    with app.app_context():
+        tune_sqlite_engine(db.engine)
+
     migrate.init_app(app, db, render_as_batch=True)
     cache.init_app(app)
 
@@ -0,0 +1,7 @@
+class GetBulkJobOwner:
+
+    def __init__(self, fan_out_executor):
+        self.fan_out_executor = fan_out_executor
+
+    def execute(self, job_id):
+        return self.fan_out_executor.owner(job_id)
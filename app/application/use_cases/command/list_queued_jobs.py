@@ -0,0 +1,7 @@
+class ListQueuedJobs:
+
+    def __init__(self, job_runner):
+        self.job_runner = job_runner
+
+    def execute(self):
+        return self.job_runner.list()
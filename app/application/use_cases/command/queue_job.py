@@ -0,0 +1,7 @@
+class QueueJob:
+
+    def __init__(self, job_runner):
+        self.job_runner = job_runner
+
+    def execute(self, func, args=(), name=None, server_id=None, priority="normal", app_context=None):
+        return self.job_runner.submit(func, args, name, server_id, priority, app_context)
@@ -0,0 +1,7 @@
+class RunBulkCommand:
+
+    def __init__(self, fan_out_executor):
+        self.fan_out_executor = fan_out_executor
+
+    def execute(self, jobs, app_context=None, owner_id=None):
+        return self.fan_out_executor.run(jobs, app_context, owner_id)
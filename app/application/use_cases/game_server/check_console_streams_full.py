@@ -0,0 +1,7 @@
+class CheckConsoleStreamsFull:
+
+    def __init__(self, console_stream_hub):
+        self.console_stream_hub = console_stream_hub
+
+    def execute(self):
+        return self.console_stream_hub.full()
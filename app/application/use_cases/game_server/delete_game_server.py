@@ -1,8 +1,9 @@
 class DeleteGameServer:
 
-    def __init__(self, game_server_repository, game_server_manager):
+    def __init__(self, game_server_repository, game_server_manager, status_poller):
         self.game_server_repository = game_server_repository
         self.game_server_manager = game_server_manager
+        self.status_poller = status_poller
 
     def execute(self, id, remove_files, delete_user, errors):
         """
@@ -18,9 +19,17 @@ class DeleteGameServer:
 
         # Only remove from DB.
         if not remove_files:
-            return self.game_server_repository.delete(id)
+            deleted = self.game_server_repository.delete(id)
 
         # If system delete success, delete from DB.
-        if self.game_server_manager.delete(server, delete_user, errors):
-            return self.game_server_repository.delete(id)
+        elif self.game_server_manager.delete(server, delete_user, errors):
+            deleted = self.game_server_repository.delete(id)
 
+        else:
+            deleted = False
+
+        # Stop background status checks for it.
+        if deleted:
+            self.status_poller.forget(id)
+
+        return deleted
@@ -0,0 +1,7 @@
+class GetGameServerPowerStates:
+
+    def __init__(self, status_poller):
+        self.status_poller = status_poller
+
+    def execute(self, game_servers, app_context=None):
+        return self.status_poller.get_power_states(game_servers, app_context)
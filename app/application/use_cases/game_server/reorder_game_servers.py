@@ -0,0 +1,11 @@
+class ReorderGameServers:
+
+    def __init__(self, game_server_repository):
+        self.game_server_repository = game_server_repository
+
+    def execute(self, game_server_ids):
+        """
+        Returns:
+            Bool: True if sort order updated, False if any id doesn't exist.
+        """
+        return self.game_server_repository.reorder(game_server_ids)
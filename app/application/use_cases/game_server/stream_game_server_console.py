@@ -0,0 +1,7 @@
+class StreamGameServerConsole:
+
+    def __init__(self, console_stream_hub):
+        self.console_stream_hub = console_stream_hub
+
+    def execute(self, server, last_seq=None):
+        return self.console_stream_hub.subscribe(server, last_seq)
@@ -0,0 +1,7 @@
+class StreamGameServerStatuses:
+
+    def __init__(self, status_poller):
+        self.status_poller = status_poller
+
+    def execute(self, game_servers, app_context=None):
+        return self.status_poller.subscribe(game_servers, app_context)
@@ -1,4 +1,4 @@
-import json
+from app.domain.entities.permissions import Permissions
 
 class ListUserGameServers:
 
@@ -8,17 +8,9 @@ class ListUserGameServers:
 
     def execute(self, user_id):
         user = self.user_repository.get(user_id)
-        
-        if user.role == 'admin':
-            return self.game_server_repository.list()
-
-        user_perms = json.loads(user.permissions)
+        permissions = Permissions.for_user(user)
 
-        servers = []
-        for server_id in user_perms['server_ids']:
-            server = self.game_server_repository.get(server_id)
-            if server:
-                servers.append(server)
-        
-        return servers
+        if permissions.admin:
+            return self.game_server_repository.list()
 
+        return self.game_server_repository.get_many(permissions.server_ids)
@@ -42,17 +42,24 @@ from app.infrastructure.persistence.repositories.game_server_repo import SqlAlch
 from app.infrastructure.system.game_server.game_server_manager import GameServerManager
 from app.infrastructure.system.game_server.install_manager import GameServerInstallManager
 from app.infrastructure.system.game_server.cfg_manager import CfgManager
+from app.infrastructure.system.game_server.console_stream_hub import ConsoleStreamHub
+from app.infrastructure.system.game_server.status_poller import StatusPoller
 from app.application.use_cases.game_server.list_game_servers import ListGameServers
 from app.application.use_cases.game_server.get_game_server import GetGameServer
 from app.application.use_cases.game_server.get_game_server_power_state import GetGameServerPowerState
+from app.application.use_cases.game_server.get_game_server_power_states import GetGameServerPowerStates
+from app.application.use_cases.game_server.stream_game_server_statuses import StreamGameServerStatuses
 from app.application.use_cases.game_server.query_game_server import QueryGameServer
 from app.application.use_cases.game_server.edit_game_server import EditGameServer
+from app.application.use_cases.game_server.reorder_game_servers import ReorderGameServers
 from app.application.use_cases.game_server.delete_game_server import DeleteGameServer
 from app.application.use_cases.game_server.find_cfg_paths import FindGameServerCfgPaths
 from app.application.use_cases.game_server.cancel_game_server_install import CancelGameServerInstall
 from app.application.use_cases.game_server.list_running_installs import ListRunningGameServerInstalls
 from app.application.use_cases.game_server.list_installable import ListInstallableGameServers
 from app.application.use_cases.game_server.clean_install_buffer_output import ClearInstallBufferOutput
+from app.application.use_cases.game_server.stream_game_server_console import StreamGameServerConsole
+from app.application.use_cases.game_server.check_console_streams_full import CheckConsoleStreamsFull
 
 # Blocklist
 from app.infrastructure.security.blocklist_repo import InMemBlocklistRepository
@@ -64,7 +71,7 @@ from app.infrastructure.system.metrics.system_metrics import SystemMetrics
 from app.application.use_cases.metrics.get_host_stats import GetHostStats
 
 # Processes
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
 from app.application.use_cases.processes.get_process import GetProcess
 from app.application.use_cases.processes.list_processes import ListProcesses
 from app.application.use_cases.processes.add_process import AddProcess
@@ -72,7 +79,13 @@ from app.application.use_cases.processes.remove_process import RemoveProcess
 
 # Command
 from app.infrastructure.system.command_executor.command_executor import CommandExecutor
+from app.infrastructure.system.command_executor.fan_out_executor import FanOutExecutor
+from app.infrastructure.system.command_executor.job_runner import JobRunner
 from app.application.use_cases.command.run_cmd import RunCommand
+from app.application.use_cases.command.run_bulk_command import RunBulkCommand
+from app.application.use_cases.command.get_bulk_job_owner import GetBulkJobOwner
+from app.application.use_cases.command.queue_job import QueueJob
+from app.application.use_cases.command.list_queued_jobs import ListQueuedJobs
 
 # Config
 from app.infrastructure.system.config.config_manager import ConfigManager
@@ -125,7 +138,7 @@ class Container:
         return InMemBlocklistRepository()
 
     def in_mem_process_repository(self):
-        return InMemProcInfoRepository()
+        return get_proc_info_repository()
 
     def controls_repository(self):
         return ControlsRepository()
@@ -141,12 +154,24 @@ class Container:
     def game_server_install_manager(self):
         return GameServerInstallManager()
 
+    def console_stream_hub(self):
+        return ConsoleStreamHub()
+
+    def status_poller(self):
+        return StatusPoller()
+
     def system_metrics(self):
         return SystemMetrics()
 
     def command_executor(self):
         return CommandExecutor()
 
+    def fan_out_executor(self):
+        return FanOutExecutor()
+
+    def job_runner(self):
+        return JobRunner()
+
     def config_manager(self):
         return ConfigManager()
 
@@ -269,6 +294,16 @@ class Container:
             game_server_manager=self.game_server_manager(),
         )
 
+    def get_game_server_power_states(self):
+        return GetGameServerPowerStates(
+            status_poller=self.status_poller(),
+        )
+
+    def stream_game_server_statuses(self):
+        return StreamGameServerStatuses(
+            status_poller=self.status_poller(),
+        )
+
     def query_game_server(self):
         return QueryGameServer(
             game_server_repository=self.game_server_repository(),
@@ -279,10 +314,16 @@ class Container:
             game_server_repository=self.game_server_repository(),
         )
 
+    def reorder_game_servers(self):
+        return ReorderGameServers(
+            game_server_repository=self.game_server_repository(),
+        )
+
     def delete_game_server(self):
         return DeleteGameServer(
             game_server_repository=self.game_server_repository(),
             game_server_manager=self.game_server_manager(),
+            status_poller=self.status_poller(),
         )
 
     def find_cfg_paths(self):
@@ -290,6 +331,16 @@ class Container:
             cfg_manager=self.cfg_manager(),
         )
 
+    def stream_game_server_console(self):
+        return StreamGameServerConsole(
+            console_stream_hub=self.console_stream_hub(),
+        )
+
+    def check_console_streams_full(self):
+        return CheckConsoleStreamsFull(
+            console_stream_hub=self.console_stream_hub(),
+        )
+
     ## GameServer Installs
 
     def cancel_game_server_install(self):
@@ -359,6 +410,26 @@ class Container:
             command_executor=self.command_executor()
         )
 
+    def run_bulk_command(self):
+        return RunBulkCommand(
+            fan_out_executor=self.fan_out_executor()
+        )
+
+    def get_bulk_job_owner(self):
+        return GetBulkJobOwner(
+            fan_out_executor=self.fan_out_executor()
+        )
+
+    def queue_job(self):
+        return QueueJob(
+            job_runner=self.job_runner()
+        )
+
+    def list_queued_jobs(self):
+        return ListQueuedJobs(
+            job_runner=self.job_runner()
+        )
+
     ## Config
 
     def get_template_config(self):
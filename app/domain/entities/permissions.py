@@ -0,0 +1,106 @@
+import json
+
+from functools import lru_cache
+
+
+class Permissions:
+    """
+    Read only, pre-parsed view of a user's permissions, for checking access
+    without going back to the permissions json each time.
+
+    Args:
+        admin (bool): Admins are allowed everything, regardless of the rest.
+        server_ids (iterable): Ids of game servers user has access to.
+        routes (iterable): Routes user has access to.
+        controls (iterable): Controls user can run.
+    """
+    __slots__ = ("admin", "server_ids", "routes", "controls")
+
+    def __init__(self, admin=False, server_ids=(), routes=(), controls=()):
+        object.__setattr__(self, "admin", admin)
+        object.__setattr__(self, "server_ids", frozenset(server_ids))
+        object.__setattr__(self, "routes", frozenset(routes))
+        object.__setattr__(self, "controls", frozenset(controls))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("Permissions are read only")
+
+    def __reduce__(self):
+        return (Permissions, (self.admin, self.server_ids, self.routes, self.controls))
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Get compiled permissions for a user. Compiled once per distinct role
+        and permissions json, so the same user version is only parsed once.
+
+        Args:
+            user (User): User (or AuthUser) with role & permissions attrs.
+
+        Returns:
+            Permissions: User's permissions.
+        """
+        return _compile(user.role, user.permissions)
+
+    def has_server(self, server_id):
+        return self.admin or server_id in self.server_ids
+
+    def has_route(self, route):
+        return self.admin or route in self.routes
+
+    def has_control(self, control):
+        return self.admin or control in self.controls
+
+    def allows(self, route, server_id=None):
+        """
+        Check access to route, and to server_id if given.
+
+        Returns:
+            bool: True if user has appropriate perms, False otherwise.
+        """
+        if self.admin:
+            return True
+
+        if server_id and server_id not in self.server_ids:
+            return False
+
+        if route not in self.routes:
+            return False
+
+        # Special case for update-console, user needs access to console control too.
+        if route == "update-console" and "console" not in self.controls:
+            return False
+
+        return True
+
+    def __eq__(self, other):
+        if not isinstance(other, Permissions):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in Permissions.__slots__)
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, key) for key in Permissions.__slots__))
+
+    def __repr__(self):
+        return f"Permissions(admin={self.admin}, server_ids={sorted(self.server_ids)}, routes={sorted(self.routes)}, controls={sorted(self.controls)})"
+
+
+@lru_cache(maxsize=1024)
+def _compile(role, permissions_json):
+    if role == "admin":
+        return Permissions(admin=True)
+
+    # Missing or unreadable permissions mean no access.
+    try:
+        perms = json.loads(permissions_json or "{}")
+    except (TypeError, ValueError):
+        perms = dict()
+
+    if not isinstance(perms, dict):
+        perms = dict()
+
+    return Permissions(
+        server_ids=perms.get("server_ids") or (),
+        routes=perms.get("routes") or (),
+        controls=perms.get("controls") or (),
+    )
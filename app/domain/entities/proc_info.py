@@ -1,34 +1,170 @@
 import json
 
+from array import array
+from bisect import bisect_right
+
+class OutputLines(list):
+    """
+    List of output lines where every line is stamped with a seq number taken
+    from its owning ProcInfo. Seq numbers are shared between stdout and stderr
+    and only ever go up, even when the list is cleared, so they can be used as
+    cursors for fetching just the lines added since a given point.
+
+    Optionally bounded by a max number of lines and/or size. Once either cap is
+    passed, the oldest lines are dropped (or handed to spill first, if set)
+    until the buffer is back down to TRIM_RATIO of its caps. Trimming in bulk
+    like that keeps appends cheap instead of shifting the list on every line.
+    """
+    TRIM_RATIO = 0.75
+
+    def __init__(self, proc_info, max_lines=None, max_bytes=None, spill=None):
+        """
+        Args:
+            proc_info (ProcInfo): Owner of the shared seq counter.
+            max_lines (int): Optional max number of lines to hold.
+            max_bytes (int): Optional max size of lines held, counted in
+                             bytes of UTF-8 encoded output.
+            spill (callable): Optional function called with list of lines
+                              before they get dropped.
+        """
+        super().__init__()
+        self._proc_info = proc_info
+        self._seqs = array('Q')
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.size = 0
+        self.dropped = 0
+
+    def append(self, line):
+        seq = self._next_seq(line)
+        super().append(line)
+        self._seqs.append(seq)
+        self.size += self._line_size(line)
+
+        if (self.max_lines and len(self) > self.max_lines) or \
+                (self.max_bytes and self.size > self.max_bytes):
+            self._trim()
+
+    def extend(self, lines):
+        """Appends lines in one go, handing out their seqs all at once."""
+        lines = list(lines)
+        if not lines:
+            return
+
+        seqs = self._next_seqs(lines)
+        super().extend(lines)
+        self._seqs.extend(seqs)
+        self.size += sum(self._line_size(line) for line in lines)
+
+        if (self.max_lines and len(self) > self.max_lines) or \
+                (self.max_bytes and self.size > self.max_bytes):
+            self._trim()
+
+    def __iadd__(self, lines):
+        self.extend(lines)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._seqs = array('Q')
+        self.size = 0
+
+    @staticmethod
+    def _line_size(line):
+        """Size of line in bytes, as UTF-8."""
+        return len(line.encode("utf-8", "surrogatepass"))
+
+    def _next_seq(self, line):
+        """Hands out seq number for line about to be appended."""
+        self._proc_info.seq += 1
+        return self._proc_info.seq
+
+    def _next_seqs(self, lines):
+        """Hands out seq numbers for lines about to be extended, in order."""
+        first = self._proc_info.seq + 1
+        self._proc_info.seq += len(lines)
+        return range(first, self._proc_info.seq + 1)
+
+    def since(self, seq):
+        """
+        Get lines added after seq.
+
+        Args:
+            seq (int): Seq number of the last line already seen.
+
+        Returns:
+            list: Lines with a seq number greater than the one supplied.
+        """
+        return self[bisect_right(self._seqs, seq):]
+
+    def _trim(self):
+        """Drop oldest lines until back under TRIM_RATIO of the caps."""
+        keep_lines = int(self.max_lines * self.TRIM_RATIO) if self.max_lines else len(self)
+        keep_bytes = int(self.max_bytes * self.TRIM_RATIO) if self.max_bytes else self.size
+
+        count = 0
+        size = self.size
+        while count < len(self) and (len(self) - count > keep_lines or size > keep_bytes):
+            size -= self._line_size(self[count])
+            count += 1
+
+        if self.spill:
+            self.spill(self[:count])
+
+        del self[:count]
+        del self._seqs[:count]
+        self.size = size
+        self.dropped += count
+
+
 class ProcInfo:
     """
     Class used to create objects that hold information about processes launched
     via the subprocess Popen wrapper in infra layer.
     """
 
-    def __init__(self):
+    def __init__(self, max_lines=None, max_bytes=None, spill=None):
         """
         Args:
             stdout (list): Lines of stdout delivered by subprocess.Popen call.
             stderr (list): Lines of stderr delivered by subprocess.Popen call.
+            seq (int): Seq number of the last line appended to stdout or stderr.
             process_lock (bool): Acts as lock to tell if process is still
                                  running and output is being appended.
             pid (int): Process id.
             exit_status (int): Exit status of cmd in Popen call.
+            max_lines (int): Optional cap on lines held per stream.
+            max_bytes (int): Optional cap on size of output held per stream.
+            spill (callable): Optional function called with the stream name
+                              and list of lines, before old lines get dropped.
         """
-        self.stdout = []
-        self.stderr = []
+        self.seq = 0
+        self.stdout = OutputLines(self, max_lines, max_bytes,
+                                  spill and (lambda lines: spill("stdout", lines)))
+        self.stderr = OutputLines(self, max_lines, max_bytes,
+                                  spill and (lambda lines: spill("stderr", lines)))
         self.server_id = None  # If applies for process
         self.process_lock = None
         self.pid = None
         self.exit_status = None
 
-    def toJSON(self):
-        return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+    def toJSON(self, since=None):
+        """
+        Args:
+            since (int): Optional seq cursor, only include output lines added
+                         after it. A cursor from before this object existed
+                         (ie. one higher than current seq) gets everything.
+        """
+        data = {k: v for k, v in self.__dict__.items() if not k.startswith('_')}
+        if since is not None and since <= self.seq:
+            data['stdout'] = self.stdout.since(since)
+            data['stderr'] = self.stderr.since(since)
+
+        return json.dumps(data, default=lambda o: o.__dict__, sort_keys=True, indent=4)
 
     def __str__(self):
         return f"ProcInfo(stdout='{self.stdout}', stderr='{self.stderr}', server_id='{self.server_id}', process_lock='{self.process_lock}', pid='{self.pid}', exit_status='{self.exit_status}')"
 
     def __repr__(self):
         return f"ProcInfo(stdout='{self.stdout}', stderr='{self.stderr}', server_id='{self.server_id}', process_lock='{self.process_lock}', pid='{self.pid}', exit_status='{self.exit_status}')"
-
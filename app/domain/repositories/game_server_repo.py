@@ -6,9 +6,15 @@ class GameServerRepository:
     def update(self, game_server):
         raise NotImplementedError
 
+    def reorder(self, ids):
+        raise NotImplementedError
+
     def get(self, id):
         raise NotImplementedError
 
+    def get_many(self, ids):
+        raise NotImplementedError
+
     def list(self):
         raise NotImplementedError
 
@@ -7,9 +7,11 @@ class ProcInfoRepository:
     def list(self):
         raise NotImplementedError
 
-    def get(self, server_id, create=False):
+    def get(self, server_id, create=False, since=None):
         raise NotImplementedError
 
     def remove(self, server_id):
         raise NotImplementedError
 
+    def stats(self):
+        raise NotImplementedError
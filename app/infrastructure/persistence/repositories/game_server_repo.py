@@ -4,6 +4,8 @@ import json
 import base64
 import onetimepass
 
+from sqlalchemy import case
+
 from app.domain.repositories.game_server_repo import GameServerRepository
 from app.domain.entities.game_server import GameServer
 from app.infrastructure.persistence.models.game_server_model import GameServerModel
@@ -47,6 +49,34 @@ class SqlAlchemyGameServerRepository(GameServerRepository):
         return True
 
 
+    def reorder(self, game_server_ids):
+        """
+        Sets each game_server's sort_order to its position in game_server_ids,
+        in one UPDATE statement and transaction. Nothing is changed if any of
+        the ids don't exist.
+
+        Returns:
+            bool: True if sort order updated, False otherwise.
+        """
+        positions = {game_server_id: index for index, game_server_id in enumerate(game_server_ids)}
+        if not positions:
+            return False
+
+        count = GameServerModel.query \
+            .filter(GameServerModel.id.in_(positions)) \
+            .update(
+                {GameServerModel.sort_order: case(positions, value=GameServerModel.id)},
+                synchronize_session=False,
+            )
+
+        if count != len(positions):
+            db.session.rollback()
+            return False
+
+        db.session.commit()
+        return True
+
+
     def get(self, game_server_id):
         """Convert game_server_id into GameServer entity"""
         model = GameServerModel.query.filter_by(id=game_server_id).first()
@@ -54,23 +84,27 @@ class SqlAlchemyGameServerRepository(GameServerRepository):
         if model == None:
             return None
 
-        # Convert model object to Job entity.
-        data = {
-            'id': model.id,
-            'install_name': model.install_name,
-            'install_path': model.install_path,
-            'script_name': model.script_name,
-            'username': model.username,
-            'is_container': model.is_container,
-            'install_type': model.install_type,
-            'install_host': model.install_host,
-            'install_finished': model.install_finished,
-            'install_failed': model.install_failed,
-            'keyfile_path': model.keyfile_path,
-        }
-        game_server = GameServer(**data)
+        return self._to_entity(model)
+
+
+    def get_many(self, game_server_ids):
+        """
+        Fetches game_servers for a bunch of ids in one query. Ids that don't
+        exist are skipped.
 
-        return game_server
+        Returns:
+            list: GameServer entities, in sort order.
+        """
+        game_server_ids = list(game_server_ids)
+        if not game_server_ids:
+            return []
+
+        models = GameServerModel.query \
+            .filter(GameServerModel.id.in_(game_server_ids)) \
+            .order_by(GameServerModel.sort_order) \
+            .all()
+
+        return [self._to_entity(model) for model in models]
 
 
     def query(self, **kwargs):
@@ -80,8 +114,7 @@ class SqlAlchemyGameServerRepository(GameServerRepository):
         if model == None:
             return None
 
-        # Use existing get game_server to convert model id to domain GameServer entity.
-        return self.get(model.id)
+        return self._to_entity(model)
 
 
     def delete(self, game_server_id):
@@ -101,11 +134,23 @@ class SqlAlchemyGameServerRepository(GameServerRepository):
         entity objects.
         """
         all_models = GameServerModel.query.order_by(GameServerModel.sort_order).all()
-        all_game_servers = []
-
-        for model in all_models:
-            all_game_servers.append(self.get(model.id))
-            
-        return all_game_servers
+        return [self._to_entity(model) for model in all_models]
 
 
+    def _to_entity(self, model):
+        """Convert already loaded model object to GameServer entity."""
+        data = {
+            'id': model.id,
+            'install_name': model.install_name,
+            'install_path': model.install_path,
+            'script_name': model.script_name,
+            'username': model.username,
+            'is_container': model.is_container,
+            'install_type': model.install_type,
+            'install_host': model.install_host,
+            'install_finished': model.install_finished,
+            'install_failed': model.install_failed,
+            'keyfile_path': model.keyfile_path,
+            'sort_order': model.sort_order,
+        }
+        return GameServer(**data)
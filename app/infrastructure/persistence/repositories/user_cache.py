@@ -0,0 +1,70 @@
+from flask import g, has_request_context
+
+from app import cache
+from app.domain.entities.permissions import Permissions
+from app.infrastructure.system.config import ConfigManager
+
+
+class UserCache:
+    """
+    Caches User entities, along with their compiled Permissions, so every
+    permission check in a request doesn't mean another query and
+    json.loads().
+
+    Entries are kept on flask.g for the rest of the request, and in the app
+    cache for up to user_cache_ttl seconds across requests. Changes made
+    through the user repository invalidate both right away. The app cache is
+    per worker process though, so with more than one worker, changes made in
+    one can take up to user_cache_ttl seconds to show up in the others.
+    """
+    KEY_PREFIX = "user:"
+
+    def get(self, user_id, load):
+        """
+        Get user and their parsed permissions from cache, loading them on a
+        miss.
+
+        Args:
+            user_id (int): Id of user to get.
+            load (callable): Called with user_id on a miss, returns the User
+                             entity or None.
+        Returns:
+            tuple: (User, Permissions) pair, None if user doesn't exist.
+        """
+        key = str(user_id)
+        local = self._request_cache()
+        if local is not None and key in local:
+            return local[key]
+
+        ttl = ConfigManager().getint('settings', 'user_cache_ttl', 30)
+        entry = cache.get(UserCache.KEY_PREFIX + key) if ttl else None
+
+        if entry is None:
+            user = load(user_id)
+            if user is None:
+                return None
+
+            entry = (user, Permissions.for_user(user))
+            if ttl:
+                cache.set(UserCache.KEY_PREFIX + key, entry, timeout=ttl)
+
+        if local is not None:
+            local[key] = entry
+
+        return entry
+
+    def invalidate(self, user_id):
+        """Drop user from cache, after they've been changed or deleted."""
+        key = str(user_id)
+        cache.delete(UserCache.KEY_PREFIX + key)
+
+        local = self._request_cache()
+        if local is not None:
+            local.pop(key, None)
+
+    def _request_cache(self):
+        """Dict of entries for the current request, None outside requests."""
+        if not has_request_context():
+            return None
+
+        return g.setdefault('user_cache', dict())
@@ -1,15 +1,19 @@
 import os
-import json
+import copy
 import base64
 import onetimepass
 
 from app.domain.repositories.user_repo import UserRepository
 from app.domain.entities.user import User
 from app.infrastructure.persistence.models.user_model import UserModel
+from app.infrastructure.persistence.repositories.user_cache import UserCache
 from app import db
 
 class SqlAlchemyUserRepository(UserRepository):
 
+    def __init__(self, user_cache=UserCache()):
+        self.user_cache = user_cache
+
     def add(self, user):
         if not user.otp_secret:
             user.otp_secret = base64.b32encode(os.urandom(10)).decode('utf-8')
@@ -25,6 +29,7 @@ class SqlAlchemyUserRepository(UserRepository):
         )
         db.session.add(model)
         db.session.commit()
+        self.user_cache.invalidate(model.id)
         return model.id
 
 
@@ -39,17 +44,32 @@ class SqlAlchemyUserRepository(UserRepository):
             setattr(model, key, value)
 
         db.session.commit()
+        self.user_cache.invalidate(user.id)
         return True
 
 
     def get(self, user_id):
         """Convert user_id into User entity"""
+        entry = self.user_cache.get(user_id, self._load)
+        if entry == None:
+            return None
+
+        # Copy, so callers editing their user don't touch the cached one.
+        return copy.copy(entry[0])
+
+
+    def _load(self, user_id):
+        """Fetch User entity from DB, bypassing the cache."""
         model = UserModel.query.filter_by(id=user_id).first()
 
         if model == None:
             return None
 
-        # Convert model object to Job entity.
+        return self._to_entity(model)
+
+
+    def _to_entity(self, model):
+        """Convert already loaded model object to User entity."""
         data = {
             'id': model.id,
             'username': model.username,
@@ -61,9 +81,7 @@ class SqlAlchemyUserRepository(UserRepository):
             'otp_setup': model.otp_setup,
 
         }
-        user = User(**data)
-
-        return user
+        return User(**data)
 
 
     def query(self, key, value):
@@ -73,8 +91,7 @@ class SqlAlchemyUserRepository(UserRepository):
         if model == None:
             return None
 
-        # Use existing get user to convert model id to domain User entity.
-        return self.get(model.id)
+        return self._to_entity(model)
 
 
     def delete(self, user_id):
@@ -85,6 +102,7 @@ class SqlAlchemyUserRepository(UserRepository):
 
         db.session.delete(model)
         db.session.commit()
+        self.user_cache.invalidate(user_id)
         return True
 
 
@@ -93,25 +111,17 @@ class SqlAlchemyUserRepository(UserRepository):
         Fetches list of all users from DB and converts them to list of User
         entity objects.
         """
-        all_models = UserModel.query.all()
-        all_users = []
-
-        for model in all_models:
-            all_users.append(self.get(model.id))
-            
-        return all_users
+        return [self._to_entity(model) for model in UserModel.query.all()]
 
 
     def to_domain(self, model):
         """
         Converts sqlalchemy model object into domain layer representation.
         Even though this is basically just a get, its nice to have an explicit
-        wrapper name to provide context.
+        wrapper name to provide context. Also takes anything else with a user
+        id (ie. current_user), so goes through the cache rather than mapping
+        the object passed in.
         """
-        model = UserModel.query.filter_by(id=model.id).first()
-        if not model:
-            return None
-
         return self.get(model.id)
 
 
@@ -139,12 +149,14 @@ class SqlAlchemyUserRepository(UserRepository):
             bool: True if user has appropriate perms, False otherwise.
     
         """
-        user = self.get(user_id)
-        if not user:
+        entry = self.user_cache.get(user_id, self._load)
+        if not entry:
             return False
 
+        _, permissions = entry
+
         # Admins can always do anything.
-        if user.role == "admin":
+        if permissions.admin:
             return True
 
         valid_routes = ["install", "edit", "add", "delete", "settings", "controls",
@@ -152,21 +164,4 @@ class SqlAlchemyUserRepository(UserRepository):
 
         assert route in valid_routes, f"Invalid route: {route}"
 
-        user_perms = json.loads(user.permissions)
-
-        # Does user have access to server_id?
-        if server_id:
-            if server_id not in user_perms["server_ids"]:
-                return False
-
-        # Does user have access to route?
-        if route not in user_perms["routes"]:
-            return False
-
-        # Special case for update-console, user needs access to console control too.
-        if route == "update-console":
-            if "console" not in user_perms["controls"]:
-                return False
-
-        return True
-
+        return permissions.allows(route, server_id)
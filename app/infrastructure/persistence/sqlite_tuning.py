@@ -0,0 +1,76 @@
+import logging
+
+from sqlalchemy import event
+
+from app.infrastructure.system.config import ConfigManager
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_MODES = ["delete", "truncate", "persist", "memory", "wal", "off"]
+SYNCHRONOUS_MODES = ["off", "normal", "full", "extra"]
+
+
+def sqlite_pragmas(config=None):
+    """
+    Builds the PRAGMA statements for the sqlite_* settings in main.conf.
+    Unknown journal or synchronous modes fall back to their defaults, since
+    pragma values can't be passed as bound parameters.
+
+    Args:
+        config (ConfigManager): Optional config to read settings from.
+
+    Returns:
+        list: PRAGMA statements to run on each new connection.
+    """
+    config = config or ConfigManager()
+
+    journal_mode = config.get('settings', 'sqlite_journal_mode', 'wal').lower()
+    if journal_mode not in JOURNAL_MODES:
+        logger.warning(f"Invalid sqlite_journal_mode '{journal_mode}', using wal")
+        journal_mode = "wal"
+
+    synchronous = config.get('settings', 'sqlite_synchronous', 'normal').lower()
+    if synchronous not in SYNCHRONOUS_MODES:
+        logger.warning(f"Invalid sqlite_synchronous '{synchronous}', using normal")
+        synchronous = "normal"
+
+    foreign_keys = config.getboolean('settings', 'sqlite_foreign_keys', False)
+
+    return [
+        f"PRAGMA journal_mode={journal_mode}",
+        f"PRAGMA synchronous={synchronous}",
+        f"PRAGMA busy_timeout={config.getint('settings', 'sqlite_busy_timeout', 5000)}",
+        f"PRAGMA mmap_size={config.getint('settings', 'sqlite_mmap_size', 67108864)}",
+        f"PRAGMA cache_size={config.getint('settings', 'sqlite_cache_size', -8000)}",
+        f"PRAGMA foreign_keys={'ON' if foreign_keys else 'OFF'}",
+    ]
+
+
+def tune_sqlite_engine(engine, config=None):
+    """
+    Has engine run the sqlite pragmas on every connection it opens. Settings
+    are read once here, so changes take effect on restart. Engines for other
+    databases are left alone.
+
+    Args:
+        engine (Engine): SQLAlchemy engine, before it's opened any connections.
+        config (ConfigManager): Optional config to read settings from.
+
+    Returns:
+        Engine: Same engine passed in.
+    """
+    if engine.dialect.name != "sqlite":
+        return engine
+
+    pragmas = sqlite_pragmas(config)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+    return engine
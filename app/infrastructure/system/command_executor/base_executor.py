@@ -1,84 +1,126 @@
+import re
+import codecs
 import logging
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
+
+from .execution_profile import ExecutionProfile
 
 class CommandExecutor(ABC):
     """Abstract base class for command execution."""
     
     @abstractmethod
-    def run(self, cmd, cmd_id=None, app_context=False):
+    def run(self, cmd, cmd_id=None, app_context=False, profile=None):
         """Execute a command and return process info."""
         pass
     
     @abstractmethod
-    def get_output(self, proc, proc_info, output_type):
+    def get_output(self, proc, proc_info, output_type, profile=None):
         """Get output from process."""
         pass
 
 
 class BaseCommandExecutor(CommandExecutor):
     """Base implementation with common functionality."""
+
+    # A run of text plus the carriage return or newline ending it. Only the
+    # last match in a chunk can be missing its terminator.
+    LINE_RE = re.compile(r"[^\r\n]+[\r\n]?")
     
     def __init__(self, logger=logging.getLogger(__name__)):
         self.config = None  # Will be injected
         self.proc_info_repo = None  # Will be injected
         self.logger = logger
         
-    def _setup_proc_info(self, cmd_id, create=True):
+    def _pushed(self, app_context=None):
+        """
+        Context manager pushing app_context for the length of a command, if
+        given. It's popped again after, since threads running commands are
+        pooled and get reused.
+        """
+        return app_context if app_context else nullcontext()
+
+    def _get_profile(self, profile=None):
+        """Snapshot settings for a command, unless caller supplied them."""
+        if profile is None:
+            profile = ExecutionProfile.from_config(self.config)
+        return profile
+
+    def _get_decoders(self, profile=None):
+        """
+        Incremental utf-8 decoder per output stream. Chunks can end part way
+        through a multibyte character, the decoder holds onto the partial
+        bytes until the rest arrive instead of choking on them.
+
+        Returns:
+            dict: Decoders for stdout & stderr.
+        """
+        errors = self._get_profile(profile).decode_errors
+        decoder = codecs.getincrementaldecoder("utf-8")
+        return {"stdout": decoder(errors=errors), "stderr": decoder(errors=errors)}
+
+    def _setup_proc_info(self, cmd_id, create=True, profile=None):
         """Setup process info object."""
         if not self.proc_info_repo:
-            self.proc_info_repo = InMemProcInfoRepository()
+            self.proc_info_repo = get_proc_info_repository()
         
         proc_info = self.proc_info_repo.get(cmd_id, create=create)
         
-        if self.config.getboolean('settings', 'clear_output_on_reload'):
+        if self._get_profile(profile).clear_output_on_reload:
             proc_info.stdout.clear()
             proc_info.stderr.clear()
         
         return proc_info
     
-    def _process_output_line(self, line, output_type, proc_info):
+    def _process_output_line(self, line, output_type, proc_info, end_in_newlines=False):
         """Process a single line of output."""
         # Add the newlines for optional old-style setting.
-        if self.config.getboolean('settings', 'end_in_newlines'):
+        if end_in_newlines:
             if not line.endswith("\n"):
                 line = line + "\n"
         
         if output_type == "stdout":
             proc_info.stdout.append(line)
-            log_msg = self._log_wrap("stdout", line.replace("\n", ""))
-#            self.logger.debug(log_msg)
         else:
             proc_info.stderr.append(line)
-            log_msg = self._log_wrap("stderr", line.replace("\n", ""))
-            self.logger.debug(log_msg)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(self._log_wrap("stderr", line.replace("\n", "")))
     
     def _log_wrap(self, stream_type, message):
         """Wrapper for logging (assuming this exists somewhere)."""
         # TODO: This should be imported from utils 
         return f"[{stream_type}] {message}"
     
-    def _process_raw_output(self, raw_line, proc_info, output_type):
-        """Process raw output line with carriage return/newline handling."""
+    def _process_raw_output(self, raw_line, proc_info, output_type, profile=None):
+        """
+        Process raw output chunk with carriage return/newline handling. Chunk
+        is split in one pass into lines that keep whichever of \\r or \\n
+        ended them. Empty lines are dropped (so a \\r\\n pair ends just one
+        line, with the \\r), and trailing text with no terminator yet gets a
+        \\r, so the console overwrites it when the rest of the line comes in.
+        """
         if not raw_line:
             return
-        
-        for rline in raw_line.split("\r"):
-            if rline == "":
-                continue
-            
-            # Add back in carriage returns, ignoring lines terminated with a newline.
-            if not rline.endswith("\r") and not rline.endswith("\n"):
-                rline = rline + "\r"
-            
-            for line in rline.split("\n"):
-                if line == "":
-                    continue
-                
-                # Add back in newlines, ignoring lines terminated with a carriage return.
-                if not line.endswith("\n") and not line.endswith("\r"):
-                    line = line + "\n"
-                
-                self._process_output_line(line, output_type, proc_info)
+
+        end_in_newlines = self._get_profile(profile).end_in_newlines
+
+        lines = BaseCommandExecutor.LINE_RE.findall(raw_line)
+        if lines:
+            last = lines[-1]
+            if last[-1] != "\n" and last[-1] != "\r":
+                lines[-1] = last + "\r"
+
+            # Add the newlines for optional old-style setting.
+            if end_in_newlines:
+                lines = [line if line[-1] == "\n" else line + "\n" for line in lines]
+
+            if output_type == "stdout":
+                proc_info.stdout.extend(lines)
+            else:
+                proc_info.stderr.extend(lines)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    for line in lines:
+                        self.logger.debug(self._log_wrap("stderr", line.replace("\n", "")))
@@ -0,0 +1,43 @@
+class ExecutionProfile:
+    """
+    Snapshot of the output handling settings a command runs with. Resolved
+    once when the command starts, so the output line loops just read plain
+    attributes instead of going back to the config for every line. Changing
+    a setting mid command takes effect on the next command.
+
+    Args:
+        clear_output_on_reload (bool): Clear proc_info's old output before
+                                       running.
+        end_in_newlines (bool): Make sure every output line ends in a
+                                newline (or carriage return).
+        show_stderr (bool): Whether stderr is shown in the web console.
+                            Executors still capture stderr either way.
+        decode_errors (str): Codec error handler used when output isn't
+                             valid utf-8 (ie. replace, ignore, strict).
+    """
+
+    def __init__(self, clear_output_on_reload=False, end_in_newlines=False, show_stderr=True,
+                 decode_errors="replace"):
+        self.clear_output_on_reload = clear_output_on_reload
+        self.end_in_newlines = end_in_newlines
+        self.show_stderr = show_stderr
+        self.decode_errors = decode_errors
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Args:
+            config (ConfigManager): Config to snapshot settings from.
+
+        Returns:
+            ExecutionProfile: Profile with config's current settings.
+        """
+        return cls(
+            clear_output_on_reload=config.getboolean('settings', 'clear_output_on_reload', False),
+            end_in_newlines=config.getboolean('settings', 'end_in_newlines', False),
+            show_stderr=config.getboolean('settings', 'show_stderr', True),
+            decode_errors=config.get('settings', 'output_decode_errors', 'replace'),
+        )
+
+    def __repr__(self):
+        return f"ExecutionProfile(clear_output_on_reload={self.clear_output_on_reload}, end_in_newlines={self.end_in_newlines}, show_stderr={self.show_stderr}, decode_errors='{self.decode_errors}')"
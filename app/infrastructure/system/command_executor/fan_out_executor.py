@@ -0,0 +1,182 @@
+import uuid
+import logging
+import threading
+
+from contextlib import nullcontext
+
+from app.utils.helpers import log_wrap
+from app.infrastructure.system.config import ConfigManager
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
+
+from .command_executor import CommandExecutor
+from .job_runner import JobRunner
+
+
+class FanOutExecutor:
+    """
+    Singleton for running the same control across a bunch of game servers at
+    once. Commands are queued up on the JobRunner at low priority, with at
+    most bulk_action_per_host of them going against any one host at a time
+    (across all bulk jobs).
+
+    Each server's command output lands in that server's own proc_info, same
+    as running the control from its controls page. Progress for the job as a
+    whole is kept in one more proc_info under the job's id: a stdout line per
+    server as it starts & finishes, a stderr line per failure, process_lock
+    held until every server's done, and exit_status set to the number of
+    servers that failed.
+
+    Job ids carry the id of the user that submitted them, so ownership can
+    be checked from any worker, not just the one running the job.
+    """
+    lock = threading.Lock()
+
+    # Running commands by host, across all jobs.
+    host_running = dict()
+
+    # Unfinished jobs by id. Each holds its servers still waiting on a free
+    # host slot, as (server, cmd) pairs.
+    jobs = dict()
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(FanOutExecutor, cls).__new__(cls)
+        return cls.instance
+
+    def __init__(self, logger=logging.getLogger(__name__)):
+        self.logger = logger
+
+    def run(self, jobs, app_context=None, owner_id=None):
+        """
+        Kicks off commands for a bunch of servers and returns without waiting
+        on them.
+
+        Args:
+            jobs (list): List of (server, cmd) pairs, cmd being the full
+                         command list to run for that server.
+            app_context (AppContext): Optional Current app context, needed
+                                      for logging in worker threads.
+            owner_id (int): Optional Id of the user submitting the job.
+        Returns:
+            str: Job id, for fetching the job's progress proc_info.
+        """
+        if owner_id is None:
+            job_id = f"bulk-{uuid.uuid4()}"
+        else:
+            job_id = f"bulk-{owner_id}-{uuid.uuid4()}"
+
+        proc_info = get_proc_info_repository().get(job_id, create=True)
+        proc_info.process_lock = True
+        proc_info.exit_status = None
+
+        job = {
+            "id": job_id,
+            "proc_info": proc_info,
+            "total": len(jobs),
+            "done": 0,
+            "failed": 0,
+            "app_context": app_context,
+            "waiting": list(jobs),
+        }
+
+        with FanOutExecutor.lock:
+            FanOutExecutor.jobs[job_id] = job
+
+        self.logger.info(log_wrap("bulk job", (job_id, len(jobs))))
+
+        if not jobs:
+            self._finish(job)
+            return job_id
+
+        self._dispatch()
+        return job_id
+
+    def owner(self, job_id):
+        """
+        Gets the id of the user that submitted a job.
+
+        Args:
+            job_id (str): Job id, as returned by run().
+        Returns:
+            int: User id, else None if the job has no owner.
+        """
+        parts = job_id.split("-")
+        if len(parts) != 7 or parts[0] != "bulk" or not parts[1].isdigit():
+            return None
+        return int(parts[1])
+
+    def _dispatch(self):
+        """
+        Hands waiting servers to the JobRunner, oldest job first, skipping
+        ones whose host is already at its limit. Those get picked up as the
+        host's running commands finish.
+        """
+        per_host = ConfigManager().getint('settings', 'bulk_action_per_host', 2)
+
+        ready = []
+        with FanOutExecutor.lock:
+            for job in FanOutExecutor.jobs.values():
+                for server, cmd in list(job["waiting"]):
+                    host = server.install_host
+                    if per_host and FanOutExecutor.host_running.get(host, 0) >= per_host:
+                        continue
+
+                    FanOutExecutor.host_running[host] = FanOutExecutor.host_running.get(host, 0) + 1
+                    job["waiting"].remove((server, cmd))
+                    job["proc_info"].stdout.append(f"{server.install_name}: started\n")
+                    ready.append((job, server, cmd))
+
+        for job, server, cmd in ready:
+            JobRunner().submit(
+                self._run_one,
+                (job, server, cmd),
+                name=f"bulk:{cmd[-1]}",
+                server_id=server.id,
+                priority="low",
+            )
+
+    def _run_one(self, job, server, cmd):
+        """Runs cmd for a single server, in a JobRunner thread."""
+        exit_status = None
+        try:
+            # Fresh context per command, one context can't be pushed in many
+            # threads. Popped again after, since JobRunner threads get reused.
+            app_context = job["app_context"].app.app_context() if job["app_context"] else nullcontext()
+            with app_context:
+                proc_info = CommandExecutor().run(cmd, server, server.id)
+            exit_status = proc_info.exit_status
+
+        except Exception as e:
+            self.logger.error(log_wrap("bulk command failed", (server.id, e)))
+
+        finally:
+            with FanOutExecutor.lock:
+                host = server.install_host
+                FanOutExecutor.host_running[host] -= 1
+                if not FanOutExecutor.host_running[host]:
+                    del FanOutExecutor.host_running[host]
+
+                job["done"] += 1
+                progress = f"[{job['done']}/{job['total']}] {server.install_name}"
+                if exit_status == 0:
+                    job["proc_info"].stdout.append(f"{progress}: done\n")
+                else:
+                    job["failed"] += 1
+                    job["proc_info"].stdout.append(f"{progress}: failed\n")
+                    job["proc_info"].stderr.append(f"{server.install_name}: failed, exit status {exit_status}\n")
+
+                finished = job["done"] == job["total"]
+
+            if finished:
+                self._finish(job)
+
+            # Freed up host slot may let more servers go.
+            self._dispatch()
+
+    def _finish(self, job):
+        with FanOutExecutor.lock:
+            FanOutExecutor.jobs.pop(job["id"], None)
+
+        job["proc_info"].stdout.append(f"Finished: {job['total'] - job['failed']} succeeded, {job['failed']} failed\n")
+        job["proc_info"].exit_status = job["failed"]
+        job["proc_info"].process_lock = False
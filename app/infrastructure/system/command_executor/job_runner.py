@@ -0,0 +1,181 @@
+import time
+import uuid
+import heapq
+import logging
+import itertools
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utils.helpers import log_wrap
+from app.infrastructure.system.config import ConfigManager
+
+
+class JobRunner:
+    """
+    Singleton that runs every background job (controls, installs, send
+    command, etc.) on one bounded pool of job_runner_workers threads, instead
+    of each request spawning its own thread.
+
+    Jobs wait in a priority queue until a worker is free. Higher priority jobs
+    go first, and jobs of the same priority go in the order they were
+    submitted. At most job_runner_per_server jobs run against any one game
+    server at a time, the rest for that server stay queued (without holding
+    up jobs for other servers).
+
+    The pool has one more thread than job_runner_workers, kept for high
+    priority jobs only. So quick things like sent commands never get stuck
+    behind a pool full of long installs or updates. The pool is sized once,
+    when it's first needed, so changes to job_runner_workers take effect on
+    restart.
+    """
+    PRIORITIES = {"high": 0, "normal": 10, "low": 20}
+
+    pool = None
+    lock = threading.Lock()
+
+    # job_runner_workers, as of when the pool was created.
+    max_workers = None
+
+    # Heap of (priority, seq, job) tuples.
+    queue = []
+    seq = itertools.count()
+
+    # Running jobs by id.
+    running = dict()
+
+    # Number of running jobs by game server id.
+    server_running = dict()
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(JobRunner, cls).__new__(cls)
+        return cls.instance
+
+    def __init__(self, logger=logging.getLogger(__name__)):
+        self.logger = logger
+
+    def submit(self, func, args=(), name=None, server_id=None, priority="normal", app_context=None):
+        """
+        Queues up func to be run in the background.
+
+        Args:
+            func (callable): Function to run.
+            args (tuple): Args to call func with.
+            name (str): Optional name for job, shows up in list().
+            server_id (str): Optional id of game server job acts on, counts
+                             against that server's concurrent job limit.
+            priority (str): One of high, normal, or low.
+            app_context (AppContext): Optional Current app context. A fresh
+                                      one for its app is pushed around the
+                                      job, and popped again after, since
+                                      pool threads get reused.
+
+        Returns:
+            str: Job id.
+        """
+        job = {
+            "id": str(uuid.uuid4()),
+            "name": name or getattr(func, "__qualname__", "job"),
+            "server_id": server_id,
+            "priority": priority,
+            "status": "queued",
+            "submitted": time.time(),
+            "started": None,
+            "func": func,
+            "args": args,
+            "app": app_context.app if app_context else None,
+        }
+
+        with JobRunner.lock:
+            heapq.heappush(JobRunner.queue, (JobRunner.PRIORITIES[priority], next(JobRunner.seq), job))
+
+        self.logger.debug(log_wrap("queued job", (job["id"], job["name"], server_id)))
+
+        self._dispatch()
+        return job["id"]
+
+    def list(self):
+        """
+        Lists running jobs, followed by queued ones in the order they'll run.
+
+        Returns:
+            list: Dicts describing each job.
+        """
+        fields = ["id", "name", "server_id", "priority", "status", "submitted", "started"]
+        with JobRunner.lock:
+            jobs = list(JobRunner.running.values())
+            jobs += [job for _, _, job in sorted(JobRunner.queue, key=lambda entry: entry[:2])]
+            return [{field: job[field] for field in fields} for job in jobs]
+
+    def _get_pool(self):
+        if JobRunner.pool == None:
+            JobRunner.max_workers = ConfigManager().getint('settings', 'job_runner_workers', 4) or 1
+            JobRunner.pool = ThreadPoolExecutor(
+                max_workers=JobRunner.max_workers + 1,
+                thread_name_prefix="JobRunner",
+            )
+        return JobRunner.pool
+
+    def _dispatch(self):
+        """
+        Hands queued jobs to the pool while there are free workers, skipping
+        over jobs for servers already at their limit. Only high priority jobs
+        get the reserved worker.
+        """
+        per_server = ConfigManager().getint('settings', 'job_runner_per_server', 1)
+
+        with JobRunner.lock:
+            pool = self._get_pool()
+            max_workers = JobRunner.max_workers
+
+            skipped = []
+            while JobRunner.queue and len(JobRunner.running) < max_workers + 1:
+                entry = heapq.heappop(JobRunner.queue)
+                job = entry[2]
+
+                # Queue's in priority order, so nothing after this can go either.
+                if job["priority"] != "high" and len(JobRunner.running) >= max_workers:
+                    skipped.append(entry)
+                    break
+
+                server_id = job["server_id"]
+                if server_id and per_server and JobRunner.server_running.get(server_id, 0) >= per_server:
+                    skipped.append(entry)
+                    continue
+
+                if server_id:
+                    JobRunner.server_running[server_id] = JobRunner.server_running.get(server_id, 0) + 1
+
+                job["status"] = "running"
+                job["started"] = time.time()
+                JobRunner.running[job["id"]] = job
+                pool.submit(self._run, job)
+
+            for entry in skipped:
+                heapq.heappush(JobRunner.queue, entry)
+
+    def _run(self, job):
+        """Runs job, in a pool thread."""
+        try:
+            if job["app"]:
+                with job["app"].app_context():
+                    job["func"](*job["args"])
+            else:
+                job["func"](*job["args"])
+
+        except Exception as e:
+            self.logger.error(log_wrap("job failed", (job["id"], job["name"], e)))
+
+        finally:
+            with JobRunner.lock:
+                del JobRunner.running[job["id"]]
+
+                server_id = job["server_id"]
+                if server_id:
+                    JobRunner.server_running[server_id] -= 1
+                    if not JobRunner.server_running[server_id]:
+                        del JobRunner.server_running[server_id]
+
+            # Freed up worker (and maybe server slot) lets next job go.
+            self._dispatch()
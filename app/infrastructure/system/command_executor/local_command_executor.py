@@ -1,3 +1,4 @@
+import selectors
 import subprocess
 import uuid
 from .base_executor import BaseCommandExecutor
@@ -9,49 +10,82 @@ class LocalCommandExecutor(BaseCommandExecutor):
         super().__init__()
         self.config = config
     
-    def run(self, cmd, cmd_id=None, app_context=False, timeout=False):
+    def run(self, cmd, cmd_id=None, app_context=False, timeout=False, profile=None):
         """Execute command locally using subprocess.Popen."""
         if cmd_id is None:
             cmd_id = str(uuid.uuid4())
+
+        # Settings are resolved once up front, not per output line.
+        profile = self._get_profile(profile)
         
-        proc_info = self._setup_proc_info(cmd_id)
+        proc_info = self._setup_proc_info(cmd_id, profile=profile)
         
         # Set lock flag to true.
         proc_info.process_lock = True
         
         # App context needed for logging in threads.
-        if app_context:
-            app_context.push()
-        
-        self.logger.info(self._log_wrap("cmd", cmd))
+        with self._pushed(app_context):
+            self.logger.info(self._log_wrap("cmd", cmd))
         
-        # Subprocess call, Bytes mode, not buffered.
-        proc = subprocess.Popen(
-            cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-            text=False, bufsize=-1
-        )
+            # Subprocess call, Bytes mode, not buffered.
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
+                text=False, bufsize=-1
+            )
         
-        proc_info.pid = proc.pid
+            proc_info.pid = proc.pid
         
-        self.get_output(proc, proc_info, "stdout")
-        self.get_output(proc, proc_info, "stderr")
+            self._drain_output(proc, proc_info, profile)
         
-        proc_info.exit_status = proc.wait()
+            proc_info.exit_status = proc.wait()
         
-        # Reset process_lock flag.
-        proc_info.process_lock = False
+            # Reset process_lock flag.
+            proc_info.process_lock = False
         
-        return proc_info
+            return proc_info
     
-    def get_output(self, proc, proc_info, output_type):
-        """Read output from subprocess."""
-        while True:
-            if output_type == "stdout":
-                out_line = proc.stdout.read1().decode("utf-8")
-            else:
-                out_line = proc.stderr.read1().decode("utf-8")
-            
-            if not out_line:
-                break
-            
-            self._process_raw_output(out_line, proc_info, output_type)
+    def _drain_output(self, proc, proc_info, profile=None):
+        """
+        Read stdout and stderr concurrently as output arrives, until both are
+        closed. Reading one to EOF before the other would hide stderr until
+        the process exits, and deadlock if the process fills up the stderr
+        pipe while we're still waiting on stdout.
+        """
+        profile = self._get_profile(profile)
+        decoders = self._get_decoders(profile)
+        selector = selectors.DefaultSelector()
+        selector.register(proc.stdout, selectors.EVENT_READ, "stdout")
+        selector.register(proc.stderr, selectors.EVENT_READ, "stderr")
+
+        try:
+            while selector.get_map():
+                for key, _ in selector.select():
+                    if not self.get_output(proc, proc_info, key.data, profile, decoders[key.data]):
+                        selector.unregister(key.fileobj)
+        finally:
+            selector.close()
+
+    def get_output(self, proc, proc_info, output_type, profile=None, decoder=None):
+        """
+        Read whatever output is ready from one of the subprocess's streams.
+
+        Args:
+            decoder (IncrementalDecoder): Optional decoder for the stream,
+                                          carries partial characters over
+                                          between reads.
+        Returns:
+            bool: False once stream has hit EOF, True otherwise.
+        """
+        if decoder is None:
+            decoder = self._get_decoders(profile)[output_type]
+
+        if output_type == "stdout":
+            chunk = proc.stdout.read1()
+        else:
+            chunk = proc.stderr.read1()
+
+        # EOF, flush out any dangling partial character.
+        out_line = decoder.decode(chunk, final=not chunk)
+        self._process_raw_output(out_line, proc_info, output_type, profile)
+
+        return bool(chunk)
@@ -1,32 +1,78 @@
 import paramiko
+import select
+import logging
 import shlex
-import time
 import os
 
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from collections import deque
+
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
 from app.infrastructure.system.ssh.client import SSHClientInterface
 
 from .base_executor import BaseCommandExecutor
 
+class RecentLines:
+    """
+    Hashed set of recently seen lines, used to drop duplicate stderr lines
+    without scanning all of proc_info.stderr for each new one. With a window,
+    only the last window lines are remembered.
+    """
+
+    def __init__(self, lines=(), window=0):
+        """
+        Args:
+            lines (list): Optional lines already seen.
+            window (int): Optional number of most recent lines to remember.
+                          Zero means remember every line.
+        """
+        self.window = window
+        self.counts = dict()
+        self.order = deque()
+        for line in lines:
+            self.add(line)
+
+    def __contains__(self, line):
+        return line in self.counts
+
+    def add(self, line):
+        self.counts[line] = self.counts.get(line, 0) + 1
+        if not self.window:
+            return
+
+        self.order.append(line)
+        if len(self.order) > self.window:
+            old = self.order.popleft()
+            self.counts[old] -= 1
+            if not self.counts[old]:
+                del self.counts[old]
+
+
 class SshCommandExecutor(BaseCommandExecutor):
     """SSH command execution using paramiko."""
+
+    # Max seconds to block waiting on channel before rechecking exit status.
+    # Only a safety net, channel wakes select itself on output and on close.
+    SELECT_TIMEOUT = 1.0
     
     def __init__(self, config, client_interface=SSHClientInterface()):
         super().__init__()
         self.config = config
         self.client_interface = client_interface
     
-    def run(self, cmd, cmd_id=None, app_context=False, timeout=5.0, server=None):
+    def run(self, cmd, cmd_id=None, app_context=False, timeout=5.0, server=None, profile=None):
         """Execute command via SSH."""
         if server is None:
             raise ValueError("server parameter is required for SSH execution")
         
         if cmd_id is None:
             cmd_id = server.id
+
+        # Settings are resolved once up front, not per output line.
+        profile = self._get_profile(profile)
         
-        proc_info = InMemProcInfoRepository().get(cmd_id, create=True)
+        proc_info = get_proc_info_repository().get(cmd_id, create=True)
 
-        if self.config.getboolean('settings', 'clear_output_on_reload'):
+        if profile.clear_output_on_reload:
             proc_info.stdout.clear()
             proc_info.stderr.clear()
         
@@ -34,115 +80,166 @@ class SshCommandExecutor(BaseCommandExecutor):
         username = server.username
 
         # App context needed for logging in threads.
-        if app_context:
-            app_context.push()
-
-        safe_cmd = shlex.join(cmd)
+        with self._pushed(app_context):
+            safe_cmd = shlex.join(cmd)
         
-        # Log info.
-        self.logger.debug(self._log_wrap("proc_info pre ssh cmd:", str(proc_info)))
-        self.logger.info(cmd)
-        self.logger.info(safe_cmd)
-        self.logger.info(hostname)
-        self.logger.info(username)
-
-        try:
-            client = self.client_interface.get_client(username, hostname)
-
-            proc_info.process_lock = True
-            # Open a new session and request a PTY.
-            channel = client.get_transport().open_session()
-            channel.set_combine_stderr(False)
-            channel.exec_command(safe_cmd)
-
-            # Optionally set timeout (if provided).
-            if timeout:
-                channel.settimeout(timeout)
-
-            self._read_ssh_output(channel, proc_info)
-
-            # Wait for the command to finish and get the exit status.
-            proc_info.exit_status = channel.recv_exit_status()
-            proc_info.process_lock = False
-            return True
-
-        except paramiko.SSHException as e:
-            self.logger.debug(str(e))
-            proc_info.stderr.append(str(e))
-            proc_info.exit_status = 5
-            proc_info.process_lock = False
-            return False
-
-        except TimeoutError as e:
-            self.logger.debug(str(e))
-            proc_info.stderr.append(str(e))
-            proc_info.exit_status = 7
-            proc_info.process_lock = False
-            return False
+            # Log info.
+            self.logger.debug(self._log_wrap("proc_info pre ssh cmd:", str(proc_info)))
+            self.logger.info(cmd)
+            self.logger.info(safe_cmd)
+            self.logger.info(hostname)
+            self.logger.info(username)
+
+            try:
+                with self.client_interface.session(username, hostname) as client:
+                    proc_info.process_lock = True
+                    # Open a new session and request a PTY.
+                    channel = client.get_transport().open_session()
+                    channel.set_combine_stderr(False)
+                    channel.exec_command(safe_cmd)
+
+                    # Optionally set timeout (if provided).
+                    if timeout:
+                        channel.settimeout(timeout)
+
+                    self._read_ssh_output(channel, proc_info, profile)
+
+                    # Wait for the command to finish and get the exit status.
+                    proc_info.exit_status = channel.recv_exit_status()
+                    proc_info.process_lock = False
+                    return True
+
+            except paramiko.SSHException as e:
+                self.logger.debug(str(e))
+                proc_info.stderr.append(str(e))
+                proc_info.exit_status = 5
+                proc_info.process_lock = False
+                return False
+
+            except TimeoutError as e:
+                self.logger.debug(str(e))
+                proc_info.stderr.append(str(e))
+                proc_info.exit_status = 7
+                proc_info.process_lock = False
+                return False
     
-    def get_output(self, proc, proc_info, output_type):
+    def get_output(self, proc, proc_info, output_type, profile=None):
         """
         SSH implementation doesn't use this method directly because 
         output reading happens differently with paramiko channels.
         """
         raise NotImplementedError("SSH executor uses _read_ssh_output instead")
     
-    def _read_ssh_output(self, channel, proc_info):
-        """Read output from SSH channel."""
-        
+    def _read_ssh_output(self, channel, proc_info, profile=None):
+        """
+        Read output from SSH channel. Blocks in select on the channel's fileno,
+        which paramiko marks readable whenever stdout or stderr data comes in
+        or the channel closes, so output is picked up as soon as it arrives.
+
+        After EOF the fileno stays readable for good, but the exit status can
+        still be on its way. Select would return instantly and spin, so from
+        there it waits on the channel's status event instead.
+        """
+        profile = self._get_profile(profile)
+        decoders = self._get_decoders(profile)
+        seen = self._stderr_dedup(proc_info)
+
         while True:
-            # Read stdout if data is available.
-            if channel.recv_ready():
-                stdout_chunk = channel.recv(8192).decode("utf-8")
-                self._process_ssh_chunk(stdout_chunk, proc_info, "stdout")
+            if channel.eof_received:
+                channel.status_event.wait(SshCommandExecutor.SELECT_TIMEOUT)
+            else:
+                select.select([channel], [], [], SshCommandExecutor.SELECT_TIMEOUT)
 
-            if channel.recv_stderr_ready():
-                stderr_chunk = channel.recv_stderr(8192).decode("utf-8")
-                self._process_ssh_chunk(stderr_chunk, proc_info, "stderr")
+            self._drain_channel(channel, proc_info, seen, profile, decoders)
 
             # Break the loop if the command has finished.
             if channel.exit_status_ready():
                 # Ensure any remaining stderr and stdout are captured.
-                while channel.recv_stderr_ready():
-                    stderr_chunk = channel.recv_stderr(8192).decode("utf-8")
-                    self._process_ssh_chunk(stderr_chunk, proc_info, "stderr")
+                self._drain_channel(channel, proc_info, seen, profile, decoders)
+                break
 
-                while channel.recv_ready():
-                    stdout_chunk = channel.recv(8192).decode("utf-8")
-                    self._process_ssh_chunk(stdout_chunk, proc_info, "stdout")
+        # Flush out any dangling partial characters.
+        for output_type, decoder in decoders.items():
+            self._process_ssh_chunk(decoder.decode(b"", final=True), proc_info, output_type, seen, profile)
 
-                break
+    def _drain_channel(self, channel, proc_info, seen=False, profile=None, decoders=None):
+        """Read whatever stdout and stderr is currently buffered on channel."""
+        if decoders is None:
+            decoders = self._get_decoders(profile)
+
+        while channel.recv_stderr_ready():
+            stderr_chunk = decoders["stderr"].decode(channel.recv_stderr(8192))
+            self._process_ssh_chunk(stderr_chunk, proc_info, "stderr", seen, profile)
+
+        while channel.recv_ready():
+            stdout_chunk = decoders["stdout"].decode(channel.recv(8192))
+            self._process_ssh_chunk(stdout_chunk, proc_info, "stdout", seen, profile)
+
+    def _stderr_dedup(self, proc_info):
+        """
+        Build stderr duplicate filter per the ssh_stderr_dedup setting. Either
+        'all' (drop lines already anywhere in stderr), 'window' (only the last
+        ssh_stderr_dedup_window lines), or 'off'.
+
+        Returns:
+            RecentLines: Lines seen so far, or None if dedup is off.
+        """
+        strategy = self.config.get('settings', 'ssh_stderr_dedup', 'all')
+        if strategy == 'off':
+            return None
+
+        window = 0
+        if strategy == 'window':
+            window = self.config.getint('settings', 'ssh_stderr_dedup_window', 1000)
 
-            # Keep CPU from burning.
-            time.sleep(0.1)
+        return RecentLines(proc_info.stderr[-window:] if window else proc_info.stderr, window)
     
-    def _process_ssh_chunk(self, chunk, proc_info, output_type):
-        """Process a chunk of SSH output."""
+    def _process_ssh_chunk(self, chunk, proc_info, output_type, seen=False, profile=None):
+        """
+        Process a chunk of SSH output.
+
+        Args:
+            chunk (str): Decoded output.
+            proc_info (ProcInfo): Process output gets appended to.
+            output_type (str): Either stdout or stderr.
+            seen (RecentLines): Optional stderr lines seen so far, None turns
+                                off stderr dedup. Built from settings if left
+                                out.
+            profile (ExecutionProfile): Optional settings snapshot for the
+                                        command, taken from config if left out.
+        """
         if not chunk:
             return
+
+        if seen is False:
+            seen = self._stderr_dedup(proc_info)
+
+        end_in_newlines = self._get_profile(profile).end_in_newlines
+        output = proc_info.stdout if output_type == "stdout" else proc_info.stderr
         
+        new_lines = []
         lines = chunk.splitlines(keepends=True)
         for line in lines:
             if line == "\r\n":
                 continue
             
             # Skip duplicates
-#            if output_type == "stdout" and line in proc_info.stdout:
-#                continue
-            if output_type == "stderr" and line in proc_info.stderr:
-                continue
+            if output_type == "stderr" and seen is not None:
+                if line in seen:
+                    continue
+                seen.add(line)
             
             # Add newlines if configured
-            if self.config.getboolean('settings', 'end_in_newlines'):
+            if end_in_newlines:
                 if not (line.endswith("\n") or line.endswith("\r")):
                     line += "\n"
             
-            # Add to appropriate output list
-            if output_type == "stdout":
-                proc_info.stdout.append(line)
-            else:
-                proc_info.stderr.append(line)
-            
-            # Log
-            log_msg = self._log_wrap(output_type, line.strip())
-            self.logger.debug(log_msg)
+            new_lines.append(line)
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for line in new_lines:
+                self.logger.debug(self._log_wrap(output_type, line.strip()))
+
+        # Add to appropriate output list, all at once so stores that write
+        # through do one write per chunk.
+        output.extend(new_lines)
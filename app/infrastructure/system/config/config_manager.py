@@ -1,4 +1,5 @@
 import os
+import threading
 import configparser
 from .defaults import DEFAULTS
 
@@ -8,10 +9,22 @@ class ConfigManager:
 
     Custom class for dynamic config info to provide similar interface as
     builtin flask app.config.
+
+    Changes to the file are still picked up in real-time, but the file is only
+    re-parsed when it's actually changed (ie. its inode, mtime, or size
+    differ from the last read), not on every access.
+
+    The parsed config is shared by every instance using the same config file,
+    so constructing a new ConfigManager is cheap and invalidating or writing
+    through one instance is seen by all of them.
     """
     # Class level defaults.
     _DEFAULTS = DEFAULTS
 
+    # Parsed config state, keyed by config file path.
+    _shared = dict()
+    _shared_lock = threading.Lock()
+
     def __init__(self):
         self.config_file = "main.conf"
         self.config_local = "main.conf.local"
@@ -20,16 +33,68 @@ class ConfigManager:
         if os.path.isfile(self.config_local) and os.access(self.config_local, os.R_OK):
             self.config_file = self.config_local
 
-        self._config = configparser.ConfigParser()
         self._batch_mode = False
         self._pending_writes = False
-        self.reload()
+        self._refresh()
+
+    def _state(self):
+        state = ConfigManager._shared.get(self.config_file)
+        if state is not None:
+            return state
+
+        with ConfigManager._shared_lock:
+            if self.config_file not in ConfigManager._shared:
+                ConfigManager._shared[self.config_file] = {
+                    "config": configparser.ConfigParser(),
+                    "stamp": None,
+                    "lock": threading.Lock(),
+                }
+            return ConfigManager._shared[self.config_file]
+
+    @property
+    def _config(self):
+        return self._state()["config"]
+
+    @property
+    def _stamp(self):
+        return self._state()["stamp"]
+
+    @_stamp.setter
+    def _stamp(self, stamp):
+        self._state()["stamp"] = stamp
+
+    @property
+    def _lock(self):
+        return self._state()["lock"]
 
     def reload(self):
-        self._config.read(self.config_file)
+        """Re-read config file, whether it's changed or not."""
+        with self._lock:
+            self._stamp = self._file_stamp()
+            self._config.read(self.config_file)
+
+    def invalidate(self):
+        """Force config file to be re-read on next access."""
+        self._stamp = None
+
+    def _file_stamp(self):
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+
+        return (self.config_file, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self):
+        """Re-read config file, only if it's changed since last read."""
+        stamp = self._file_stamp()
+        if stamp != None and stamp == self._stamp:
+            return
+
+        self.reload()
 
     def get(self, section, option, fallback=None):
-        self.reload()  # Real-time reloading on every access
+        self._refresh()  # Real-time reloading when file changes
 
         if fallback is None:
             fallback = self._get_default(section, option)
@@ -44,15 +109,15 @@ class ConfigManager:
             return None
 
     def getboolean(self, section, option, fallback=None):
-        self.reload()
+        self._refresh()
         return self._config[section].getboolean(option, fallback)
 
     def getint(self, section, option, fallback=None):
-        self.reload()
+        self._refresh()
         return self._config[section].getint(option, fallback)
 
     def __getitem__(self, section):
-        self.reload()
+        self._refresh()
         return self._config[section]
 
     def set(self, section, option, value, immediate=True):
@@ -84,5 +149,9 @@ class ConfigManager:
                 self.config._pending_writes = False
 
     def _write_config(self):
-        with open(self.config_file, 'w') as configfile:
-            self._config.write(configfile)
+        with self._lock:
+            with open(self.config_file, 'w') as configfile:
+                self._config.write(configfile)
+
+            # In memory config already matches what was just written.
+            self._stamp = self._file_stamp()
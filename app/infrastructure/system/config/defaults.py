@@ -18,7 +18,35 @@ DEFAULTS = {
         'send_cmd': False,
         'install_create_new_user': True,
         'end_in_newlines': True,
-        'allow_custom_jobs': False
+        'allow_custom_jobs': False,
+        'output_max_lines': 20000,
+        'output_max_bytes': 4194304,
+        'output_spill_to_disk': False,
+        'proc_info_ttl': 3600,
+        'proc_info_max_entries': 256,
+        'proc_info_store': 'memory',
+        'ssh_stderr_dedup': 'all',
+        'ssh_stderr_dedup_window': 1000,
+        'ssh_keepalive': 30,
+        'ssh_max_idle': 600,
+        'ssh_max_sessions_per_host': 8,
+        'status_check_workers': 8,
+        'status_poll_interval': 30,
+        'status_poll_jitter': 5,
+        'status_poll_max_backoff': 600,
+        'status_stream': False,
+        'bulk_action_per_host': 2,
+        'job_runner_workers': 4,
+        'job_runner_per_server': 1,
+        'output_decode_errors': 'replace',
+        'user_cache_ttl': 30,
+        'console_max_streams': 6,
+        'sqlite_journal_mode': 'wal',
+        'sqlite_synchronous': 'normal',
+        'sqlite_busy_timeout': 5000,
+        'sqlite_mmap_size': 67108864,
+        'sqlite_cache_size': -8000,
+        'sqlite_foreign_keys': False
     },
     'debug': {
         'debug': False,
@@ -9,7 +9,7 @@ from app import db
 
 from app.infrastructure.persistence.repositories.game_server_repo import SqlAlchemyGameServerRepository
 from app.infrastructure.persistence.repositories.cron_repo import SqlAlchemyCronRepository
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
 
 from app.domain.entities.job import Job
 from app.infrastructure.system.command_executor.command_executor import CommandExecutor
@@ -76,13 +76,13 @@ class CronScheduler:
         server = self.game_server_repo.get(server_id)
 
         cmd_id = 'list_jobs'
-        InMemProcInfoRepository().remove(cmd_id)  # Clear any old proc_info objects
+        get_proc_info_repository().remove(cmd_id)  # Clear any old proc_info objects
 
         cmd = [PATHS['crontab'], '-l']
 
         self.command_service.run(cmd, server, cmd_id)
 
-        proc_info = InMemProcInfoRepository().get(cmd_id)
+        proc_info = get_proc_info_repository().get(cmd_id)
 
         return self.parse_cron_jobs("".join(proc_info.stdout), server.id)
 
@@ -13,3 +13,7 @@ class FileInterface:
     def write_file(self, file_path, content):
         """Write content to file - to be implemented by subclasses"""
         raise NotImplementedError
+
+    def read_many(self, file_paths):
+        """Read several files, returns dict of contents (or None) by path"""
+        return {file_path: self.read(file_path) for file_path in file_paths}
@@ -57,3 +57,16 @@ class FileManager:
         """
         self.server = server
         return self.interface.write(file_path, content)
+
+    def read_many(self, server, file_paths):
+        """
+        Read several files from the server, in one go where possible.
+
+        Args:
+            file_paths (list): Paths to the files
+
+        Returns:
+            dict: File contents by path, None for ones that failed
+        """
+        self.server = server
+        return self.interface.read_many(file_paths)
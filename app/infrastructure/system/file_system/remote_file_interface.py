@@ -6,7 +6,10 @@ from app.utils.helpers import log_wrap
 from .file_interface import FileInterface
 
 class SSHFileInterface(FileInterface):
-    """Interface for SSH/SFTP file operations"""
+    """
+    Interface for SSH/SFTP file operations. Reuses the pooled connection's
+    sftp session rather than opening a new one per file.
+    """
 
     def __init__(self, server, client_interface=SSHClientInterface()):
         super().__init__(server)
@@ -18,9 +21,7 @@ class SSHFileInterface(FileInterface):
         username = self.server.username
         
         try:
-            client = self.client_interface.get_client(username, hostname)
-            
-            with client.open_sftp() as sftp:
+            with self.client_interface.sftp(username, hostname) as sftp:
                 with sftp.open(file_path, "r") as file:
                     content = file.read()
             
@@ -35,9 +36,7 @@ class SSHFileInterface(FileInterface):
         username = self.server.username
         
         try:
-            client = self.client_interface.get_client(username, hostname)
-            
-            with client.open_sftp() as sftp:
+            with self.client_interface.sftp(username, hostname) as sftp:
                 with sftp.open(file_path, "w") as file:
                     file.write(content.replace("\r", ""))
             
@@ -45,3 +44,31 @@ class SSHFileInterface(FileInterface):
         except Exception as e:
             self.logger.debug(e)
             return False
+
+    def read_many(self, file_paths):
+        """
+        Read several files over a single sftp session.
+
+        Args:
+            file_paths (list): Paths of files to read.
+
+        Returns:
+            dict: File contents by path, None for ones that couldn't be read.
+        """
+        self.logger.info(log_wrap("file_paths", file_paths))
+        hostname = self.server.install_host
+        username = self.server.username
+
+        contents = dict.fromkeys(file_paths)
+        try:
+            with self.client_interface.sftp(username, hostname) as sftp:
+                for file_path in file_paths:
+                    try:
+                        with sftp.open(file_path, "r") as file:
+                            contents[file_path] = file.read().decode()
+                    except IOError as e:
+                        self.logger.debug(e)
+        except Exception as e:
+            self.logger.debug(e)
+
+        return contents
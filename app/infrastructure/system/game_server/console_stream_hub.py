@@ -0,0 +1,387 @@
+import time
+import logging
+import threading
+
+from collections import deque
+
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
+from app.infrastructure.system.command_executor.command_executor import CommandExecutor
+from app.infrastructure.system.config import ConfigManager
+
+from app.utils.paths import PATHS
+from app.utils.helpers import docker_cmd_build, log_wrap
+
+from .sse_subscription import SseSubscription
+from .tmux_socket_name_cache import TmuxSocketNameCache
+
+
+class ConsoleSubscription(SseSubscription):
+    """
+    A single viewer's handle on a game server's console stream, fed by the
+    server's ConsoleStreamReader. Dropped viewers catch up from the backlog.
+    """
+
+    def __init__(self, hub, reader):
+        super().__init__(hub)
+        self.hub = hub
+        self.reader = reader
+
+
+class ConsoleStreamReader(threading.Thread):
+    """
+    Background thread that polls the tmux pane for one game server and
+    publishes only the lines that are new since its last capture.
+    """
+    # Number of trailing lines used to line up a new capture with the last one.
+    ANCHOR_LINES = 3
+
+    def __init__(self, hub, server, cmd, logger=logging.getLogger(__name__)):
+        super().__init__(daemon=True, name=f"console_stream_{server.id}")
+        self.hub = hub
+        self.server = server
+        self.cmd = cmd
+        self.cmd_id = f"console_stream:{server.id}"
+        self.logger = logger
+
+        self.subscribers = set()
+        self.stopped = threading.Event()
+
+        # Holds (seq, line) tuples, seq being monotonically increasing per line.
+        # Picks up where the server's last reader left off, if there was one.
+        self.lines = deque(maxlen=hub.BACKLOG_LINES)
+        self.seq = 0
+        self.error = None
+
+        # Pane's tmux history_size as of the last capture, None if unknown.
+        self.history_size = None
+
+        retained = hub.history.pop(server.id, None)
+        if retained:
+            self.seq, lines, self.history_size = retained
+            self.lines.extend(lines)
+
+    def backlog(self, last_seq=None):
+        """
+        Get event for lines a new subscriber hasn't seen yet. Viewers that
+        aren't resuming, or whose seq can't be lined up with the backlog,
+        get a reset event telling them to clear what they have first.
+
+        Args:
+            last_seq (int): Optional seq of the last line the viewer has.
+
+        Returns:
+            dict: Event dict or None if nothing to send.
+        """
+        if self.error:
+            return {"Error": self.error}
+
+        oldest = self.lines[0][0] if self.lines else self.seq + 1
+        if last_seq is None or last_seq > self.seq or last_seq < oldest - 1:
+            return {"seq": self.seq, "lines": [line for _, line in self.lines], "reset": True}
+
+        return self._event([(seq, line) for seq, line in self.lines if seq > last_seq])
+
+    def run(self):
+        full = True
+        idle_since = None
+        while not self.stopped.is_set():
+            if self._poll(full):
+                full = False
+
+            self.stopped.wait(self.hub.POLL_INTERVAL)
+
+            # Hang on a bit after the last viewer leaves, they're most likely
+            # just reconnecting.
+            with self.hub.lock:
+                if self.subscribers:
+                    idle_since = None
+                elif idle_since is None:
+                    idle_since = time.monotonic()
+                elif time.monotonic() - idle_since >= self.hub.READER_GRACE:
+                    self._retire()
+
+    def _retire(self):
+        """
+        Stops reader, leaving its seq & backlog with the hub for the server's
+        next reader. Call under hub lock.
+        """
+        self.stopped.set()
+        self.hub.history[self.server.id] = (self.seq, list(self.lines), self.history_size)
+        if self.hub.readers.get(self.server.id) is self:
+            del self.hub.readers[self.server.id]
+
+    def _poll(self, full):
+        """
+        Run a capture-pane and publish anything new to subscribers.
+
+        Args:
+            full (bool): Capture the whole scrollback instead of just the tail.
+
+        Returns:
+            bool: True if capture succeeded, False otherwise.
+        """
+        start = "-" if full else f"-{self.hub.TAIL_LINES}"
+        cmd = self.cmd + ["-S", start, "-E", "-", "-J"]
+
+        # Tack the pane's history size onto the end of the output, so there's
+        # some idea of how far it scrolled when the capture alone can't tell.
+        cmd += [";", "display-message", "-p", "-t", self.server.script_name, "#{history_size}"]
+
+        proc_info_repo = get_proc_info_repository()
+        proc_info_repo.remove(self.cmd_id)
+        CommandExecutor().run(cmd, self.server, self.cmd_id)
+
+        proc_info = proc_info_repo.get(self.cmd_id)
+        proc_info_repo.remove(self.cmd_id)
+
+        if proc_info == None or proc_info.exit_status == None or proc_info.exit_status > 0:
+            self.logger.debug(log_wrap("proc_info", proc_info))
+            if not self.error:
+                self.error = "Refresh cmd failed!"
+                self._publish({"Error": self.error})
+            return False
+
+        self.error = None
+
+        captured = list(proc_info.stdout)
+        history_size = captured.pop().strip() if captured else ""
+        history_size = int(history_size) if history_size.isdigit() else None
+
+        # Empty rows under the cursor aren't output, and would throw off
+        # lining captures up.
+        while captured and not captured[-1].strip():
+            captured.pop()
+
+        # History gets trimmed once it's full, after which this is no help.
+        scrolled = None
+        if history_size is not None and self.history_size is not None \
+                and history_size >= self.history_size:
+            scrolled = history_size - self.history_size
+        self.history_size = history_size
+
+        new_lines = []
+        for line in self._new_lines(captured, scrolled):
+            self.seq += 1
+            self.lines.append((self.seq, line))
+            new_lines.append((self.seq, line))
+
+        event = self._event(new_lines)
+        if event:
+            self._publish(event)
+
+        return True
+
+    def _new_lines(self, captured, scrolled=None):
+        """
+        Works out which lines of a capture come after the ones already seen.
+        Tries to match the last few seen lines, then the same minus the very
+        last one since the bottom line of a pane (ie. a prompt) can change.
+        If neither lines up the pane was likely cleared, so send it all.
+
+        Args:
+            captured (list): Lines of the new capture.
+            scrolled (int): Optional number of lines the pane scrolled since
+                            the last capture, for when the seen lines fit in
+                            more than one place.
+        """
+        if not self.lines:
+            return captured
+
+        seen = [line for _, line in self.lines]
+
+        for anchor in (seen, seen[:-1]):
+            ends = self._anchor_ends(captured, anchor)
+            if not ends:
+                continue
+
+            # Pane's just the same line over and over, go by how far it
+            # scrolled if known. Otherwise assume nothing's new, rather than
+            # send lines twice.
+            if len(ends) > 1 and scrolled is not None:
+                return captured[min(ends, key=lambda end: abs(len(captured) - end - scrolled)):]
+
+            return captured[ends[-1]:]
+
+        return captured
+
+    def _anchor_ends(self, captured, anchor):
+        """
+        Finds where the tail of anchor could end in captured. Starts with the
+        last ANCHOR_LINES lines, and if those show up more than once (ie.
+        repeated "Saving..." lines) keeps adding lines from further back until
+        only one spot fits. Spots near the top of the capture fit so long as
+        whatever of the anchor made it into the capture matches.
+
+        Returns:
+            list: Indexes in captured just past each spot the anchor fits.
+        """
+        size = min(self.ANCHOR_LINES, len(anchor))
+        if size == 0:
+            return []
+
+        tail = anchor[-size:]
+        ends = [end for end in range(size, len(captured) + 1) if captured[end - size:end] == tail]
+
+        while len(ends) > 1 and size < len(anchor) and size < len(captured):
+            size += 1
+            ends = [end for end in ends if end < size or captured[end - size] == anchor[-size]]
+
+        return ends
+
+    def _event(self, lines):
+        if not lines:
+            return None
+
+        return {"seq": lines[-1][0], "lines": [line for _, line in lines]}
+
+    def _publish(self, event):
+        with self.hub.lock:
+            subscribers = list(self.subscribers)
+
+        for subscription in subscribers:
+            subscription.put(event)
+
+
+class ConsoleStreamHub:
+    """
+    This singleton owns a single tmux reader per game server, shared by
+    everyone viewing that server's console. Readers start with the first
+    viewer and exit on their own once the last one has been gone for
+    READER_GRACE seconds.
+
+    Every open stream holds a gunicorn thread, so no more than
+    console_max_streams are handed out at once (per worker).
+    """
+    # Seconds between capture-pane runs per game server.
+    POLL_INTERVAL = 2
+
+    # Lines of scrollback pulled on each capture after the first full one.
+    TAIL_LINES = 200
+
+    # Lines kept per game server for viewers that join or reconnect.
+    BACKLOG_LINES = 2000
+
+    # Seconds between keepalives on an idle stream.
+    KEEPALIVE = 15
+
+    # Seconds before a stream is closed and the client has to reconnect.
+    STREAM_MAX_AGE = 300
+
+    # Seconds a reader keeps going with no viewers. Longer than the stream's
+    # retry delay, so reconnecting viewers land back on the same reader.
+    READER_GRACE = 10
+
+    # Holds ConsoleStreamReader objects.
+    readers = dict()
+
+    # Last (seq, lines) of stopped readers by game server id. The server's
+    # next reader carries on from them, so seqs keep going up and its first
+    # capture lines up with what viewers already have.
+    history = dict()
+    lock = threading.Lock()
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(ConsoleStreamHub, cls).__new__(cls)
+        return cls.instance
+
+    def _build_capture_cmd(self, server):
+        """
+        Builds the capture-pane cmd for server, minus the line range args.
+
+        Returns:
+            list: Command list or None if tmux socket name can't be found.
+        """
+        tmux_socket = TmuxSocketNameCache().get_tmux_socket_name(server)
+        if tmux_socket == None:
+            return None
+
+        cmd = [
+            PATHS["tmux"],
+            "-L",
+            tmux_socket,
+            "capture-pane",
+            "-pt",
+            server.script_name,
+        ]
+
+        if server.install_type == "docker":
+            cmd = docker_cmd_build(server) + cmd
+
+        return cmd
+
+    def _streams_open(self):
+        """Number of open subscriptions across all readers, call under lock."""
+        return sum(len(reader.subscribers) for reader in ConsoleStreamHub.readers.values())
+
+    def full(self):
+        """
+        Check if console_max_streams subscriptions are already open.
+
+        Returns:
+            bool: True if no more streams can be opened right now.
+        """
+        max_streams = ConfigManager().getint('settings', 'console_max_streams', 6)
+        if not max_streams:
+            return False
+
+        with ConsoleStreamHub.lock:
+            return self._streams_open() >= max_streams
+
+    def subscribe(self, server, last_seq=None):
+        """
+        Subscribe to console output for game server, starting a reader for it
+        if there isn't already one running.
+
+        Args:
+            server (GameServer): Game server to stream console of.
+            last_seq (int): Optional seq of the last line the viewer already
+                            has, for resuming a dropped stream.
+
+        Returns:
+            ConsoleSubscription: Subscription object, None if the game
+                                 server's tmux socket can't be found or
+                                 console_max_streams are already open.
+        """
+        max_streams = ConfigManager().getint('settings', 'console_max_streams', 6)
+
+        cmd = None
+        reader = ConsoleStreamHub.readers.get(server.id)
+        if reader is None or reader.stopped.is_set():
+            cmd = self._build_capture_cmd(server)
+            if cmd == None:
+                return None
+
+        with ConsoleStreamHub.lock:
+            if max_streams and self._streams_open() >= max_streams:
+                return None
+
+            reader = ConsoleStreamHub.readers.get(server.id)
+            if reader is None or reader.stopped.is_set():
+                if cmd == None:
+                    cmd = self._build_capture_cmd(server)
+                    if cmd == None:
+                        return None
+
+                reader = ConsoleStreamReader(self, server, cmd)
+                ConsoleStreamHub.readers[server.id] = reader
+
+            subscription = ConsoleSubscription(self, reader)
+            reader.subscribers.add(subscription)
+
+            backlog = reader.backlog(last_seq)
+            if backlog:
+                subscription.put(backlog)
+
+            if not reader.is_alive():
+                reader.start()
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Removes subscription from its reader. Reader shuts itself down once
+        it's gone READER_GRACE seconds with no subscribers.
+        """
+        with ConsoleStreamHub.lock:
+            subscription.reader.subscribers.discard(subscription)
@@ -1,10 +1,15 @@
 import os
 import re
+import shlex
 import shutil
 import getpass
 import logging
 
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from app.infrastructure.system.config import ConfigManager
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
 from app.infrastructure.system.command_executor.command_executor import CommandExecutor
 
 from app.utils.paths import PATHS
@@ -26,6 +31,9 @@ class GameServerManager:
     ]
     USER = getpass.getuser()
 
+    # Prefixes per socket results in batch status check output.
+    STATUS_MARKER = "web-lgsm-status:"
+
     def __init__(self, logger=logging.getLogger(__name__)):
         self.logger = logger
 
@@ -91,7 +99,7 @@ class GameServerManager:
             cmd = [PATHS["rm"], "-rf", server.install_path]
 
             success = CommandExecutor().run(cmd, server, server.id)
-            proc_info = InMemProcInfoRepository().get(server.id)
+            proc_info = get_proc_info_repository().get(server.id)
 
             # If the ssh connection itself fails return False.
             if not success or proc_info == None:
@@ -130,7 +138,7 @@ class GameServerManager:
     
         CommandExecutor().run(cmd, server, cmd_id)
     
-        proc_info = InMemProcInfoRepository().get(cmd_id)
+        proc_info = get_proc_info_repository().get(cmd_id)
         self.logger.info(log_wrap("proc_info", proc_info))
     
         if proc_info == None:
@@ -141,3 +149,116 @@ class GameServerManager:
     
         return True
 
+    def get_power_states(self, servers, app_context=None):
+        """
+        Get's the power states for a bunch of game servers at once. Servers are
+        grouped by install type, host, and user. Each group is answered by one
+        compound tmux command, and the groups are checked in parallel, so slow
+        hosts don't hold up the rest.
+
+        Args:
+            servers (list): Game server objects to check status of.
+            app_context (AppContext): Optional Current app context, needed
+                                      for caching & logging in worker threads.
+        Returns:
+            dict: Power state (True, False, or None) by game server id.
+        """
+        groups = defaultdict(list)
+        for server in servers:
+            groups[(server.install_type, server.install_host, server.username)].append(server)
+
+        if not groups:
+            return dict()
+
+        max_workers = ConfigManager().getint('settings', 'status_check_workers', 8)
+        with ThreadPoolExecutor(max_workers=min(len(groups), max_workers or 1)) as pool:
+            results = pool.map(
+                lambda group: self._get_group_power_states(group, app_context),
+                groups.values()
+            )
+
+        statuses = dict()
+        for result in results:
+            statuses.update(result)
+
+        return statuses
+
+    def _get_group_power_states(self, servers, app_context=None):
+        """
+        Checks power states for servers sharing an install type, host, and
+        user. Run in worker thread by get_power_states().
+        """
+        statuses = dict.fromkeys([server.id for server in servers])
+        try:
+            if app_context:
+                # Fresh context per thread, one context can't be pushed in many.
+                with app_context.app.app_context():
+                    statuses.update(self._check_group(servers))
+            else:
+                statuses.update(self._check_group(servers))
+
+        except Exception as e:
+            # One bad host shouldn't sink everyone else's statuses.
+            self.logger.error(log_wrap("status check failed", e))
+
+        return statuses
+
+    def _check_group(self, servers):
+        # Docker servers each live in their own container, nothing to share.
+        if len(servers) == 1 or servers[0].install_type == "docker":
+            return {server.id: self.get_power_state(server) for server in servers}
+
+        return self._get_batch_power_states(servers)
+
+    def _get_batch_power_states(self, servers):
+        """
+        Checks power states for servers sharing a host and user with a single
+        compound command, rather than one tmux call (and ssh round trip) per
+        server. Each socket's list-session exit status is echoed back on its
+        own line.
+
+        Args:
+            servers (list): Game servers with same install type, host, & user.
+
+        Returns:
+            dict: Power state (True, False, or None) by game server id.
+        """
+        statuses = dict.fromkeys([server.id for server in servers])
+
+        socket_names = TmuxSocketNameCache().get_tmux_socket_names(servers)
+        server_ids = {socket: server_id for server_id, socket in socket_names.items() if socket}
+        if not server_ids:
+            return statuses
+
+        script = "; ".join(
+            f"{PATHS['tmux']} -L {shlex.quote(socket)} list-session >/dev/null 2>&1; "
+            f"echo {shlex.quote(GameServerManager.STATUS_MARKER + socket)}:$?"
+            for socket in server_ids
+        )
+        cmd = [PATHS["sh"], "-c", script]
+
+        server = servers[0]
+        cmd_id = f"get_server_statuses:{server.install_host}:{server.username}"
+
+        proc_info_repo = get_proc_info_repository()
+        proc_info_repo.remove(cmd_id)
+        CommandExecutor().run(cmd, server, cmd_id)
+
+        proc_info = proc_info_repo.get(cmd_id)
+        self.logger.info(log_wrap("proc_info", proc_info))
+        proc_info_repo.remove(cmd_id)
+
+        if proc_info == None:
+            return statuses
+
+        # Stick output back together in case lines got split across reads.
+        output = "".join(proc_info.stdout).replace("\r", "")
+        for line in output.splitlines():
+            if not line.startswith(GameServerManager.STATUS_MARKER):
+                continue
+
+            socket, _, exit_status = line[len(GameServerManager.STATUS_MARKER):].rpartition(":")
+            if socket in server_ids:
+                statuses[server_ids[socket]] = exit_status == "0"
+
+        return statuses
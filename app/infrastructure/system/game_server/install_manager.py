@@ -1,12 +1,14 @@
 import re
 import json
 import time
-import threading
 import logging
 
+from contextlib import nullcontext
+
 from app.infrastructure.persistence.repositories.game_server_repo import SqlAlchemyGameServerRepository
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
 from app.infrastructure.system.command_executor.command_executor import CommandExecutor
+from app.infrastructure.system.command_executor.job_runner import JobRunner
 
 from app.utils.paths import PATHS
 
@@ -66,7 +68,7 @@ class GameServerInstallManager:
 
         cmd_id = 'cancel_install'
         CommandExecutor().run(cmd, None, cmd_id)
-        proc_info = InMemProcInfoRepository().get(cmd_id)
+        proc_info = get_proc_info_repository().get(cmd_id)
 
         if proc_info == None:
             return False
@@ -78,19 +80,17 @@ class GameServerInstallManager:
 
     def list_running(self):
         """
-        Gets list of running install thread names, if any are currently running.
+        Gets list of installs running (or queued up to run) on the JobRunner.
     
         Returns:
-            dict: Mapping of observed running threads for game server IDs to game
+            dict: Mapping of game server IDs for running installs to game
                   server names.
         """
-        threads = threading.enumerate()
-        # Get all active threads.
         running_install_threads = dict()
 
-        for thread in threads:
-            if thread.is_alive() and thread.name.startswith("web_lgsm_install_"):
-                server_id = thread.name.replace("web_lgsm_install_", "")
+        for job in JobRunner().list():
+            if job["name"] == "install":
+                server_id = job["server_id"]
 
                 if not server_id:
                     continue
@@ -106,7 +106,7 @@ class GameServerInstallManager:
     def clear_proc_info_post_install(self, server_id, app_context):
         """
         Clears the stdout & stderr buffers for proc_info after install finishes.
-        Does so by checking running install threads, if thread for ID is gone from
+        Does so by checking running installs, if install for ID is gone from
         running list and game server install marked finished, clear buffers.
     
         Args:
@@ -115,16 +115,15 @@ class GameServerInstallManager:
                                       logging in a thread.
         """
 
-        # App context needed for logging in threads.
-        if app_context:
-            app_context.push()
+        # App context needed for logging in threads. Popped again after, job
+        # runner threads get reused.
+        with app_context if app_context else nullcontext():
+            self._clear_proc_info_post_install(server_id)
 
+    def _clear_proc_info_post_install(self, server_id):
         max_lifetime = 3600  # 1 Hour TTL
         runtime = 0
 
-        # Little buffer to make sure install daemon thread starts first.
-        time.sleep(5)
-
 #TODO: Sort out logger call, I need a standardized way to do them. I don't like this passing in current app to infra layer.
         self.logger.info("<CLEAR DAEMON> - Starting clear thread")
 
@@ -139,12 +138,15 @@ class GameServerInstallManager:
                 if server == None:
                     return
 
-                # If install thread not running anymore and install marked
-                # finished, clear out the old proc_info object.
+                # If install not running anymore and install marked finished,
+                # clear out the old proc_info object. Failed installs keep
+                # their output around to look at.
                 if server.install_finished and not server.install_failed:
                     self.logger.info("<CLEAR DAEMON> - Thread Cleared!")
-                    InMemProcInfoRepository().remove(server_id)
-                    return
+                    get_proc_info_repository().remove(server_id)
+
+                # Don't tie up a job runner worker waiting on nothing.
+                return
 
             time.sleep(5)
             runtime += 5
@@ -0,0 +1,54 @@
+import time
+import queue
+
+
+class SseSubscription:
+    """
+    A single viewer's handle on a server-sent events stream. Iterating over it
+    yields events published by its source, or None whenever nothing new has
+    shown up within the source's KEEPALIVE window.
+
+    Source is whatever hands out subscriptions (ie. the console stream hub or
+    status poller). It has to have KEEPALIVE and STREAM_MAX_AGE attributes
+    and an unsubscribe() method. Subclasses can override wants() to filter
+    which published events make it to the viewer.
+    """
+    # Max number of unread events a slow viewer can have queued before it gets
+    # dropped. Dropped viewers just reconnect and catch up.
+    MAX_QUEUED = 100
+
+    def __init__(self, source):
+        self.source = source
+        self.queue = queue.Queue(maxsize=self.MAX_QUEUED)
+        self.closed = False
+        self.started = time.monotonic()
+
+    def wants(self, event):
+        """Whether event should be queued for viewer, all of them by default."""
+        return True
+
+    def put(self, event):
+        """Queue event for viewer, dropping viewer if it can't keep up."""
+        if not self.wants(event):
+            return
+
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.closed = True
+
+    def __iter__(self):
+        while not self.closed:
+            # Streams are recycled periodically so long lived viewers don't pin
+            # a web server thread forever. Clients reconnect automatically.
+            if time.monotonic() - self.started > self.source.STREAM_MAX_AGE:
+                break
+
+            try:
+                yield self.queue.get(timeout=self.source.KEEPALIVE)
+            except queue.Empty:
+                yield None
+
+    def close(self):
+        self.closed = True
+        self.source.unsubscribe(self)
@@ -0,0 +1,250 @@
+import time
+import random
+import logging
+import threading
+
+from app.infrastructure.system.config import ConfigManager
+
+from app.utils.helpers import log_wrap
+
+from .game_server_manager import GameServerManager
+from .sse_subscription import SseSubscription
+
+
+class StatusSubscription(SseSubscription):
+    """
+    A single viewer's handle on power state change events, for the game
+    servers it was subscribed with. Dropped viewers just reconnect and get a
+    fresh snapshot.
+    """
+
+    def __init__(self, poller, server_ids):
+        super().__init__(poller)
+        self.poller = poller
+        self.server_ids = set(server_ids)
+
+    def wants(self, event):
+        return event["id"] in self.server_ids
+
+
+class StatusPoller:
+    """
+    This singleton keeps game server power states fresh in the background, so
+    requests for them are answered from cache instead of each spawning their
+    own tmux checks.
+
+    Only servers someone is looking at get polled. A server is watched from
+    the first time its status is asked for until nobody has asked for
+    WATCH_TTL seconds and no stream is subscribed to it. Hosts that can't be
+    reached are backed off exponentially, up to status_poll_max_backoff
+    seconds between checks. Setting status_poll_interval to 0 turns polling
+    off and every request checks on demand again.
+    """
+    # Seconds a server stays watched after its status was last asked for.
+    WATCH_TTL = 600
+
+    # Seconds between keepalives on an idle stream.
+    KEEPALIVE = 15
+
+    # Seconds before a stream is closed and the client has to reconnect.
+    STREAM_MAX_AGE = 300
+
+    # Latest power state by game server id.
+    statuses = dict()
+
+    # Watched game servers by id, as (server, last_requested) pairs.
+    watched = dict()
+
+    # Unreachable groups by (install_type, host, user), as (failures,
+    # next_check) pairs. Like everything else here, only touch under lock.
+    backoff = dict()
+
+    subscribers = set()
+    lock = threading.Lock()
+    thread = None
+    app = None
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(StatusPoller, cls).__new__(cls)
+        return cls.instance
+
+    def __init__(self, logger=logging.getLogger(__name__)):
+        self.logger = logger
+
+    def get_power_states(self, servers, app_context=None):
+        """
+        Get's the power states for game servers from cache, checking any not
+        seen before on the spot. Starts the poller if not already running.
+
+        Args:
+            servers (list): Game server objects to get status of.
+            app_context (AppContext): Optional Current app context, needed
+                                      by checks run in other threads.
+        Returns:
+            dict: Power state (True, False, or None) by game server id.
+        """
+        interval = ConfigManager().getint('settings', 'status_poll_interval', 30)
+        if not interval:
+            return GameServerManager().get_power_states(servers, app_context)
+
+        now = time.monotonic()
+        with StatusPoller.lock:
+            for server in servers:
+                StatusPoller.watched[server.id] = (server, now)
+            misses = [server for server in servers if server.id not in StatusPoller.statuses]
+
+        if misses:
+            self._update(GameServerManager().get_power_states(misses, app_context))
+
+        self._start(app_context)
+
+        with StatusPoller.lock:
+            return {server.id: StatusPoller.statuses.get(server.id) for server in servers}
+
+    def subscribe(self, servers, app_context=None):
+        """
+        Subscribe to power state changes for game servers.
+
+        Args:
+            servers (list): Game server objects to get change events for.
+            app_context (AppContext): Optional Current app context.
+
+        Returns:
+            StatusSubscription: Subscription object, with a snapshot of the
+                                current power states queued up first.
+        """
+        snapshot = self.get_power_states(servers, app_context)
+
+        subscription = StatusSubscription(self, snapshot.keys())
+        for server_id, status in snapshot.items():
+            subscription.put({"id": server_id, "status": status})
+
+        with StatusPoller.lock:
+            StatusPoller.subscribers.add(subscription)
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with StatusPoller.lock:
+            StatusPoller.subscribers.discard(subscription)
+
+    def forget(self, server_id):
+        """
+        Stops watching a game server, for when it's been deleted.
+
+        Args:
+            server_id (str): ID of game server to drop.
+        """
+        with StatusPoller.lock:
+            StatusPoller.watched.pop(server_id, None)
+            StatusPoller.statuses.pop(server_id, None)
+
+    def poll(self, app_context=None):
+        """
+        Refreshes the power states of all watched game servers that aren't on
+        a backed off host, and publishes any changes.
+        """
+        interval = ConfigManager().getint('settings', 'status_poll_interval', 30)
+        max_backoff = ConfigManager().getint('settings', 'status_poll_max_backoff', 600)
+        now = time.monotonic()
+
+        with StatusPoller.lock:
+            subscribed = set()
+            for subscription in StatusPoller.subscribers:
+                subscribed |= subscription.server_ids
+
+            # Forget servers nobody's looking at anymore.
+            for server_id, (server, last_requested) in list(StatusPoller.watched.items()):
+                if now - last_requested > StatusPoller.WATCH_TTL and server_id not in subscribed:
+                    del StatusPoller.watched[server_id]
+                    StatusPoller.statuses.pop(server_id, None)
+
+            groups = dict()
+            for server, _ in StatusPoller.watched.values():
+                key = (server.install_type, server.install_host, server.username)
+                if StatusPoller.backoff.get(key, (0, 0))[1] > now:
+                    continue
+                groups.setdefault(key, []).append(server)
+
+        if not groups:
+            return
+
+        statuses = GameServerManager().get_power_states(
+            [server for group in groups.values() for server in group], app_context
+        )
+
+        backed_off = []
+        with StatusPoller.lock:
+            for key, group in groups.items():
+                # Every check in the group coming back indeterminate means the
+                # host (or user) isn't reachable at all.
+                if all(statuses.get(server.id) == None for server in group):
+                    failures = StatusPoller.backoff.get(key, (0, 0))[0] + 1
+                    delay = min(interval * 2 ** failures, max_backoff or interval)
+                    StatusPoller.backoff[key] = (failures, now + delay)
+                    backed_off.append((key, delay))
+                else:
+                    StatusPoller.backoff.pop(key, None)
+
+        for key, delay in backed_off:
+            self.logger.info(log_wrap("backing off status checks", (key, delay)))
+
+        self._update(statuses)
+
+    def _update(self, statuses):
+        """
+        Stores new power states, publishing the ones that changed. Servers
+        forgotten while their check was running are left out.
+        """
+        events = []
+        with StatusPoller.lock:
+            for server_id, status in statuses.items():
+                if server_id not in StatusPoller.watched:
+                    continue
+
+                if server_id in StatusPoller.statuses and StatusPoller.statuses[server_id] == status:
+                    continue
+
+                StatusPoller.statuses[server_id] = status
+                events.append({"id": server_id, "status": status})
+
+            subscribers = list(StatusPoller.subscribers)
+
+        for event in events:
+            for subscription in subscribers:
+                subscription.put(event)
+
+    def _start(self, app_context=None):
+        """Start poller thread, if not already running in this process."""
+        with StatusPoller.lock:
+            if app_context:
+                StatusPoller.app = app_context.app
+
+            if StatusPoller.thread and StatusPoller.thread.is_alive():
+                return
+
+            StatusPoller.thread = threading.Thread(
+                target=self._poll_loop,
+                daemon=True,
+                name="status_poller",
+            )
+            StatusPoller.thread.start()
+
+    def _poll_loop(self):
+        while True:
+            config = ConfigManager()
+            interval = config.getint('settings', 'status_poll_interval', 30)
+            jitter = config.getint('settings', 'status_poll_jitter', 5)
+
+            # Polling got turned off, next request starts it back up.
+            if not interval:
+                return
+
+            # Jitter keeps workers from all hitting the same hosts at once.
+            time.sleep(interval + random.uniform(0, jitter or 0))
+
+            try:
+                self.poll(StatusPoller.app and StatusPoller.app.app_context())
+            except Exception as e:
+                self.logger.error(log_wrap("status poll failed", e))
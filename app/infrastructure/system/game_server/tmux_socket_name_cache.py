@@ -50,4 +50,39 @@ class TmuxSocketNameCache:
 
         return socket_file_name
 
+    def get_tmux_socket_names(self, servers):
+        """
+        Batch version of get_tmux_socket_name() for servers sharing an install
+        type, host, and user. Uid files for servers not already cached are
+        all read in one go.
+
+        Args:
+            servers (list): Game Servers to get tmux socket names for.
+
+        Returns:
+            dict: Socket name (or None if can't get it) by game server id.
+        """
+        socket_names = dict()
+        uid_paths = dict()
+
+        for server in servers:
+            socket_names[server.id] = cache.get(server.id + 'socket_name')
+            if socket_names[server.id] == None:
+                uid_paths[server.id] = os.path.join(
+                    server.install_path, f"lgsm/data/{server.script_name}.uid"
+                )
+
+        if not uid_paths:
+            return socket_names
+
+        uids = FileManager().read_many(servers[0], list(uid_paths.values()))
+
+        for server in servers:
+            gs_id = uids.get(uid_paths.get(server.id))
+            if gs_id == None:
+                continue
+
+            socket_names[server.id] = server.script_name + "-" + gs_id.rstrip()
+            cache.set(server.id + 'socket_name', socket_names[server.id], timeout=1800)
 
+        return socket_names
@@ -1,6 +1,7 @@
 import json
 
 from app.domain.entities.control import Control 
+from app.domain.entities.permissions import Permissions
 from app.infrastructure.system.config.config_manager import ConfigManager
 
 class ControlsRepository(Control):
@@ -85,20 +86,12 @@ class ControlsRepository(Control):
             List[Control]: Filtered list of control objects
         """
         controls = []
-
-        # Load user permissions if not admin
-        user_perms = {}
-        if user.role != "admin":
-            try:
-                user_perms = json.loads(user.permissions)
-            except (json.JSONDecodeError, AttributeError):
-                user_perms = {}
+        permissions = Permissions.for_user(user)
 
         for long_ctrl, ctrl_data in controls_dict.items():
             # Skip if non-admin user doesn't have permission for this control
-            if user.role != "admin":
-                if long_ctrl not in user_perms.get("controls", []):
-                    continue
+            if not permissions.has_control(long_ctrl):
+                continue
 
             # Create Control object
             ctrl = Control()
@@ -1,13 +1,128 @@
+import os
+import re
+import time
+import threading
+
+from collections import OrderedDict
+
 from app.domain.entities.proc_info import ProcInfo
 from app.domain.repositories.proc_info_repo import ProcInfoRepository
+from app.infrastructure.system.config import ConfigManager
+
+class BaseProcInfoRepository(ProcInfoRepository):
+    """
+    Shared plumbing for the proc_info repositories. Reads output caps,
+    spilling, and eviction settings from main.conf, and runs the sweeper
+    thread that calls the subclass's sweep() periodically.
+
+    Subclasses need lock and sweeper class attributes of their own.
+    """
+    # Seconds between sweeps.
+    SWEEP_INTERVAL = 60
+
+    # Where output trimmed from ProcInfo buffers goes, if spilling is enabled.
+    SPILL_DIR = "logs/proc_output"
+
+    def _caps(self):
+        """
+        Get output caps for new ProcInfo objects from main.conf.
+
+        Returns:
+            tuple: Max lines and max bytes, None for no cap.
+        """
+        config = ConfigManager()
+        max_lines = config.getint('settings', 'output_max_lines', 20000)
+        max_bytes = config.getint('settings', 'output_max_bytes', 4194304)
+
+        # Zero means no cap.
+        return (max_lines or None, max_bytes or None)
+
+    def _spill(self, server_id, fresh=False):
+        """
+        Get spill callback for process, if output_spill_to_disk is on.
+
+        Args:
+            server_id (int): ID process is stored under, used to name spill
+                             files.
+            fresh (bool): Remove spill files left over from old processes
+                          with the same id.
+
+        Returns:
+            callable: Takes output type and list of lines, else None.
+        """
+        if not ConfigManager().getboolean('settings', 'output_spill_to_disk', False):
+            return None
+
+        spill_path = os.path.join(self.SPILL_DIR, re.sub(r"[^\w.-]", "_", str(server_id)))
+        os.makedirs(self.SPILL_DIR, exist_ok=True)
+
+        # Start fresh, don't mix in output from old processes with same id.
+        if fresh:
+            for output_type in ("stdout", "stderr"):
+                if os.path.isfile(f"{spill_path}.{output_type}.log"):
+                    os.remove(f"{spill_path}.{output_type}.log")
+
+        def spill(output_type, lines):
+            with open(f"{spill_path}.{output_type}.log", "a") as spill_file:
+                spill_file.writelines(lines)
+
+        return spill
+
+    def _eviction_settings(self):
+        """
+        Returns:
+            tuple: proc_info_ttl and proc_info_max_entries, zero for no limit.
+        """
+        config = ConfigManager()
+        ttl = config.getint('settings', 'proc_info_ttl', 3600)
+        max_entries = config.getint('settings', 'proc_info_max_entries', 256)
+        return (ttl, max_entries)
+
+    def sweep(self):
+        raise NotImplementedError
+
+    def _start_sweeper(self):
+        """Start sweeper thread, if not already running in this process."""
+        cls = type(self)
+        with cls.lock:
+            if cls.sweeper and cls.sweeper.is_alive():
+                return
+
+            cls.sweeper = threading.Thread(
+                target=self._sweep_loop,
+                daemon=True,
+                name="proc_info_sweeper",
+            )
+            cls.sweeper.start()
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.SWEEP_INTERVAL)
+            self.sweep()
 
-class InMemProcInfoRepository(ProcInfoRepository):
+
+class InMemProcInfoRepository(BaseProcInfoRepository):
     """
     This singleton is used to access a shared dictionary of proc_info objects,
     allowing app to share info about the same processes between application layers.
+
+    Finished processes are evicted once they haven't been touched for ttl
+    seconds, and the least recently used finished ones go first if there's
+    ever more than max_entries of them. Running processes are never evicted.
+    A sweeper thread enforces both periodically.
     """
-    # Holds ProcInfo objects.
-    processes = dict()
+    # Holds ProcInfo objects, least recently used first.
+    processes = OrderedDict()
+
+    # Last time each process was added, fetched, or seen running.
+    touched = dict()
+
+    lock = threading.RLock()
+    sweeper = None
+
+    # Eviction settings, refreshed from main.conf on each sweep.
+    ttl = 3600
+    max_entries = 256
 
     def __new__(cls):
         if not hasattr(cls, 'instance'):
@@ -29,11 +144,19 @@ class InMemProcInfoRepository(ProcInfoRepository):
         # Sets server_id for proc_info object automatically since we can.
         proc_info.server_id = server_id
 
-        InMemProcInfoRepository.processes[server_id] = proc_info
+        with InMemProcInfoRepository.lock:
+            InMemProcInfoRepository.processes[server_id] = proc_info
+            InMemProcInfoRepository.processes.move_to_end(server_id)
+            InMemProcInfoRepository.touched[server_id] = time.monotonic()
+
+            if len(InMemProcInfoRepository.processes) > InMemProcInfoRepository.max_entries:
+                self._evict_lru()
+
+        self._start_sweeper()
 
         return proc_info
 
-    def get(self, server_id, create=False):
+    def get(self, server_id, create=False, since=None):
         """
         Fetches existing proc_info object from dictionary by server_id.
 
@@ -41,18 +164,35 @@ class InMemProcInfoRepository(ProcInfoRepository):
             server_id (int): ID in database for GameServer object this process is
                              associated with.
             create (bool): Optional Create new process if none found.
+            since (int): Unused here, whole object is already in memory.
 
         Returns:
             proc_info (ProcInfoVessel): Returns proc_info object in dictionary,
             else returns None.
         """
-        if server_id not in list(InMemProcInfoRepository.processes.keys()):
-            if not create:
-                return None
+        with InMemProcInfoRepository.lock:
+            if server_id in InMemProcInfoRepository.processes:
+                InMemProcInfoRepository.processes.move_to_end(server_id)
+                InMemProcInfoRepository.touched[server_id] = time.monotonic()
+                return InMemProcInfoRepository.processes[server_id]
 
-            self.add(server_id, proc_info=ProcInfo())
+        if not create:
+            return None
 
-        return InMemProcInfoRepository.processes[server_id]
+        return self.add(server_id, proc_info=self._new_proc_info(server_id))
+
+    def _new_proc_info(self, server_id):
+        """
+        Creates new ProcInfo object with output caps from main.conf.
+
+        Args:
+            server_id (int): ID process will be stored under, used to name
+                             spill files.
+
+        Returns:
+            ProcInfo: New empty proc_info object.
+        """
+        return ProcInfo(*self._caps(), self._spill(server_id, fresh=True))
 
     def remove(self, server_id):
         """
@@ -62,6 +202,90 @@ class InMemProcInfoRepository(ProcInfoRepository):
             server_id (int): ID in database for GameServer object this process is
                              associated with.
         """
-        if server_id in InMemProcInfoRepository.processes:
-            del InMemProcInfoRepository.processes[server_id]
+        with InMemProcInfoRepository.lock:
+            InMemProcInfoRepository.processes.pop(server_id, None)
+            InMemProcInfoRepository.touched.pop(server_id, None)
+
+    def stats(self):
+        """
+        Get info on how much the repository is currently holding.
+
+        Returns:
+            dict: Number of processes (total & running) and the number of
+                  lines and bytes of output held across all of them.
+        """
+        with InMemProcInfoRepository.lock:
+            all_procs = list(InMemProcInfoRepository.processes.values())
+
+        stats = {"count": len(all_procs), "running": 0, "lines": 0, "bytes": 0}
+        for proc_info in all_procs:
+            if proc_info.process_lock:
+                stats["running"] += 1
+
+            for output in (proc_info.stdout, proc_info.stderr):
+                stats["lines"] += len(output)
+                stats["bytes"] += getattr(output, "size", 0)
+
+        return stats
+
+    def sweep(self):
+        """
+        Evicts finished processes past their ttl, then least recently used
+        finished processes until under max_entries.
+        """
+        InMemProcInfoRepository.ttl, InMemProcInfoRepository.max_entries = self._eviction_settings()
+
+        now = time.monotonic()
+        with InMemProcInfoRepository.lock:
+            for server_id, proc_info in list(InMemProcInfoRepository.processes.items()):
+                # Still running, ttl counts from when it finishes.
+                if proc_info.process_lock:
+                    InMemProcInfoRepository.touched[server_id] = now
+                    continue
+
+                # Zero means no ttl.
+                age = now - InMemProcInfoRepository.touched.get(server_id, now)
+                if InMemProcInfoRepository.ttl and age > InMemProcInfoRepository.ttl:
+                    self.remove(server_id)
+
+            self._evict_lru()
+
+    def _evict_lru(self):
+        """Remove least recently used finished processes down to max_entries."""
+        excess = len(InMemProcInfoRepository.processes) - InMemProcInfoRepository.max_entries
+        if not InMemProcInfoRepository.max_entries or excess <= 0:
+            return
+
+        # Most recent entry is never evicted, it was likely just added.
+        for server_id, proc_info in list(InMemProcInfoRepository.processes.items())[:-1]:
+            if excess <= 0:
+                break
+
+            if proc_info.process_lock:
+                continue
+
+            self.remove(server_id)
+            excess -= 1
+
+
+def get_proc_info_repository():
+    """
+    Gets the ProcInfoRepository picked by the proc_info_store setting. Memory
+    is fastest but only visible to the worker it lives in, sqlite is shared
+    between all gunicorn workers.
+
+    Returns:
+        ProcInfoRepository: Configured repository singleton.
+    """
+    global _store
+    if _store == None:
+        _store = ConfigManager().get('settings', 'proc_info_store', 'memory')
+
+    if _store == 'sqlite':
+        from app.infrastructure.system.repositories.sqlite_proc_info_repo import SqliteProcInfoRepository
+        return SqliteProcInfoRepository()
+
+    return InMemProcInfoRepository()
 
+# Read once per process, store can't change out from under running commands.
+_store = None
@@ -0,0 +1,361 @@
+import os
+import time
+import sqlite3
+import threading
+
+from app.domain.entities.proc_info import ProcInfo, OutputLines
+from app.infrastructure.system.repositories.proc_info_repo import BaseProcInfoRepository
+
+
+class SqliteOutputLines(OutputLines):
+    """
+    OutputLines that writes every line through to the proc_output table. Seq
+    numbers come from the table's autoincrement key, so they stay unique and
+    increasing across every worker process writing to it. Lines added with
+    extend() go in as one transaction, rather than a commit per line.
+    """
+
+    def __init__(self, proc_info, output_type, repo, max_lines=None, max_bytes=None, spill=None):
+        super().__init__(proc_info, max_lines, max_bytes, spill)
+        self._output_type = output_type
+        self._repo = repo
+
+    def _load(self, rows):
+        """Fill in lines already in the db, without writing them back."""
+        for seq, line in rows:
+            list.append(self, line)
+            self._seqs.append(seq)
+            self.size += self._line_size(line)
+
+    def _next_seq(self, line):
+        seq = self._repo._insert_line(self._proc_info.server_id, self._output_type, line)
+        self._proc_info.seq = seq
+        return seq
+
+    def _next_seqs(self, lines):
+        last = self._repo._insert_lines(self._proc_info.server_id, self._output_type, lines)
+        self._proc_info.seq = last
+        return range(last - len(lines) + 1, last + 1)
+
+    def clear(self):
+        self._repo._delete_lines(self._proc_info.server_id, self._output_type)
+        super().clear()
+
+    def _trim(self):
+        super()._trim()
+
+        # Drop whatever went from the front of the local list from db too.
+        oldest = self._seqs[0] if self._seqs else self._proc_info.seq + 1
+        self._repo._delete_lines(self._proc_info.server_id, self._output_type, before=oldest)
+
+
+class SqliteProcInfo(ProcInfo):
+    """
+    ProcInfo that writes its state through to the procs table whenever
+    process_lock, pid, or exit_status are set.
+    """
+    WRITE_THROUGH = ('process_lock', 'pid', 'exit_status')
+
+    def __init__(self, repo, server_id, max_lines=None, max_bytes=None, spill=None):
+        super().__init__()
+        self.server_id = server_id
+        self.stdout = SqliteOutputLines(self, "stdout", repo, max_lines, max_bytes,
+                                        spill and (lambda lines: spill("stdout", lines)))
+        self.stderr = SqliteOutputLines(self, "stderr", repo, max_lines, max_bytes,
+                                        spill and (lambda lines: spill("stderr", lines)))
+        self._repo = repo
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in SqliteProcInfo.WRITE_THROUGH and '_repo' in self.__dict__:
+            self._repo._update(self.server_id, name, value)
+
+
+class SqliteProcInfoRepository(BaseProcInfoRepository):
+    """
+    ProcInfoRepository backed by a local SQLite db in WAL mode. Unlike the
+    in memory repository, process output, locks, and exit statuses are visible
+    to every gunicorn worker, not just the one that ran the command.
+
+    Objects handed out by get() write through to the db as they're modified,
+    so executors can keep treating them like plain ProcInfo objects.
+    """
+    DB_PATH = "app/proc_info.db"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS procs (
+            id TEXT PRIMARY KEY,
+            process_lock INTEGER,
+            pid INTEGER,
+            exit_status INTEGER,
+            owner_pid INTEGER,
+            touched REAL
+        );
+        CREATE TABLE IF NOT EXISTS proc_output (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            proc_id TEXT NOT NULL,
+            output_type TEXT NOT NULL,
+            line TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS ix_proc_output_proc_id ON proc_output (proc_id, seq);
+    """
+
+    # Connections are per thread and per process, sqlite ones can't be shared.
+    local = threading.local()
+    lock = threading.Lock()
+    sweeper = None
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(SqliteProcInfoRepository, cls).__new__(cls)
+        return cls.instance
+
+    def _conn(self):
+        conn = getattr(SqliteProcInfoRepository.local, 'conn', None)
+        if conn is not None and SqliteProcInfoRepository.local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(SqliteProcInfoRepository.DB_PATH, timeout=10, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SqliteProcInfoRepository.SCHEMA)
+
+        SqliteProcInfoRepository.local.conn = conn
+        SqliteProcInfoRepository.local.pid = os.getpid()
+        return conn
+
+    def _to_proc_info(self, row):
+        """Builds detached ProcInfo from procs row, no output, no write through."""
+        proc_info = ProcInfo()
+        proc_info.server_id = row[0]
+        proc_info.process_lock = None if row[1] is None else bool(row[1])
+        proc_info.pid = row[2]
+        proc_info.exit_status = row[3]
+        return proc_info
+
+    def list(self):
+        rows = self._conn().execute(
+            "SELECT id, process_lock, pid, exit_status FROM procs ORDER BY touched"
+        ).fetchall()
+        return {row[0]: self._to_proc_info(row) for row in rows}
+
+    def add(self, server_id, proc_info):
+        """
+        Adds a new proc_info object to the db, replacing any existing one.
+
+        Args:
+            server_id (int): Unique ID used to identify process. Often is ID of a
+                             GameServer object, but not always.
+            proc_info (ProcInfo): Process object to be added.
+
+        Returns:
+            SqliteProcInfo: Write through copy of proc_info.
+        """
+        server_id = str(server_id)
+        conn = self._conn()
+        with SqliteProcInfoRepository.lock:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM proc_output WHERE proc_id = ?", (server_id,))
+            conn.execute(
+                "INSERT OR REPLACE INTO procs VALUES (?, ?, ?, ?, ?, ?)",
+                (server_id, proc_info.process_lock, proc_info.pid,
+                 proc_info.exit_status, os.getpid(), time.time()),
+            )
+            conn.execute("COMMIT")
+
+        shared = SqliteProcInfo(self, server_id, *self._caps(), self._spill(server_id, fresh=True))
+        shared.stdout.extend(proc_info.stdout)
+        shared.stderr.extend(proc_info.stderr)
+        object.__setattr__(shared, 'process_lock', proc_info.process_lock)
+        object.__setattr__(shared, 'pid', proc_info.pid)
+        object.__setattr__(shared, 'exit_status', proc_info.exit_status)
+
+        self._start_sweeper()
+
+        return shared
+
+    def get(self, server_id, create=False, since=None):
+        """
+        Fetches proc_info object from db by server_id.
+
+        Args:
+            server_id (int): ID in database for GameServer object this process is
+                             associated with.
+            create (bool): Optional Create new process if none found.
+            since (int): Optional seq cursor. Output lines at or before it are
+                         left out, saves loading output the caller already has.
+
+        Returns:
+            SqliteProcInfo: Write through proc_info object, else None.
+        """
+        server_id = str(server_id)
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT id, process_lock, pid, exit_status FROM procs WHERE id = ?", (server_id,)
+        ).fetchone()
+
+        if row == None:
+            if not create:
+                return None
+
+            return self.add(server_id, ProcInfo())
+
+        conn.execute("UPDATE procs SET touched = ? WHERE id = ?", (time.time(), server_id))
+
+        proc_info = SqliteProcInfo(self, server_id, *self._caps(), self._spill(server_id))
+        object.__setattr__(proc_info, 'process_lock', None if row[1] is None else bool(row[1]))
+        object.__setattr__(proc_info, 'pid', row[2])
+        object.__setattr__(proc_info, 'exit_status', row[3])
+
+        for output_type in ("stdout", "stderr"):
+            rows = conn.execute(
+                "SELECT seq, line FROM proc_output WHERE proc_id = ? AND output_type = ? "
+                "AND seq > ? ORDER BY seq",
+                (server_id, output_type, since or 0),
+            ).fetchall()
+            getattr(proc_info, output_type)._load(rows)
+
+        last = conn.execute(
+            "SELECT MAX(seq) FROM proc_output WHERE proc_id = ?", (server_id,)
+        ).fetchone()[0]
+        proc_info.seq = last or 0
+
+        return proc_info
+
+    def remove(self, server_id):
+        """
+        Removes any existing proc_info object from db by server_id.
+
+        Args:
+            server_id (int): ID in database for GameServer object this process is
+                             associated with.
+        """
+        server_id = str(server_id)
+        conn = self._conn()
+        with SqliteProcInfoRepository.lock:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM proc_output WHERE proc_id = ?", (server_id,))
+            conn.execute("DELETE FROM procs WHERE id = ?", (server_id,))
+            conn.execute("COMMIT")
+
+    def stats(self):
+        """
+        Get info on how much the repository is currently holding.
+
+        Returns:
+            dict: Number of processes (total & running) and the number of
+                  lines and bytes of output held across all of them.
+        """
+        conn = self._conn()
+        count, running = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(process_lock = 1), 0) FROM procs"
+        ).fetchone()
+        lines, size = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(CAST(line AS BLOB))), 0) FROM proc_output"
+        ).fetchone()
+        return {"count": count, "running": running, "lines": lines, "bytes": size}
+
+    def sweep(self):
+        """
+        Same eviction rules as the in memory repository. Also releases the lock
+        on processes whose owning worker died before they finished.
+        """
+        ttl, max_entries = self._eviction_settings()
+
+        conn = self._conn()
+        now = time.time()
+
+        for proc_id, owner_pid in conn.execute(
+            "SELECT id, owner_pid FROM procs WHERE process_lock = 1"
+        ).fetchall():
+            if self._pid_alive(owner_pid):
+                conn.execute("UPDATE procs SET touched = ? WHERE id = ?", (now, proc_id))
+            else:
+                conn.execute("UPDATE procs SET process_lock = 0 WHERE id = ?", (proc_id,))
+
+        stale = []
+        if ttl:
+            stale += [row[0] for row in conn.execute(
+                "SELECT id FROM procs WHERE COALESCE(process_lock, 0) = 0 AND touched < ?",
+                (now - ttl,),
+            ).fetchall()]
+
+        if max_entries:
+            stale += [row[0] for row in conn.execute(
+                "SELECT id FROM procs WHERE COALESCE(process_lock, 0) = 0 "
+                "ORDER BY touched DESC LIMIT -1 OFFSET ?",
+                (max_entries,),
+            ).fetchall()]
+
+        for proc_id in set(stale):
+            self.remove(proc_id)
+
+    def _pid_alive(self, pid):
+        if not pid:
+            return False
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def _insert_line(self, server_id, output_type, line):
+        cursor = self._conn().execute(
+            "INSERT INTO proc_output (proc_id, output_type, line) VALUES (?, ?, ?)",
+            (server_id, output_type, line),
+        )
+        return cursor.lastrowid
+
+    def _insert_lines(self, server_id, output_type, lines):
+        """
+        Inserts a batch of lines in a single transaction. Holding the write
+        lock for the whole batch means the rows get consecutive seqs.
+
+        Returns:
+            int: Seq of the last line inserted.
+        """
+        conn = self._conn()
+        with SqliteProcInfoRepository.lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(
+                    "INSERT INTO proc_output (proc_id, output_type, line) VALUES (?, ?, ?)",
+                    [(server_id, output_type, line) for line in lines],
+                )
+                last = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return last
+
+    def _delete_lines(self, server_id, output_type, before=None):
+        if before is None:
+            self._conn().execute(
+                "DELETE FROM proc_output WHERE proc_id = ? AND output_type = ?",
+                (server_id, output_type),
+            )
+            return
+
+        self._conn().execute(
+            "DELETE FROM proc_output WHERE proc_id = ? AND output_type = ? AND seq < ?",
+            (server_id, output_type, before),
+        )
+
+    def _update(self, server_id, name, value):
+        assert name in SqliteProcInfo.WRITE_THROUGH, f"Invalid column: {name}"
+
+        # Whoever takes the lock owns the process, for orphan detection.
+        if name == 'process_lock':
+            self._conn().execute(
+                "UPDATE procs SET process_lock = ?, owner_pid = ?, touched = ? WHERE id = ?",
+                (value, os.getpid(), time.time(), server_id),
+            )
+            return
+
+        self._conn().execute(
+            f"UPDATE procs SET {name} = ?, touched = ? WHERE id = ?",
+            (value, time.time(), server_id),
+        )
@@ -1,37 +1,261 @@
 import os
+import time
+import logging
 import paramiko
+import threading
 
-from functools import lru_cache
+from contextlib import contextmanager
+
+from app.infrastructure.system.config import ConfigManager
 
 class SSHClientInterface:
+    """
+    Singleton pool of ssh connections, keyed on (user, host, keyfile) and
+    shared by everything that talks to remote servers.
+
+    Connections get transport keepalives and are checked to still be alive
+    before being handed out again. Dead ones, and ones left idle past
+    ssh_max_idle seconds, are closed and transparently reconnected. The number
+    of sessions open at once against a single host is capped at
+    ssh_max_sessions_per_host.
+    """
+    # Holds (client, last_used) pairs by (user, host, keyfile).
+    connections = dict()
+
+    # Number of open sessions per connection, busy ones are never idle.
+    in_use = dict()
+
+    # Per connection locks, so slow connects don't hold up other hosts.
+    connect_locks = dict()
+
+    # Per host session limits.
+    host_slots = dict()
+
+    # Open sftp sessions by connection key, as (client, sftp, lock) tuples.
+    sftp_clients = dict()
+
+    lock = threading.Lock()
+
+    # Seconds to wait for a free session slot on a busy host.
+    SLOT_TIMEOUT = 30
+
+    def __new__(cls):
+        if not hasattr(cls, 'instance'):
+            cls.instance = super(SSHClientInterface, cls).__new__(cls)
+        return cls.instance
+
+    def __init__(self, logger=logging.getLogger(__name__)):
+        self.logger = logger
 
-    @lru_cache(maxsize=32)
     def get_client(self, username, hostname):
         """
-        Cache ssh connection objects using lru_cache.
+        Gets pooled ssh client for user@host, connecting if there isn't a live
+        one already.
+
+        Args:
+            username (str): User to connect as.
+            hostname (str): Host to connect to.
+
+        Returns:
+            paramiko.SSHClient: Connected client.
+        """
+        key = (username, hostname, self._get_ssh_key_file(username, hostname))
+
+        self._close_idle()
+
+        with SSHClientInterface.lock:
+            connect_lock = SSHClientInterface.connect_locks.setdefault(key, threading.Lock())
+
+        with connect_lock:
+            entry = SSHClientInterface.connections.get(key)
+            if entry:
+                client = entry[0]
+                if self._is_alive(client):
+                    SSHClientInterface.connections[key] = (client, time.monotonic())
+                    return client
+
+                self.logger.info(f"Reconnecting dead ssh connection to {username}@{hostname}")
+                self._discard(key, client)
+
+            client = self._connect(*key)
+            SSHClientInterface.connections[key] = (client, time.monotonic())
+            return client
+
+    @contextmanager
+    def session(self, username, hostname):
+        """
+        Context manager version of get_client() that also holds one of the
+        host's session slots for the duration. If the block fails with a
+        connection error, the connection is dropped so the next caller gets a
+        fresh one.
+
+        Args:
+            username (str): User to connect as.
+            hostname (str): Host to connect to.
+
+        Yields:
+            paramiko.SSHClient: Connected client.
+        """
+        slots = self._host_slots(hostname)
+        if not slots.acquire(timeout=SSHClientInterface.SLOT_TIMEOUT):
+            raise paramiko.SSHException(f"Too many ssh sessions open to {hostname}")
+
+        key = (username, hostname, self._get_ssh_key_file(username, hostname))
+        with SSHClientInterface.lock:
+            SSHClientInterface.in_use[key] = SSHClientInterface.in_use.get(key, 0) + 1
+
+        try:
+            client = self.get_client(username, hostname)
+            try:
+                yield client
+            except (paramiko.SSHException, EOFError, OSError):
+                if not self._is_alive(client):
+                    self._discard(key, client)
+                raise
+        finally:
+            with SSHClientInterface.lock:
+                SSHClientInterface.in_use[key] -= 1
+                if not SSHClientInterface.in_use[key]:
+                    del SSHClientInterface.in_use[key]
+
+                # Idle time counts from when the session ends.
+                if key in SSHClientInterface.connections:
+                    SSHClientInterface.connections[key] = (SSHClientInterface.connections[key][0], time.monotonic())
+            slots.release()
+
+    @contextmanager
+    def sftp(self, username, hostname):
+        """
+        Gets the sftp session for user@host's pooled connection, opening one
+        only if there isn't one already. Sftp requests on a session are
+        serialized, so the session is locked for the duration of the block.
+
+        Args:
+            username (str): User to connect as.
+            hostname (str): Host to connect to.
+
+        Yields:
+            paramiko.SFTPClient: Open sftp session.
         """
-        keyfile = self._get_ssh_key_file(username, hostname)
+        key = (username, hostname, self._get_ssh_key_file(username, hostname))
+
+        with self.session(username, hostname) as client:
+            with SSHClientInterface.connect_locks[key]:
+                entry = SSHClientInterface.sftp_clients.get(key)
+
+                # Opened on an older, since replaced, connection.
+                if entry and (entry[0] is not client or entry[1].sock.closed):
+                    self._close_sftp(key)
+                    entry = None
+
+                if entry == None:
+                    entry = (client, client.open_sftp(), threading.Lock())
+                    with SSHClientInterface.lock:
+                        SSHClientInterface.sftp_clients[key] = entry
+
+            with entry[2]:
+                try:
+                    yield entry[1]
+                except (paramiko.SSHException, EOFError):
+                    self._close_sftp(key)
+                    raise
+
+    def close_all(self):
+        """Close every pooled connection."""
+        with SSHClientInterface.lock:
+            entries = list(SSHClientInterface.connections.items())
+
+        for key, (client, _) in entries:
+            self._discard(key, client)
+
+    def _connect(self, username, hostname, keyfile):
         client = paramiko.SSHClient()
         client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        client.connect(
-            hostname, 
-            username=username,
-            key_filename=keyfile,
-            timeout=3,
-            look_for_keys=False, 
-            allow_agent=False
-        )
-
-        # Verify connection is alive.
         try:
-            client.exec_command("echo 'healthcheck'", timeout=2)
-            return client
+            client.connect(
+                hostname,
+                username=username,
+                key_filename=keyfile,
+                timeout=3,
+                look_for_keys=False,
+                allow_agent=False
+            )
+
+            keepalive = ConfigManager().getint('settings', 'ssh_keepalive', 30)
+            if keepalive:
+                client.get_transport().set_keepalive(keepalive)
         except Exception:
             client.close()
             raise
 
+        return client
+
+    def _is_alive(self, client):
+        """
+        Cheap liveness check, no exec round trip. Sends an ignore message so a
+        dropped socket gets noticed now instead of on the caller's command.
+        """
+        transport = client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+
+        try:
+            transport.send_ignore()
+        except Exception:
+            return False
+
+        return True
+
+    def _discard(self, key, client):
+        with SSHClientInterface.lock:
+            if SSHClientInterface.connections.get(key, (None,))[0] is client:
+                del SSHClientInterface.connections[key]
+
+        self._close_sftp(key, client)
+
+        try:
+            client.close()
+        except Exception as e:
+            self.logger.debug(e)
+
+    def _close_sftp(self, key, client=None):
+        """Close key's sftp session, only if opened on client when given."""
+        with SSHClientInterface.lock:
+            entry = SSHClientInterface.sftp_clients.get(key)
+            if entry == None or (client and entry[0] is not client):
+                return
+            del SSHClientInterface.sftp_clients[key]
+
+        try:
+            entry[1].close()
+        except Exception as e:
+            self.logger.debug(e)
+
+    def _close_idle(self):
+        """Close connections that haven't been used in ssh_max_idle seconds."""
+        max_idle = ConfigManager().getint('settings', 'ssh_max_idle', 600)
+        if not max_idle:
+            return
+
+        now = time.monotonic()
+        with SSHClientInterface.lock:
+            idle = [
+                (key, client) for key, (client, last_used) in SSHClientInterface.connections.items()
+                if now - last_used > max_idle and key not in SSHClientInterface.in_use
+            ]
+
+        for key, client in idle:
+            self._discard(key, client)
+
+    def _host_slots(self, hostname):
+        with SSHClientInterface.lock:
+            if hostname not in SSHClientInterface.host_slots:
+                limit = ConfigManager().getint('settings', 'ssh_max_sessions_per_host', 8)
+                SSHClientInterface.host_slots[hostname] = threading.BoundedSemaphore(limit or 1024)
+            return SSHClientInterface.host_slots[hostname]
+
     def _get_ssh_key_file(self, user, host):
-        """ 
+        """
         Fetches ssh private key file for user:host from ~/.ssh if user:host key
         exists.
         """
@@ -50,4 +274,3 @@ class SSHClientInterface:
 
         keyfile = os.path.join(ssh_dir, key_name)
         return keyfile
-
@@ -1,6 +1,6 @@
 from app.utils.paths import PATHS
 
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
 
 from app.infrastructure.system.command_executor.command_executor import CommandExecutor
 
@@ -25,7 +25,7 @@ class SudoersService():
         cmd = [PATHS['sudo'], '-n', '-l']
         cmd_id = 'check_sudo_access'
         success = self.command_service.run(cmd, None, cmd_id)
-        proc_info = InMemProcInfoRepository().get(cmd_id)
+        proc_info = get_proc_info_repository().get(cmd_id)
 
         if not success or proc_info == None:
             return False
@@ -44,7 +44,7 @@ class SudoersService():
         cmd = SudoersService.CONNECTOR_CMD + ["--user", username]
         cmd_id = f'add_sudoers_rule_{username}'
         self.command_service.run(cmd, None, cmd_id)
-        proc_info = InMemProcInfoRepository().get(cmd_id)
+        proc_info = get_proc_info_repository().get(cmd_id)
 
         if proc_info == None:
             return False
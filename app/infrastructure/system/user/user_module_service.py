@@ -4,7 +4,7 @@ import json
 import os
 from datetime import datetime
 
-from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
 
 from app.infrastructure.system.command_executor.command_executor import CommandExecutor
 
@@ -47,7 +47,7 @@ class UserModuleService:
         unique_time_str = datetime.now().strftime('%Y%m%d%H%M%S%f')
         cmd_id = 'user_module_service' + unique_time_str  # Keep proc_info id unique
         CommandExecutor().run(cmd, None, cmd_id)
-        proc_info = InMemProcInfoRepository().get(cmd_id)
+        proc_info = get_proc_info_repository().get(cmd_id)
 
         if proc_info == None or proc_info.exit_status > 0:
             return {}
@@ -55,7 +55,7 @@ class UserModuleService:
         try:
             module_out = "\n".join(proc_info.stdout)
             struct = json.loads(module_out)
-            InMemProcInfoRepository().remove(cmd_id)  # Cleanup proc_info obj
+            get_proc_info_repository().remove(cmd_id)  # Cleanup proc_info obj
             return struct
         except:
             return module_out
@@ -5,4 +5,5 @@ api_bp = Blueprint("api", __name__)
 api = Api(api_bp)
 
 from . import cmd_output, game_server_delete, manage_cron, server_status, system_usage, update_console, server_list_order
+from . import console_stream, bulk_controls, job_queue
 
@@ -0,0 +1,136 @@
+import os
+import json
+
+from flask import Response, request, current_app
+from flask_login import login_required, current_user
+from flask_restful import Resource
+
+from app.utils.helpers import log_wrap, docker_cmd_build
+
+from . import api
+
+from app.container import container
+
+# Controls that make sense to fire off at a bunch of servers at once.
+BULK_CONTROLS = ["start", "stop", "restart", "update", "backup"]
+
+######### API Bulk Controls #########
+
+class BulkControls(Resource):
+    """
+    Runs one control against a selection of game servers. The request is all
+    or nothing, if the user can't run the control on every selected server
+    nothing gets run. Progress is fetched back via the returned job id.
+    """
+
+    @login_required
+    def post(self):
+        data = request.get_json(silent=True) or {}
+        control = data.get("control")
+        server_ids = data.get("server_ids")
+
+        if control not in BULK_CONTROLS:
+            resp_dict = {"Error": f"Invalid control! Must be one of: {', '.join(BULK_CONTROLS)}"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=400, mimetype="application/json"
+            )
+            return response
+
+        if not server_ids or not isinstance(server_ids, list):
+            resp_dict = {"Error": "No servers selected!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=400, mimetype="application/json"
+            )
+            return response
+
+        jobs = []
+        for server_id in dict.fromkeys(server_ids):
+            server = container.get_game_server().execute(server_id)
+            if server == None:
+                resp_dict = {"Error": f"Invalid id: {server_id}"}
+                response = Response(
+                    json.dumps(resp_dict, indent=4), status=400, mimetype="application/json"
+                )
+                return response
+
+            if not container.check_user_access().execute(current_user.id, "controls", server.id):
+                resp_dict = {"Error": f"Your user does not have access to {server.install_name}"}
+                response = Response(
+                    json.dumps(resp_dict, indent=4), status=403, mimetype="application/json"
+                )
+                return response
+
+            # Control list accounts for both user perms & game server exemptions.
+            controls_list = container.list_controls().execute(server.script_name, current_user)
+            short_ctrl = next(
+                (ctrl.short_ctrl for ctrl in controls_list if ctrl.long_ctrl == control), None
+            )
+            if short_ctrl == None:
+                resp_dict = {"Error": f"Control '{control}' not allowed for {server.install_name}"}
+                response = Response(
+                    json.dumps(resp_dict, indent=4), status=403, mimetype="application/json"
+                )
+                return response
+
+            cmd = [os.path.join(server.install_path, server.script_name), short_ctrl]
+            if server.install_type == "docker":
+                cmd = docker_cmd_build(server) + cmd
+
+            jobs.append((server, cmd))
+
+        for server, _ in jobs:
+            container.log_audit_event().execute(current_user.id, f"User '{current_user.username}', ran '{control}' on '{server.install_name}' (bulk)")
+
+        job_id = container.run_bulk_command().execute(jobs, current_app.app_context(), current_user.id)
+
+        resp_dict = {"job_id": job_id, "server_ids": [server.id for server, _ in jobs]}
+        current_app.logger.info(log_wrap("resp_dict", resp_dict))
+
+        response = Response(
+            json.dumps(resp_dict, indent=4), status=202, mimetype="application/json"
+        )
+        return response
+
+
+class BulkControlsJob(Resource):
+    """
+    Gets progress of a bulk controls job. Same format as cmd-output, with the
+    since cursor. Output from each server's own command is under its id in
+    cmd-output, as usual. Only the user that submitted the job can see it,
+    anyone else gets the same 404 as for a job that doesn't exist.
+    """
+
+    @login_required
+    def get(self, job_id):
+        if not container.check_user_access().execute(current_user.id, "controls"):
+            resp_dict = {"Error": "Permission Denied!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=403, mimetype="application/json"
+            )
+            return response
+
+        if container.get_bulk_job_owner().execute(job_id) != current_user.id \
+                or job_id not in container.list_processes().execute():
+            resp_dict = {"Error": "Job not found!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=404, mimetype="application/json"
+            )
+            return response
+
+        since = request.args.get("since")
+        if since is not None:
+            if not since.isdigit():
+                resp_dict = {"Error": "Invalid since cursor!"}
+                response = Response(
+                    json.dumps(resp_dict, indent=4), status=400, mimetype="application/json"
+                )
+                return response
+            since = int(since)
+
+        proc_info = container.get_process().execute(job_id, since=since)
+
+        response = Response(proc_info.toJSON(since), status=200, mimetype="application/json")
+        return response
+
+api.add_resource(BulkControls, "/bulk-controls")
+api.add_resource(BulkControlsJob, "/bulk-controls/<string:job_id>")
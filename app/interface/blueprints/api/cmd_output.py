@@ -1,6 +1,6 @@
 import json
 
-from flask import Response
+from flask import Response, request
 from flask_login import login_required, current_user
 from flask_restful import Resource
 
@@ -31,11 +31,22 @@ class CmdOutput(Resource):
             )
             return response
 
-        proc_info = container.get_process().execute(server_id, create=True)
+        # Optional cursor, only return output added after it. Response's seq
+        # field is the cursor to send next time.
+        since = request.args.get("since")
+        if since is not None:
+            if not since.isdigit():
+                resp_dict = {"Error": "Invalid since cursor!"}
+                response = Response(
+                    json.dumps(resp_dict, indent=4), status=400, mimetype="application/json"
+                )
+                return response
+            since = int(since)
 
+        proc_info = container.get_process().execute(server_id, create=True, since=since)
 
         # Returns json for used by ajax code on /controls route.
-        response = Response(proc_info.toJSON(), status=200, mimetype="application/json")
+        response = Response(proc_info.toJSON(since), status=200, mimetype="application/json")
         return response
 
 api.add_resource(CmdOutput, "/cmd-output/<string:server_id>")
@@ -0,0 +1,61 @@
+import json
+
+from flask import Response, request
+from flask_login import login_required, current_user
+from flask_restful import Resource
+
+from app.utils import *
+
+from . import api
+
+from app.container import container
+
+######### API Console Stream #########
+
+class ConsoleStream(Resource):
+    """
+    Server-sent events stream of new console lines for a game server. Replaces
+    polling /update-console + /cmd-output for live console output.
+    """
+
+    @login_required
+    def get(self, server_id):
+        # Check that the submitted server exists in db.
+        server = container.get_game_server().execute(server_id)
+        if server == None:
+            resp_dict = {"Error": "Supplied server does not exist!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=400, mimetype="application/json"
+            )
+            return response
+
+        if not container.check_user_access().execute(current_user.id, "update-console", server.id):
+            resp_dict = {"Error": "Permission denied!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=403, mimetype="application/json"
+            )
+            return response
+
+        # EventSource sends back the id of the last event it got on reconnect.
+        last_seq = request.headers.get("Last-Event-ID")
+        last_seq = int(last_seq) if last_seq and last_seq.isdigit() else None
+
+        # Each stream holds a web server thread, so there's a cap on them.
+        if container.check_console_streams_full().execute():
+            resp_dict = {"Error": "Too many console streams open, try again later!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=503, mimetype="application/json"
+            )
+            return response
+
+        subscription = container.stream_game_server_console().execute(server, last_seq)
+        if subscription == None:
+            resp_dict = {"Error": "Refresh cmd failed!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=503, mimetype="application/json"
+            )
+            return response
+
+        return sse_response(subscription, 2000, id_key="seq")
+
+api.add_resource(ConsoleStream, "/console-stream/<string:server_id>")
@@ -0,0 +1,44 @@
+import json
+
+from flask import Response, current_app
+from flask_login import login_required, current_user
+from flask_restful import Resource
+
+from app.utils.helpers import log_wrap
+
+from . import api
+
+from app.container import container
+
+######### API Job Queue #########
+
+class JobQueue(Resource):
+    """
+    Lists background jobs running on, or queued up for, the job runner.
+    Running jobs come first, then queued ones in the order they'll run. Users
+    only see jobs for game servers they have controls access to, admins see
+    everything.
+    """
+
+    @login_required
+    def get(self):
+        jobs = container.list_queued_jobs().execute()
+
+        if current_user.role != "admin":
+            jobs = [
+                job for job in jobs
+                if job["server_id"] and container.check_user_access().execute(current_user.id, "controls", job["server_id"])
+            ]
+
+        resp_dict = {
+            "running": [job for job in jobs if job["status"] == "running"],
+            "queued": [job for job in jobs if job["status"] == "queued"],
+        }
+        current_app.logger.debug(log_wrap("resp_dict", resp_dict))
+
+        response = Response(
+            json.dumps(resp_dict, indent=4), status=200, mimetype="application/json"
+        )
+        return response
+
+api.add_resource(JobQueue, "/job-queue")
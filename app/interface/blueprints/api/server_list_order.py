@@ -15,23 +15,18 @@ from app.container import container
 class ServerListOrder(Resource):
     @login_required
     def post(self):
-        data = request.json
-        order = data.get('order')
+        data = request.get_json(silent=True)
+        order = data.get('order') if isinstance(data, dict) else None
 
-        if not order:
+        if not order or not isinstance(order, list) or \
+                not all(isinstance(item, dict) and isinstance(item.get('id'), str) for item in order):
             return {'Error':'Invalid order data'}, 400
 
         current_app.logger.debug(log_wrap("order", order))
 
-        for index, item in enumerate(order):
-
-            server = container.get_game_server().execute(item['id'])
-            server.sort_order = index
-
-            current_app.logger.debug(log_wrap("server", server))
-
-            if not container.edit_game_server().execute(**server.__dict__):
-                return {'Error':'Problem updating GameServer sort_order'}, 500
+        # Whole list goes in one update, either all servers move or none do.
+        if not container.reorder_game_servers().execute([item['id'] for item in order]):
+            return {'Error':'Unknown game server id in order'}, 400
 
         resp_dict = {"success": "Sort order updated successfully"} 
         current_app.logger.info(log_wrap("resp_dict", resp_dict))
@@ -1,6 +1,6 @@
 import json
 
-from flask import Response
+from flask import Response, request
 from flask_login import login_required, current_user
 from flask_restful import Resource
 
@@ -42,5 +42,74 @@ class ServerStatus(Resource):
         )
         return response
 
+
+class ServerStatuses(Resource):
+    """
+    Batched version of ServerStatus. Takes comma separated list of server
+    ids in the ids query param, or checks every server the user can see if
+    left out. Ids that don't exist or the user can't access are left out of
+    the results. Served from the status poller's cache.
+    """
+
+    @login_required
+    def get(self):
+        ids = request.args.get("ids")
+
+        if ids:
+            servers = []
+            for server_id in dict.fromkeys(ids.split(",")):
+                server = container.get_game_server().execute(server_id)
+                if server != None:
+                    servers.append(server)
+        else:
+            servers = container.list_user_game_servers().execute(current_user.id)
+
+        servers = [
+            server for server in servers
+            if container.check_user_access().execute(current_user.id, "server-statuses", server.id)
+        ]
+
+        resp_dict = container.get_game_server_power_states().execute(
+            servers, current_app.app_context()
+        )
+        current_app.logger.info(log_wrap("resp_dict", resp_dict))
+
+        response = Response(
+            json.dumps(resp_dict, indent=4), status=200, mimetype="application/json"
+        )
+        return response
+
+
+class ServerStatusStream(Resource):
+    """
+    Server-sent events stream of power state changes, for every server the
+    user can see. Starts with a snapshot of the current states, one event per
+    server. Each open stream holds a gunicorn thread, so it's off unless the
+    status_stream setting is turned on.
+    """
+
+    @login_required
+    def get(self):
+        config = container.get_template_config().execute()
+        if not config.getboolean('settings', 'status_stream', False):
+            resp_dict = {"Error": "Status stream disabled!"}
+            response = Response(
+                json.dumps(resp_dict, indent=4), status=403, mimetype="application/json"
+            )
+            return response
+
+        servers = [
+            server for server in container.list_user_game_servers().execute(current_user.id)
+            if container.check_user_access().execute(current_user.id, "server-statuses", server.id)
+        ]
+
+        subscription = container.stream_game_server_statuses().execute(
+            servers, current_app.app_context()
+        )
+
+        return sse_response(subscription, 5000)
+
 api.add_resource(ServerStatus, "/server-status/<string:server_id>")
+api.add_resource(ServerStatuses, "/server-status")
+api.add_resource(ServerStatusStream, "/server-status-stream")
 
@@ -1,4 +1,3 @@
-from threading import Thread
 from flask_login import login_required, current_user
 from flask import (
     render_template,
@@ -221,13 +220,14 @@ def controls():
         if server.install_type == "docker":
             cmd = docker_cmd_build(server) + cmd
 
-        daemon = Thread(
-            target=container.run_command().execute,
-            args=(cmd, server, server.id, current_app.app_context()),
-            daemon=True,
+        container.queue_job().execute(
+            container.run_command().execute,
+            (cmd, server, server.id),
             name="ConsoleCMD",
+            server_id=server.id,
+            priority="high",
+            app_context=current_app.app_context(),
         )
-        daemon.start()
         return redirect(url_for("main.controls", server_id=server_id))
 
     else:
@@ -244,13 +244,13 @@ def controls():
         if server.install_type == "docker":
             cmd = docker_cmd_build(server) + cmd
 
-        daemon = Thread(
-            target=container.run_command().execute,
-            args=(cmd, server, server.id, current_app.app_context()),
-            daemon=True,
-            name="Command",
+        container.queue_job().execute(
+            container.run_command().execute,
+            (cmd, server, server.id),
+            name=long_ctrl,
+            server_id=server.id,
+            app_context=current_app.app_context(),
         )
-        daemon.start()
         return redirect(url_for("main.controls", server_id=server_id))
 
 
@@ -2,7 +2,6 @@ import os
 import json
 import getpass
 
-from threading import Thread
 from flask_login import login_required, current_user
 from flask import (
     jsonify,
@@ -181,21 +180,25 @@ def install():
         str(server_id),
     ]
 
-    install_daemon = Thread(
-        target=container.run_command().execute,
-        args=(cmd, None, server_id, current_app.app_context()),
-        daemon=True,
-        name=f"web_lgsm_install_{server_id}",
+    container.queue_job().execute(
+        container.run_command().execute,
+        (cmd, None, server_id),
+        name="install",
+        server_id=server_id,
+        priority="low",
+        app_context=current_app.app_context(),
     )
-    install_daemon.start()
 
-    clear_daemon = Thread(
-        target=container.clear_install_buffer_output().execute,
-        args=(server_id, current_app.app_context()),
-        daemon=True,
-        name=f"clear_install_{server_id}",
+    # Queued behind the install for the same server, so only runs once it's
+    # done.
+    container.queue_job().execute(
+        container.clear_install_buffer_output().execute,
+        (server_id, None),
+        name="clear_install",
+        server_id=server_id,
+        priority="low",
+        app_context=current_app.app_context(),
     )
-    clear_daemon.start()
 
     container.log_audit_event().execute(current_user.id,  f"User '{current_user.username}', installed game server '{install_name}'")
 
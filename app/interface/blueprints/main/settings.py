@@ -1,4 +1,3 @@
-from threading import Thread
 from flask_login import login_required, current_user
 from flask import (
     render_template,
@@ -127,13 +126,13 @@ def settings():
         flash(status)
 
         cmd = ["./web-lgsm.py", "--restart"]
-        restart_daemon = Thread(
-            target=container.run_command().execute,
-            args=(cmd, None, str(uuid.uuid4()), current_app.app_context()),
-            daemon=True,
+        container.queue_job().execute(
+            container.run_command().execute,
+            (cmd, None, str(uuid.uuid4())),
             name="restart",
+            priority="high",
+            app_context=current_app.app_context(),
         )
-        restart_daemon.start()
         return redirect(url_for("main.settings"))
 
     flash("Settings Updated!")
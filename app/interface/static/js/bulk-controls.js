@@ -0,0 +1,74 @@
+let bulkControlBtn = document.getElementById("bulk-control-btn");
+if (bulkControlBtn) {
+  bulkControlBtn.addEventListener('click', async function() {
+    const control = document.getElementById("bulk-control-select").value;
+
+    // Get all checked toggles.
+    const checkboxes = document.querySelectorAll('input[name="server_id"]:checked');
+    const serverIds = Array.from(checkboxes).map(checkbox => checkbox.value);
+
+    if (serverIds.length === 0) {
+        alert(`No servers selected to ${control}.`);
+        return;
+    }
+
+    if (!confirm(`Are you sure you want to ${control} ${serverIds.length} server(s)?`)) {
+        return;
+    }
+
+    showSpinners();
+    try {
+        const response = await fetch('/api/bulk-controls', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ control: control, server_ids: serverIds })
+        });
+        const data = await response.json();
+
+        if (!response.ok) {
+            throw new Error(data.Error);
+        }
+
+        showAlert(`Running ${control} on ${serverIds.length} server(s)...`, 'info');
+        pollBulkJob(data.job_id);
+
+    } catch (error) {
+        hideSpinners();
+        showAlert(`Error: ${error.message}`, 'danger');
+    }
+  });
+};
+
+// Poll job progress until every server's finished.
+async function pollBulkJob(jobId) {
+  let since = 0;
+
+  while (true) {
+    try {
+      const response = await fetch(`/api/bulk-controls/${jobId}?since=${since}`);
+      const job = await response.json();
+
+      if (!response.ok) {
+          throw new Error(job.Error);
+      }
+
+      since = job.seq;
+      job.stdout.filter(line => !line.trim().endsWith(': started')).forEach(line => {
+          const type = line.trim().endsWith(': failed') ? 'danger' : 'success';
+          showAlert(line, type);
+      });
+
+      if (!job.process_lock) {
+          hideSpinners();
+          return;
+      }
+
+    } catch (error) {
+      hideSpinners();
+      showAlert(`Error: ${error.message}`, 'danger');
+      return;
+    }
+
+    await new Promise(resolve => setTimeout(resolve, 2000));
+  }
+}
@@ -26,25 +26,58 @@ function updateStatusIndicator(serverId, status) {
 }
 
 
-// Function to fetch all server statuses
+// Function to fetch all server statuses in one batched request
 function getServerStatus() {
 
+  const serverIds = [];
+
   $('.status-indicator').each(function () {
 
     const serverId = $(this).data('server-id');
 
     if (!serverId) return;
 
-    $.getJSON(`/api/server-status/${serverId}`, function (data) {
-      updateStatusIndicator(serverId, data.status);
-    });
+    serverIds.push(serverId);
+
+  });
 
+  if (!serverIds.length) return;
+
+  $.getJSON('/api/server-status', { ids: serverIds.join(',') }, function (data) {
+    $.each(data, function (serverId, status) {
+      updateStatusIndicator(serverId, status);
+    });
   });
 }
 
 
+// Subscribe to status changes pushed by the server's background poller.
+function streamServerStatus() {
+
+  if (!window.EventSource) return null;
+
+  const statusStream = new EventSource('/api/server-status-stream');
+
+  statusStream.onmessage = function (event) {
+    const data = JSON.parse(event.data);
+    updateStatusIndicator(data.id, data.status);
+  };
+
+  return statusStream;
+}
+
+
 // Initial load
 getServerStatus();
 
-// Refresh every 5 minutes
-setInterval(getServerStatus, 300000);
+// Streams hold a server thread open per page, so are opt in (status_stream).
+// Otherwise re-fetch as often as the background poller refreshes, that's
+// just a cache read server side. With no poller, every fetch is a live check,
+// so only refresh every 5 minutes.
+var statusStream = statusStreamEnabled ? streamServerStatus() : null;
+
+if (statusStream || !statusPollInterval) {
+  setInterval(getServerStatus, 300000);
+} else {
+  setInterval(getServerStatus, statusPollInterval * 1000);
+}
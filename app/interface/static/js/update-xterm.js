@@ -1,8 +1,5 @@
-// Track the last line processed.
-//let lastProcessedIndex = 0;
-// Keep track of last pulled output as source of truth.
-let previousStdOutput = [];
-let previousStdErrput = [];
+// Seq cursor of the last output line pulled, server only sends what's newer.
+let outputSeq = null;
 
 /* OLD THEME */
 var term = new Terminal({
@@ -70,22 +67,48 @@ document.addEventListener('DOMContentLoaded', () => {
   if (div) resizeObserver.observe(div);
 });
 
-function refreshOutput(sId) {
-  return $.ajax({
-    url: '/api/update-console/' + sId,
-    type: 'POST',
-    error: function(reqObj, textStatus, errorThrown) {
+// Live console output, pushed from the server as new pane lines show up.
+function streamConsole(sId) {
+  const source = new EventSource('/api/console-stream/' + sId);
+
+  source.onmessage = function(event) {
+    const respJSON = JSON.parse(event.data);
+
+    if (respJSON.Error) {
       // Send errors to the console.
-      term.write(textStatus + '\n' + errorThrown);
-      clearInterval(interval);
+      term.write(`\r${respJSON.Error}\n`);
+      source.close();
+      hideSpinners();
+      return;
     }
-  });
+
+    // Stream couldn't pick up where the last one left off, start over.
+    if (respJSON.reset) {
+      term.reset();
+    }
+
+    (respJSON.lines || []).forEach(line => {
+      if (line.trim() !== '') {
+        term.write(`\r${line}`);
+      }
+    });
+  };
+
+  // Browser reconnects on its own, unless the server refused the stream.
+  source.onerror = function() {
+    if (source.readyState === EventSource.CLOSED) {
+      term.write('\rConsole stream closed!\n');
+      hideSpinners();
+    }
+  };
+
+  return source;
 }
 
 function updateTerminal(sId){
   return $.ajax({
     dataType: 'json',
-    url: '/api/cmd-output/' + sId,
+    url: '/api/cmd-output/' + sId + (outputSeq === null ? '' : '?since=' + outputSeq),
     type: 'GET',
 
     error: function(reqObj, textStatus, errorThrown) {
@@ -94,41 +117,29 @@ function updateTerminal(sId){
     },
     success: function(respJSON, textStatus, reqObj) {
 
-      // Extract stdout array from the JSON response.
-      const currentStdOutput = respJSON.stdout || [];
+      // Response only holds lines added since the last pull.
+      const newOutLines = respJSON.stdout || [];
 
-      // Find new lines by comparing with previousStdOutput.
-      const newOutLines = currentStdOutput.slice(previousStdOutput.length);
+      newOutLines.forEach(line => {
+        if (line.trim() !== '') {
+          term.write(`\r${line}`);
+        }
+      });
+
+      if ( showStderr ) {
+        const newErrLines = respJSON.stderr || [];
 
-      if (newOutLines.length > 0) {
-        newOutLines.forEach(line => {
+        newErrLines.forEach(line => {
           if (line.trim() !== '') {
-            term.write(`\r${line}`);
+            // Print "STDERR" red bold, before stderr text.
+            term.write(`\r\x1b[1m\x1b[31mSTDERR:\x1b[0m ${line}`);
           }
         });
-
-        // Update the previously processed output to the current output.
-        previousStdOutput = currentStdOutput;
       }
 
-      if ( showStderr ) {
-        // Extract stderr array from the JSON response.
-        const currentStdErrput = respJSON.stderr || [];
-
-        // Find new lines by comparing with previousStdErrput.
-        const newErrLines = currentStdErrput.slice(previousStdErrput.length);
-
-        if (newErrLines.length > 0) {
-          newErrLines.forEach(line => {
-            if (line.trim() !== '') {
-              // Print "STDERR" red bold, before stderr text.
-              term.write(`\r\x1b[1m\x1b[31mSTDERR:\x1b[0m ${line}`);
-            }
-          });
-
-          // Update the previously processed err output to the current output.
-          previousStdErrput = currentStdErrput;
-        }
+      // Move cursor up to the newest line pulled.
+      if (typeof respJSON.seq === 'number') {
+        outputSeq = respJSON.seq;
       }
 
       // If not in console mode, display none spinners after proc finishes.
@@ -149,13 +160,9 @@ function updateTerminal(sId){
 if (typeof serverId === 'undefined' || serverId === null || !serverId) {
   term.write('No Output Yet!\n\r');
 } else if (typeof sConsole !== 'undefined' && sConsole) {
-  // If live console output mode is enabled, start the loop.
+  // If live console output mode is enabled, start the stream.
   showSpinners();
-  var interval = setInterval(function() {
-    refreshOutput(serverId).then(function() {
-      return updateTerminal(serverId);
-    });
-  }, 5000);
+  var consoleStream = streamConsole(serverId);
 } else {
   var interval = setInterval(function() {
     updateTerminal(serverId);
@@ -16,7 +16,7 @@ import subprocess
 import threading
 
 from datetime import datetime, timedelta
-from flask import flash, current_app, send_file, send_from_directory, url_for, redirect
+from flask import flash, current_app, send_file, send_from_directory, url_for, redirect, Response
 
 from app import db
 from app import cache
@@ -166,3 +166,37 @@ def read_changelog():
     except Exception as e:
         return f"Problem reading CHANGELOG.md: {e}"
 
+
+
+def sse_response(subscription, retry, id_key=None):
+    """
+    Turns a stream subscription into a server-sent events response. Closes
+    the subscription once the client goes away or the stream ends.
+
+    Args:
+        subscription (SseSubscription): Subscription to stream events from.
+        retry (int): Milliseconds client should wait before reconnecting.
+        id_key (str): Event key to send as the event id, if any.
+
+    Returns:
+        Response: Flask text/event-stream response.
+    """
+    def event_stream():
+        try:
+            yield f"retry: {retry}\n\n"
+            for event in subscription:
+                # Comment line, keeps proxies from timing out idle streams.
+                if event == None:
+                    yield ": keepalive\n\n"
+                    continue
+
+                if id_key and id_key in event:
+                    yield f"id: {event[id_key]}\n"
+                yield f"data: {json.dumps(event)}\n\n"
+        finally:
+            subscription.close()
+
+    response = Response(event_stream(), status=200, mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
@@ -27,6 +27,7 @@ APP_PATH = ''  # <-- TO ME: REMEMBER TO MAKE EMPTY STRING AGAIN WHEN THIS SCRIPT
 sys.path.append(APP_PATH)
 from app import db
 from app.infrastructure.persistence.models.game_server_model import GameServerModel
+from app.infrastructure.persistence.sqlite_tuning import tune_sqlite_engine
 
 # Global options hash.
 O = {"dry": False, "delete": False}
@@ -50,6 +51,14 @@ def print_help(msg=None):
     exit()
 
 
+def db_engine():
+    """
+    Engine for app's DB, with the same sqlite settings the app uses, so
+    writes from here wait on the app's instead of failing as locked.
+    """
+    return tune_sqlite_engine(create_engine('sqlite:///app/database.db'))
+
+
 def db_fetch(item_id):
     """
     Connects to app's DB and returns either GameServerModel object that
@@ -60,7 +69,7 @@ def db_fetch(item_id):
     Returns:
         GameServerModel: GameServerModel object matching ID.
     """
-    engine = create_engine('sqlite:///app/database.db')
+    engine = db_engine()
     
     # Use new db session context.
     # Can't use app context in ansible connector.
@@ -135,7 +144,7 @@ def run_cmd(cmd, exec_dir=os.getcwd()):
 def mark_install_failed(server_id):
     """Mark failed with new session context."""
     # Can't use app context in ansible connector.
-    engine = create_engine('sqlite:///app/database.db')
+    engine = db_engine()
     with Session(engine) as session:
         server = session.get(GameServerModel, server_id)
         server.install_finished = True
@@ -235,7 +244,7 @@ def run_install_new_game_server(server_id):
 
     # Mark finished with new session context.
     # Can't use app context in ansible connector.
-    engine = create_engine('sqlite:///app/database.db')
+    engine = db_engine()
     with Session(engine) as session:
         server = session.get(GameServerModel, server_id)
         server.install_finished = True
@@ -0,0 +1,99 @@
+import gc
+import os
+import json
+import time
+
+import pytest
+
+# Baselines are throughput numbers for whatever machine they were recorded on,
+# so they're kept out of git. First run records them, --benchmark-save
+# re-records them (eg. after a deliberate speedup).
+BASELINES = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+RESULTS = []
+
+
+def load_baselines():
+    if not os.path.isfile(BASELINES):
+        return dict()
+
+    with open(BASELINES, "r") as f:
+        return json.load(f)
+
+
+def save_baseline(name, throughput):
+    baselines = load_baselines()
+    baselines[name] = round(throughput, 1)
+
+    with open(BASELINES, "w") as f:
+        json.dump(baselines, f, indent=4, sort_keys=True)
+
+
+class Bench:
+    def __init__(self, config):
+        self.save = config.getoption("--benchmark-save")
+        self.threshold = config.getoption("--benchmark-threshold")
+
+    def __call__(self, name, func, items, setup=None, rounds=5):
+        """
+        Times func and checks its throughput against the recorded baseline.
+        Best of rounds is used, being the least disturbed by whatever else
+        the machine is doing.
+
+        Args:
+            name (str): Baseline key for the benchmark.
+            func (callable): Code under test, called with whatever setup
+                             returns.
+            items (int): Units of work (lines, jobs, etc.) done per call.
+            setup (callable): Optional function returning a fresh tuple of
+                              args for each round, not timed.
+            rounds (int): Number of times to run func.
+        Returns:
+            float: Items per second.
+        """
+        best = None
+        for _ in range(rounds):
+            args = setup() if setup else ()
+
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                func(*args)
+                elapsed = time.perf_counter() - start
+            finally:
+                gc.enable()
+
+            best = elapsed if best is None else min(best, elapsed)
+
+        throughput = items / best
+        baseline = load_baselines().get(name)
+        RESULTS.append((name, throughput, baseline))
+
+        if self.save or baseline is None:
+            save_baseline(name, throughput)
+            return throughput
+
+        floor = baseline * (1 - self.threshold)
+        assert throughput >= floor, \
+            f"{name}: {throughput:,.0f}/s is more than {self.threshold:.0%} below baseline of {baseline:,.0f}/s"
+
+        return throughput
+
+
+@pytest.fixture
+def bench(request):
+    return Bench(request.config)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not RESULTS:
+        return
+
+    terminalreporter.section("benchmarks")
+    for name, throughput, baseline in RESULTS:
+        if baseline is None:
+            change = "new baseline"
+        else:
+            change = f"{(throughput - baseline) / baseline:+.1%} vs {baseline:,.0f}/s"
+        terminalreporter.write_line(f"{name:<40} {throughput:>14,.0f}/s  {change}")
@@ -0,0 +1,50 @@
+import uuid
+
+import pytest
+
+from app.infrastructure.system.cron.cron_scheduler import CronScheduler
+
+pytestmark = pytest.mark.benchmark
+
+JOBS = 5000
+
+
+class FakeCronRepo:
+    def __init__(self):
+        self.updated = 0
+
+    def update(self, job):
+        self.updated += 1
+
+
+def make_crontab(jobs, target_uuid):
+    """
+    Crontab with a mix of managed jobs (both the inline and older Ansible
+    comment styles), jobs for other servers, unmanaged jobs, and junk.
+    """
+    other_uuid = str(uuid.uuid4())
+    lines = ["# m h  dom mon dow   command", "MAILTO=\"\""]
+    for i in range(jobs):
+        server_id = target_uuid if i % 2 == 0 else other_uuid
+        if i % 4 == 0:
+            lines.append(f"*/5 * * * * /home/user/gs/mcserver restart #{server_id}, {i}, job {i}")
+        elif i % 4 == 1:
+            lines.append(f"#Ansible: {server_id}, {i}, job {i}")
+            lines.append(f"0 {i % 24} * * 1-5 /home/user/gs/mcserver backup")
+        elif i % 4 == 2:
+            lines.append(f"30 2 * * * /usr/bin/find /tmp -mtime +{i % 30} -delete")
+        else:
+            lines.append("")
+            lines.append(f"bad schedule {i}")
+    return "\n".join(lines)
+
+
+def test_parse_cron_jobs(bench):
+    target_uuid = str(uuid.uuid4())
+    cron_text = make_crontab(JOBS, target_uuid)
+    scheduler = CronScheduler(None, None, None, FakeCronRepo())
+
+    jobs = scheduler.parse_cron_jobs(cron_text, target_uuid)
+    assert len(jobs) == JOBS // 2
+
+    bench("parse_cron_jobs", scheduler.parse_cron_jobs, JOBS, setup=lambda: (cron_text, target_uuid))
@@ -0,0 +1,98 @@
+import sys
+
+import pytest
+
+from app.domain.entities.proc_info import ProcInfo
+from app.infrastructure.system.command_executor.execution_profile import ExecutionProfile
+
+pytestmark = pytest.mark.benchmark
+
+LINES = 100000
+
+
+class FakeConfig:
+    def getboolean(self, section, option, fallback=None):
+        return fallback
+
+    def getint(self, section, option, fallback=None):
+        return fallback
+
+    def get(self, section, option, fallback=None):
+        return fallback
+
+
+class FakeProcInfoRepo:
+    def get(self, cmd_id, create=False, since=None):
+        return ProcInfo()
+
+
+def make_output(lines):
+    """Mix of plain lines, progress bar updates, and dos line endings."""
+    output = []
+    for i in range(lines):
+        if i % 10 == 0:
+            output.append(f"Downloading {i % 100}%\r")
+        elif i % 7 == 0:
+            output.append(f"[ INFO ] Checking server files {i}\r\n")
+        else:
+            output.append(f"line {i} of steady server output\n")
+    return "".join(output)
+
+
+@pytest.mark.parametrize("end_in_newlines", [False, True])
+def test_process_raw_output(bench, end_in_newlines):
+    from app.infrastructure.system.command_executor.local_command_executor import LocalCommandExecutor
+
+    executor = LocalCommandExecutor(FakeConfig())
+    profile = ExecutionProfile(end_in_newlines=end_in_newlines)
+
+    # Fed in pipe sized chunks, like it is when reading from a process.
+    raw = make_output(LINES)
+    chunks = [raw[i:i + 65536] for i in range(0, len(raw), 65536)]
+
+    def process(proc_info):
+        for chunk in chunks:
+            executor._process_raw_output(chunk, proc_info, "stdout", profile)
+
+    bench(f"process_raw_output[end_in_newlines={end_in_newlines}]", process, LINES,
+          setup=lambda: (ProcInfo(),))
+
+
+def test_local_run(bench):
+    from app.infrastructure.system.command_executor.local_command_executor import LocalCommandExecutor
+
+    executor = LocalCommandExecutor(FakeConfig())
+    executor.proc_info_repo = FakeProcInfoRepo()
+
+    # Chatty child process, a tenth of its output on stderr.
+    script = (
+        "import sys\n"
+        f"for i in range({LINES}):\n"
+        "    out = sys.stderr if i % 10 == 0 else sys.stdout\n"
+        "    out.write(f'line {i} of steady server output\\n')\n"
+    )
+    cmd = [sys.executable, "-c", script]
+
+    # Lines straddling two reads come out in two pieces, so at least LINES.
+    proc_info = executor.run(cmd, profile=ExecutionProfile())
+    assert proc_info.exit_status == 0
+    assert len(proc_info.stdout) + len(proc_info.stderr) >= LINES
+
+    bench("local_run", lambda: executor.run(cmd, profile=ExecutionProfile()), LINES, rounds=3)
+
+
+@pytest.mark.parametrize("output_type", ["stdout", "stderr"])
+def test_process_ssh_chunk(bench, output_type):
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    executor = SshCommandExecutor(FakeConfig(), None)
+    profile = ExecutionProfile()
+
+    # Smaller than the local runs, stderr dedup makes this the slow path.
+    lines = LINES // 10
+    chunk = make_output(lines)
+
+    def process(proc_info):
+        executor._process_ssh_chunk(chunk, proc_info, output_type, profile=profile)
+
+    bench(f"process_ssh_chunk[{output_type}]", process, lines, setup=lambda: (ProcInfo(),))
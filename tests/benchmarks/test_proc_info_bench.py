@@ -0,0 +1,37 @@
+import pytest
+
+from app.domain.entities.proc_info import ProcInfo
+
+pytestmark = pytest.mark.benchmark
+
+
+def make_proc_info(lines):
+    proc_info = ProcInfo()
+    for i in range(lines):
+        proc_info.stdout.append(f"line {i} of steady server output\n")
+        if i % 10 == 0:
+            proc_info.stderr.append(f"warning {i}\n")
+    return proc_info
+
+
+@pytest.mark.parametrize("lines", [1000, 10000, 100000])
+def test_to_json(bench, lines):
+    proc_info = make_proc_info(lines)
+    rounds = 3 if lines >= 100000 else 5
+
+    bench(f"proc_info_to_json[{lines}]", proc_info.toJSON, lines, rounds=rounds)
+
+
+@pytest.mark.parametrize("lines", [1000, 10000, 100000])
+def test_to_json_since(bench, lines):
+    proc_info = make_proc_info(lines)
+
+    # Polling client that's only behind by the last hundred lines.
+    since = proc_info.seq - 100
+
+    def poll():
+        for _ in range(100):
+            proc_info.toJSON(since)
+
+    # Counted in polls, cost should stay flat however big the buffer gets.
+    bench(f"proc_info_to_json_since[{lines}]", poll, 100)
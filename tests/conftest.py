@@ -18,10 +18,33 @@ from app.infrastructure.system.cron.cron_scheduler import CronScheduler
 from utils import *
 
 
+def pytest_addoption(parser):
+    parser.addoption("--benchmark", action="store_true", help="run benchmarks in tests/benchmarks")
+    parser.addoption("--benchmark-save", action="store_true", help="record new benchmark baselines instead of comparing")
+    parser.addoption("--benchmark-threshold", type=float, default=0.25, help="max allowed drop in throughput vs baseline (default 0.25)")
+
+
+def pytest_collection_modifyitems(config, items):
+    # Timings are too noisy to run along with the rest of the suite.
+    if config.getoption("--benchmark") or config.getoption("--benchmark-save"):
+        return
+
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture
 def app():
     app = create_app()
     app.config.update({"TESTING": True})
+
+    # Db gets rebuilt per test, don't let cached users carry over.
+    from app import cache
+    with app.app_context():
+        cache.clear()
+
     yield app
 
 
@@ -72,6 +72,30 @@ def test_update_console_invalid_id(authed_client):
         check_api_response(response, 400, {"Error": "Supplied server does not exist!"})
 
 
+### ConsoleStream API tests
+def test_console_stream_no_auth(client, add_mock_server, test_vars):
+    """Test ConsoleStream without authentication"""
+    server_id = get_server_id(test_vars["test_server"])
+    with client:
+        response = client.get(f"/api/console-stream/{server_id}")
+        check_api_response(response, 302)
+
+
+def test_console_stream_no_perms(user_authed_client_no_perms, add_mock_server, test_vars):
+    """Test ConsoleStream without permissions"""
+    server_id = get_server_id(test_vars["test_server"])
+    with user_authed_client_no_perms:
+        response = user_authed_client_no_perms.get(f"/api/console-stream/{server_id}")
+        check_api_response(response, 403, {"Error": "Permission denied!"})
+
+
+def test_console_stream_invalid_id(authed_client):
+    """Test ConsoleStream with invalid server ID"""
+    with authed_client:
+        response = authed_client.get("/api/console-stream/nonexistent")
+        check_api_response(response, 400, {"Error": "Supplied server does not exist!"})
+
+
 ### ServerStatus API tests
 def test_server_status_no_auth(client, add_mock_server, test_vars):
     """Test ServerStatus without authentication"""
@@ -108,6 +132,130 @@ def test_server_status_success(authed_client, add_mock_server, test_vars):
         assert response_data["id"] == server_id
 
 
+def test_server_statuses_no_auth(client):
+    """Test ServerStatuses without authentication"""
+    with client:
+        response = client.get("/api/server-status")
+        check_api_response(response, 302)
+
+
+def test_server_statuses_no_perms(user_authed_client_no_perms, add_mock_server, test_vars):
+    """Test ServerStatuses leaves out servers user can't access"""
+    server_id = get_server_id(test_vars["test_server"])
+    with user_authed_client_no_perms:
+        response = user_authed_client_no_perms.get(f"/api/server-status?ids={server_id}")
+        assert response.status_code == 200
+        assert json.loads(response.data) == {}
+
+
+def test_server_statuses_success(authed_client, add_mock_server, test_vars):
+    """Test successful ServerStatuses, by ids and for all visible servers"""
+    server_id = get_server_id(test_vars["test_server"])
+    with authed_client:
+        response = authed_client.get(f"/api/server-status?ids={server_id},invalid")
+        response_data = json.loads(response.data)
+        assert response.status_code == 200
+        assert list(response_data) == [server_id]
+
+        response = authed_client.get("/api/server-status")
+        response_data = json.loads(response.data)
+        assert response.status_code == 200
+        assert server_id in response_data
+
+
+def test_server_status_stream_no_auth(client):
+    """Test ServerStatusStream without authentication"""
+    with client:
+        response = client.get("/api/server-status-stream")
+        check_api_response(response, 302)
+
+
+def test_server_status_stream_disabled(authed_client):
+    """Test ServerStatusStream is off by default"""
+    with authed_client:
+        response = authed_client.get("/api/server-status-stream")
+        check_api_response(response, 403, {"Error": "Status stream disabled!"})
+
+
+### BulkControls API tests
+def test_bulk_controls_no_auth(client):
+    """Test BulkControls without authentication"""
+    with client:
+        response = client.post("/api/bulk-controls", json={"control": "start", "server_ids": []})
+        check_api_response(response, 302)
+
+
+def test_bulk_controls_invalid(authed_client, add_mock_server, test_vars):
+    """Test BulkControls with a bad control, no servers, and a bad server id"""
+    server_id = get_server_id(test_vars["test_server"])
+    with authed_client:
+        response = authed_client.post("/api/bulk-controls", json={"control": "console", "server_ids": [server_id]})
+        assert response.status_code == 400
+
+        response = authed_client.post("/api/bulk-controls", json={"control": "start", "server_ids": []})
+        check_api_response(response, 400, {"Error": "No servers selected!"})
+
+        response = authed_client.post("/api/bulk-controls", json={"control": "start", "server_ids": [server_id, "invalid"]})
+        check_api_response(response, 400, {"Error": "Invalid id: invalid"})
+
+
+def test_bulk_controls_no_perms(user_authed_client_no_perms, add_mock_server, test_vars):
+    """Test BulkControls without permissions"""
+    server_id = get_server_id(test_vars["test_server"])
+    with user_authed_client_no_perms:
+        response = user_authed_client_no_perms.post("/api/bulk-controls", json={"control": "start", "server_ids": [server_id]})
+        assert response.status_code == 403
+
+        response = user_authed_client_no_perms.get("/api/bulk-controls/bulk-invalid")
+        check_api_response(response, 403, {"Error": "Permission Denied!"})
+
+
+def test_bulk_controls_job_not_found(authed_client):
+    """Test BulkControlsJob for jobs that don't exist"""
+    with authed_client:
+        response = authed_client.get("/api/bulk-controls/bulk-invalid")
+        check_api_response(response, 404, {"Error": "Job not found!"})
+
+
+def test_bulk_controls_job_other_user(authed_client, test_vars):
+    """Test BulkControlsJob only shows jobs to the user that submitted them"""
+    from app.infrastructure.system.repositories.proc_info_repo import get_proc_info_repository
+
+    user_id = UserModel.query.filter_by(username=test_vars["username"]).first().id
+    repo = get_proc_info_repository()
+    own_job = f"bulk-{user_id}-0b7e5a52-6c1f-4b8e-9a43-0d1a9f2c3e55"
+    other_job = f"bulk-{user_id + 1}-0b7e5a52-6c1f-4b8e-9a43-0d1a9f2c3e55"
+    repo.get(own_job, create=True)
+    repo.get(other_job, create=True)
+
+    with authed_client:
+        response = authed_client.get(f"/api/bulk-controls/{own_job}")
+        assert response.status_code == 200
+
+        response = authed_client.get(f"/api/bulk-controls/{other_job}")
+        check_api_response(response, 404, {"Error": "Job not found!"})
+
+    repo.remove(own_job)
+    repo.remove(other_job)
+
+
+### JobQueue API tests
+def test_job_queue_no_auth(client):
+    """Test JobQueue without authentication"""
+    with client:
+        response = client.get("/api/job-queue")
+        check_api_response(response, 302)
+
+
+def test_job_queue_success(authed_client):
+    """Test successful JobQueue"""
+    with authed_client:
+        response = authed_client.get("/api/job-queue")
+        response_data = json.loads(response.data)
+        assert response.status_code == 200
+        assert set(response_data) == {"running", "queued"}
+
+
 ### SystemUsage API tests
 def test_system_usage_no_auth(client):
     """Test SystemUsage without authentication"""
@@ -381,6 +529,23 @@ def test_post_server_list_order(authed_client, add_mock_server, test_vars):
         response_data = json.loads(response.data)
         assert response_data == { "success": "Sort order updated successfully"}
 
+
+def test_post_server_list_order_invalid(authed_client, add_mock_server, test_vars):
+    """Test POST update-order with bad data"""
+    server_id = get_server_id(test_vars["test_server"])
+    with authed_client:
+        for payload in [{}, {"order": "nope"}, {"order": [{"name": "no id"}]}, ["order"]]:
+            response = authed_client.post("/api/update-order", json=payload)
+            assert response.status_code == 400
+            assert json.loads(response.data) == {"Error": "Invalid order data"}
+
+        response = authed_client.post(
+            "/api/update-order",
+            json={"order": [{"id": server_id}, {"id": "not-a-server"}]}
+        )
+        assert response.status_code == 400
+        assert json.loads(response.data) == {"Error": "Unknown game server id in order"}
+
 def test_load_spec(authed_client, add_mock_server, test_vars):
     with authed_client:
         response = authed_client.get("/api/spec")
@@ -394,8 +559,13 @@ def test_load_spec(authed_client, add_mock_server, test_vars):
 
         # check a few important routes exist
         assert "/cmd-output/{server_id}" in paths
+        assert "/console-stream/{server_id}" in paths
         assert "/cron/{server_id}" in paths
         assert "/server-status/{server_id}" in paths
+        assert "/server-status" in paths
+        assert "/server-status-stream" in paths
+        assert "/bulk-controls" in paths
+        assert "/job-queue" in paths
         assert "/system-usage" in paths
 
         # optional: check methods exist for a route
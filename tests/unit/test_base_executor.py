@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from app.domain.entities.proc_info import ProcInfo
+from app.infrastructure.system.command_executor.execution_profile import ExecutionProfile
+
+
+# Raw chunk -> expected lines, for end_in_newlines off and on.
+GOLDEN = [
+    ("", [], []),
+    ("\n", [], []),
+    ("\r\n\r\n", [], []),
+    ("hello\n", ["hello\n"], ["hello\n"]),
+    ("a\nb\nc\n", ["a\n", "b\n", "c\n"], ["a\n", "b\n", "c\n"]),
+    ("partial", ["partial\r"], ["partial\r\n"]),
+    ("a\nb", ["a\n", "b\r"], ["a\n", "b\r\n"]),
+    ("dos\r\nline\r\n", ["dos\r", "line\r"], ["dos\r\n", "line\r\n"]),
+    ("10%\r20%\r30%\r", ["10%\r", "20%\r", "30%\r"], ["10%\r\n", "20%\r\n", "30%\r\n"]),
+    ("10%\r20%\rdone\n", ["10%\r", "20%\r", "done\n"], ["10%\r\n", "20%\r\n", "done\n"]),
+    ("\n\nblank\n\n\nlines\n", ["blank\n", "lines\n"], ["blank\n", "lines\n"]),
+    ("\r\rcr\r\r", ["cr\r"], ["cr\r\n"]),
+    ("a\n\rb\r\nc", ["a\n", "b\r", "c\r"], ["a\n", "b\r\n", "c\r\n"]),
+    ("  spaces  \n\ttab\n", ["  spaces  \n", "\ttab\n"], ["  spaces  \n", "\ttab\n"]),
+    ("unié✓\nx", ["unié✓\n", "x\r"], ["unié✓\n", "x\r\n"]),
+    ("form\x0bfeed\x0cnot\x1cline\n", ["form\x0bfeed\x0cnot\x1cline\n"], ["form\x0bfeed\x0cnot\x1cline\n"]),
+]
+
+
+def legacy_split(raw_line, end_in_newlines):
+    """The old two level split, kept as the reference the new one must match."""
+    lines = []
+    for rline in raw_line.split("\r"):
+        if rline == "":
+            continue
+
+        if not rline.endswith("\r") and not rline.endswith("\n"):
+            rline = rline + "\r"
+
+        for line in rline.split("\n"):
+            if line == "":
+                continue
+
+            if not line.endswith("\n") and not line.endswith("\r"):
+                line = line + "\n"
+
+            if end_in_newlines and not line.endswith("\n"):
+                line = line + "\n"
+
+            lines.append(line)
+
+    return lines
+
+
+def make_executor():
+    from app.infrastructure.system.command_executor.local_command_executor import LocalCommandExecutor
+
+    return LocalCommandExecutor(None)
+
+
+def split(raw, end_in_newlines=False, output_type="stdout"):
+    proc_info = ProcInfo()
+    profile = ExecutionProfile(end_in_newlines=end_in_newlines)
+    make_executor()._process_raw_output(raw, proc_info, output_type, profile)
+    return proc_info.stdout if output_type == "stdout" else proc_info.stderr
+
+
+@pytest.mark.parametrize("raw, expected, expected_newlines", GOLDEN)
+def test_golden(raw, expected, expected_newlines):
+    assert split(raw) == expected
+    assert split(raw, end_in_newlines=True) == expected_newlines
+    assert split(raw, output_type="stderr") == expected
+
+
+@pytest.mark.parametrize("raw, expected, expected_newlines", GOLDEN)
+def test_golden_matches_legacy(raw, expected, expected_newlines):
+    assert legacy_split(raw, False) == expected
+    assert legacy_split(raw, True) == expected_newlines
+
+
+def test_matches_legacy_fuzz():
+    rand = random.Random(1234)
+    pieces = ["a", "bc", " ", "\r", "\n", "\r\n", "\n\r", "é"]
+
+    for _ in range(2000):
+        raw = "".join(rand.choice(pieces) for _ in range(rand.randint(0, 12)))
+        for end_in_newlines in (False, True):
+            assert split(raw, end_in_newlines) == legacy_split(raw, end_in_newlines), repr(raw)
+
+
+def test_no_log_strings_when_debug_off(monkeypatch):
+    executor = make_executor()
+    calls = []
+    monkeypatch.setattr(executor, "_log_wrap", lambda *args: calls.append(args) or "")
+    monkeypatch.setattr(executor.logger, "isEnabledFor", lambda level: False)
+
+    executor._process_raw_output("a\nb\n", ProcInfo(), "stderr", ExecutionProfile())
+    assert calls == []
+
+    monkeypatch.setattr(executor.logger, "isEnabledFor", lambda level: True)
+    executor._process_raw_output("a\nb\n", ProcInfo(), "stderr", ExecutionProfile())
+    assert len(calls) == 2
@@ -1,7 +1,36 @@
+import pytest
+import threading
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+        self.keepalive = None
+
+    def is_active(self):
+        return self.active
+
+    def send_ignore(self):
+        if not self.active:
+            raise EOFError()
+
+    def set_keepalive(self, interval):
+        self.keepalive = interval
+
+
+class FakeSFTPClient:
+    class sock:
+        closed = False
+
+    def close(self):
+        self.closed = True
+
+
 class FakeParamikoClient:
     def __init__(self):
         self.connected = False
         self.exec_called = False
+        self.transport = FakeTransport()
 
     def set_missing_host_key_policy(self, policy):
         pass
@@ -17,9 +46,27 @@ class FakeParamikoClient:
         self.exec_called = True
         return None
 
+    def get_transport(self):
+        return self.transport
+
+    def open_sftp(self):
+        self.sftp_opened = getattr(self, "sftp_opened", 0) + 1
+        return FakeSFTPClient()
+
     def close(self):
         self.closed = True
 
+
+@pytest.fixture(autouse=True)
+def fresh_pool(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    monkeypatch.setattr(SSHClientInterface, "connections", dict())
+    monkeypatch.setattr(SSHClientInterface, "in_use", dict())
+    monkeypatch.setattr(SSHClientInterface, "connect_locks", dict())
+    monkeypatch.setattr(SSHClientInterface, "host_slots", dict())
+    monkeypatch.setattr(SSHClientInterface, "sftp_clients", dict())
+
 def test_get_client_success(monkeypatch):
     from app.infrastructure.system.ssh.client import SSHClientInterface
 
@@ -36,7 +83,8 @@ def test_get_client_success(monkeypatch):
 
     assert client is fake_client
     assert fake_client.connected is True
-    assert fake_client.exec_called is True
+    assert fake_client.exec_called is False
+    assert fake_client.transport.keepalive
 
 def test_get_client_is_cached(monkeypatch):
     from app.infrastructure.system.ssh.client import SSHClientInterface
@@ -58,12 +106,11 @@ def test_get_client_is_cached(monkeypatch):
     assert c1 is c2
     assert len(created_clients) == 1
 
-def test_healthcheck_failure_closes_client(monkeypatch):
+def test_connect_failure_closes_client(monkeypatch):
     from app.infrastructure.system.ssh.client import SSHClientInterface
-    import pytest
 
     class FailingClient(FakeParamikoClient):
-        def exec_command(self, *args, **kwargs):
+        def connect(self, *args, **kwargs):
             raise Exception("boom")
 
     client = FailingClient()
@@ -77,6 +124,128 @@ def test_healthcheck_failure_closes_client(monkeypatch):
 
     assert hasattr(client, "closed")
 
+def test_dead_connection_reconnects(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    created_clients = []
+
+    def factory():
+        c = FakeParamikoClient()
+        created_clients.append(c)
+        return c
+
+    monkeypatch.setattr("paramiko.SSHClient", factory)
+
+    interface = SSHClientInterface()
+
+    c1 = interface.get_client("user", "host")
+    c1.transport.active = False
+    c2 = interface.get_client("user", "host")
+
+    assert c2 is not c1
+    assert hasattr(c1, "closed")
+    assert len(created_clients) == 2
+
+def test_idle_connection_closed(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    monkeypatch.setattr("paramiko.SSHClient", FakeParamikoClient)
+
+    interface = SSHClientInterface()
+
+    c1 = interface.get_client("user", "host")
+    key = ("user", "host", None)
+    SSHClientInterface.connections[key] = (c1, 0)
+
+    c2 = interface.get_client("user", "host")
+
+    assert c2 is not c1
+    assert hasattr(c1, "closed")
+
+def test_busy_connection_not_idle(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    monkeypatch.setattr("paramiko.SSHClient", FakeParamikoClient)
+
+    interface = SSHClientInterface()
+
+    with interface.session("user", "host") as c1:
+        SSHClientInterface.connections[("user", "host", None)] = (c1, 0)
+        c2 = interface.get_client("user", "host")
+
+    assert c2 is c1
+    assert not hasattr(c1, "closed")
+
+def test_session_limit_per_host(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    monkeypatch.setattr("paramiko.SSHClient", FakeParamikoClient)
+    monkeypatch.setattr(SSHClientInterface, "SLOT_TIMEOUT", 0.1)
+    SSHClientInterface.host_slots["host"] = threading.BoundedSemaphore(1)
+
+    interface = SSHClientInterface()
+
+    with interface.session("user", "host"):
+        with pytest.raises(Exception, match="Too many ssh sessions"):
+            with interface.session("user", "host"):
+                pass
+
+        # Other hosts aren't affected.
+        with interface.session("user", "other"):
+            pass
+
+    # Slot is given back afterwards.
+    with interface.session("user", "host"):
+        pass
+
+def test_session_error_drops_dead_connection(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    monkeypatch.setattr("paramiko.SSHClient", FakeParamikoClient)
+
+    interface = SSHClientInterface()
+
+    with pytest.raises(EOFError):
+        with interface.session("user", "host") as client:
+            client.transport.active = False
+            raise EOFError()
+
+    assert SSHClientInterface.connections == {}
+    assert SSHClientInterface.in_use == {}
+
+def test_sftp_session_reused(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    monkeypatch.setattr("paramiko.SSHClient", FakeParamikoClient)
+
+    interface = SSHClientInterface()
+
+    with interface.sftp("user", "host") as s1:
+        pass
+    with interface.sftp("user", "host") as s2:
+        pass
+
+    assert s1 is s2
+    assert interface.get_client("user", "host").sftp_opened == 1
+
+def test_sftp_session_dropped_with_connection(monkeypatch):
+    from app.infrastructure.system.ssh.client import SSHClientInterface
+
+    monkeypatch.setattr("paramiko.SSHClient", FakeParamikoClient)
+
+    interface = SSHClientInterface()
+
+    with interface.sftp("user", "host") as s1:
+        pass
+
+    interface.get_client("user", "host").transport.active = False
+
+    with interface.sftp("user", "host") as s2:
+        pass
+
+    assert s2 is not s1
+    assert hasattr(s1, "closed")
+
 def test_get_ssh_key_file_exists(tmp_path, monkeypatch):
     from app.infrastructure.system.ssh.client import SSHClientInterface
 
@@ -167,6 +167,74 @@ class TestConfigManager:
 
         self.cleanup_test_config()
 
+    def test_only_reparsed_on_change(self):
+        """Test config file is only re-read when it changes"""
+        config_file = self.create_test_config()
+        config = ConfigManager()
+        config.config_file = config_file
+        config.reload()
+
+        reads = []
+        real_read = config._config.read
+        config._config.read = lambda *args, **kwargs: reads.append(args) or real_read(*args, **kwargs)
+
+        for _ in range(100):
+            assert config.get('aesthetic', 'text_color') == '#0000ff'
+            assert config.getint('aesthetic', 'terminal_height') == 15
+            assert config.getboolean('settings', 'remove_files') is True
+        assert reads == []
+
+        # Modify the config file directly
+        direct_config = configparser.ConfigParser()
+        direct_config.read(config_file)
+        direct_config.set('aesthetic', 'text_color', '#00ff00')
+        with open(config_file, 'w') as f:
+            direct_config.write(f)
+
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert config.get('aesthetic', 'text_color') == '#00ff00'
+        assert len(reads) == 1
+
+        # Own writes don't need re-reading.
+        config.set('aesthetic', 'text_color', '#ff0000')
+        assert config.get('aesthetic', 'text_color') == '#ff0000'
+        assert len(reads) == 1
+
+        config.invalidate()
+        config.get('aesthetic', 'text_color')
+        assert len(reads) == 2
+
+        self.cleanup_test_config()
+
+    def test_parse_shared_between_instances(self):
+        """Test new instances reuse the already parsed config"""
+        config_file = self.create_test_config()
+        config = ConfigManager()
+        config.config_file = config_file
+        config.reload()
+
+        reads = []
+        real_read = config._config.read
+        config._config.read = lambda *args, **kwargs: reads.append(args) or real_read(*args, **kwargs)
+
+        other = ConfigManager()
+        other.config_file = config_file
+        assert other.get('aesthetic', 'text_color') == '#0000ff'
+        assert reads == []
+
+        # Writes and invalidation through one instance reach the others.
+        config.set('aesthetic', 'text_color', '#ff0000')
+        assert other.get('aesthetic', 'text_color') == '#ff0000'
+        assert reads == []
+
+        config.invalidate()
+        other.get('aesthetic', 'text_color')
+        assert len(reads) == 1
+
+        self.cleanup_test_config()
+
     def teardown_method(self):
         """Clean up after each test method"""
         self.cleanup_test_config()
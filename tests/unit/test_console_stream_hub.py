@@ -0,0 +1,196 @@
+class Server:
+    id = "stream1"
+    install_type = "local"
+    script_name = "mcserver"
+
+
+class FakeCommandExecutor:
+    """
+    Fakes capture-pane runs, returning canned pane contents. Captures can be
+    a (lines, history_size) pair, plain lists get a history_size of 0.
+    """
+    captures = []
+    cmds = []
+
+    def run(self, cmd, server=None, cmd_id=None, app_context=False):
+        from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+
+        FakeCommandExecutor.cmds.append(cmd)
+        proc_info = InMemProcInfoRepository().get(cmd_id, create=True)
+        capture = FakeCommandExecutor.captures.pop(0)
+        lines, history_size = capture if isinstance(capture, tuple) else (capture, 0)
+        proc_info.stdout.extend(lines + [f"{history_size}\n"])
+        proc_info.exit_status = 0
+        return proc_info
+
+
+def make_reader(monkeypatch):
+    from app.infrastructure.system.game_server import console_stream_hub
+    from app.infrastructure.system.game_server.console_stream_hub import ConsoleStreamHub, ConsoleStreamReader
+
+    monkeypatch.setattr(console_stream_hub, "CommandExecutor", FakeCommandExecutor)
+    monkeypatch.setattr(ConsoleStreamHub, "history", dict())
+    FakeCommandExecutor.captures = []
+    FakeCommandExecutor.cmds = []
+
+    return ConsoleStreamReader(ConsoleStreamHub(), Server(), ["tmux", "capture-pane"])
+
+
+def test_new_lines_only_returns_delta(monkeypatch):
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [
+        ["a\n", "b\n", "c\n", "d\n"],
+        ["b\n", "c\n", "d\n", "e\n", "f\n"],
+    ]
+
+    reader._poll(full=True)
+    reader._poll(full=False)
+
+    assert [line for _, line in reader.lines] == ["a\n", "b\n", "c\n", "d\n", "e\n", "f\n"]
+    assert [seq for seq, _ in reader.lines] == [1, 2, 3, 4, 5, 6]
+
+
+def test_new_lines_nothing_new(monkeypatch):
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [
+        ["a\n", "b\n"],
+        ["a\n", "b\n"],
+    ]
+
+    reader._poll(full=True)
+    reader._poll(full=False)
+
+    assert reader.seq == 2
+
+
+def test_new_lines_with_changing_bottom_line(monkeypatch):
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [
+        ["a\n", "b\n", "> \n"],
+        ["a\n", "b\n", "c\n", "> \n"],
+    ]
+
+    reader._poll(full=True)
+    reader._poll(full=False)
+
+    assert [line for _, line in reader.lines][-2:] == ["c\n", "> \n"]
+
+
+def test_new_lines_with_repeated_lines(monkeypatch):
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [
+        ["x\n", "Saving...\n", "Saving...\n", "Saving...\n"],
+        ["x\n", "Saving...\n", "Saving...\n", "Saving...\n", "Saving...\n", "Saving...\n"],
+    ]
+
+    reader._poll(full=True)
+    reader._poll(full=False)
+
+    # Anchor grows back to the "x" line to find where the old output ends.
+    assert reader.seq == 6
+
+
+def test_new_lines_all_repeated_goes_by_scroll(monkeypatch):
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [
+        (["Saving...\n"] * 5 + ["\n"], 10),
+        (["Saving...\n"] * 5 + ["\n"], 12),
+        (["Saving...\n"] * 5 + ["\n"], 12),
+    ]
+
+    reader._poll(full=True)
+    reader._poll(full=False)
+    assert reader.seq == 7
+
+    reader._poll(full=False)
+    assert reader.seq == 7
+
+
+def test_capture_range(monkeypatch):
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [["a\n"], ["a\n"]]
+
+    reader._poll(full=True)
+    reader._poll(full=False)
+
+    assert FakeCommandExecutor.cmds[0][2:7] == ["-S", "-", "-E", "-", "-J"]
+    assert FakeCommandExecutor.cmds[1][2:4] == ["-S", f"-{reader.hub.TAIL_LINES}"]
+    assert FakeCommandExecutor.cmds[1][-1] == "#{history_size}"
+
+
+def test_backlog_resumes_from_seq(monkeypatch):
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [["a\n", "b\n", "c\n"]]
+
+    reader._poll(full=True)
+
+    assert reader.backlog() == {"seq": 3, "lines": ["a\n", "b\n", "c\n"], "reset": True}
+    assert reader.backlog(last_seq=2) == {"seq": 3, "lines": ["c\n"]}
+    assert reader.backlog(last_seq=3) is None
+
+
+def test_backlog_resets_unknown_seq(monkeypatch):
+    reader = make_reader(monkeypatch)
+
+    # Seq from some other reader this one knows nothing about.
+    assert reader.backlog(last_seq=5) == {"seq": 0, "lines": [], "reset": True}
+
+
+def test_reconnect_after_reader_stops(monkeypatch):
+    from app.infrastructure.system.game_server.console_stream_hub import ConsoleStreamReader
+
+    reader = make_reader(monkeypatch)
+    FakeCommandExecutor.captures = [
+        ["a\n", "b\n", "c\n"],
+        ["a\n", "b\n", "c\n", "d\n"],
+    ]
+    reader._poll(full=True)
+
+    with reader.hub.lock:
+        reader._retire()
+
+    # Next reader's first full capture only picks up what's actually new.
+    restarted = ConsoleStreamReader(reader.hub, Server(), reader.cmd)
+    restarted._poll(full=True)
+
+    assert list(restarted.lines) == [(1, "a\n"), (2, "b\n"), (3, "c\n"), (4, "d\n")]
+    assert restarted.backlog(last_seq=3) == {"seq": 4, "lines": ["d\n"]}
+
+
+def test_publish_to_subscribers(monkeypatch):
+    from app.infrastructure.system.game_server.console_stream_hub import ConsoleSubscription
+
+    reader = make_reader(monkeypatch)
+    subscription = ConsoleSubscription(reader.hub, reader)
+    reader.subscribers.add(subscription)
+    FakeCommandExecutor.captures = [["a\n"]]
+
+    reader._poll(full=True)
+
+    assert subscription.queue.get_nowait() == {"seq": 1, "lines": ["a\n"]}
+
+
+def test_subscribe_capped(monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+    from app.infrastructure.system.game_server.console_stream_hub import ConsoleStreamHub, ConsoleSubscription
+
+    reader = make_reader(monkeypatch)
+    monkeypatch.setattr(ConsoleStreamHub, "readers", {Server.id: reader})
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 2)
+    # Keep the reader from actually starting.
+    monkeypatch.setattr(reader, "is_alive", lambda: True)
+
+    hub = ConsoleStreamHub()
+    first = hub.subscribe(Server())
+    assert not hub.full()
+    second = hub.subscribe(Server())
+
+    assert isinstance(first, ConsoleSubscription)
+    assert isinstance(second, ConsoleSubscription)
+    assert hub.full()
+    assert hub.subscribe(Server()) == None
+
+    # Closing a stream frees a slot up.
+    first.close()
+    assert not hub.full()
+    assert isinstance(hub.subscribe(Server()), ConsoleSubscription)
@@ -0,0 +1,172 @@
+import threading
+
+
+class Server:
+    def __init__(self, id, install_host="host1"):
+        self.id = id
+        self.install_name = f"server-{id}"
+        self.install_host = install_host
+
+
+class FakeCommandExecutor:
+    """Tracks how many commands are running per host at once."""
+    lock = threading.Lock()
+    running = dict()
+    max_running = dict()
+    release = threading.Event()
+    contexts = []
+
+    def run(self, cmd, server=None, cmd_id=None, app_context=False):
+        from flask import has_app_context
+        from app.domain.entities.proc_info import ProcInfo
+
+        FakeCommandExecutor.contexts.append(has_app_context())
+
+        host = server.install_host
+        with FakeCommandExecutor.lock:
+            FakeCommandExecutor.running[host] = FakeCommandExecutor.running.get(host, 0) + 1
+            FakeCommandExecutor.max_running[host] = max(
+                FakeCommandExecutor.max_running.get(host, 0), FakeCommandExecutor.running[host]
+            )
+
+        FakeCommandExecutor.release.wait(10)
+
+        with FakeCommandExecutor.lock:
+            FakeCommandExecutor.running[host] -= 1
+
+        if "fail" in server.id:
+            raise OSError("boom")
+
+        proc_info = ProcInfo()
+        proc_info.exit_status = int(cmd[-1])
+        return proc_info
+
+
+def make_executor(monkeypatch, workers=4, per_host=2):
+    import itertools
+    from app.infrastructure.system.config import ConfigManager
+    from app.infrastructure.system.command_executor import fan_out_executor
+    from app.infrastructure.system.command_executor.fan_out_executor import FanOutExecutor
+    from app.infrastructure.system.command_executor.job_runner import JobRunner
+    from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+
+    settings = {"job_runner_workers": workers, "job_runner_per_server": 1, "bulk_action_per_host": per_host}
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: settings.get(option, fallback))
+    monkeypatch.setattr(fan_out_executor, "CommandExecutor", FakeCommandExecutor)
+    monkeypatch.setattr(fan_out_executor, "get_proc_info_repository", InMemProcInfoRepository)
+    monkeypatch.setattr(JobRunner, "pool", None)
+    monkeypatch.setattr(JobRunner, "queue", [])
+    monkeypatch.setattr(JobRunner, "seq", itertools.count())
+    monkeypatch.setattr(JobRunner, "running", dict())
+    monkeypatch.setattr(JobRunner, "server_running", dict())
+    monkeypatch.setattr(FanOutExecutor, "host_running", dict())
+    monkeypatch.setattr(FanOutExecutor, "jobs", dict())
+
+    FakeCommandExecutor.running = dict()
+    FakeCommandExecutor.max_running = dict()
+    FakeCommandExecutor.release = threading.Event()
+    FakeCommandExecutor.contexts = []
+
+    return FanOutExecutor()
+
+
+def wait_for_job(executor, job_id, timeout=10):
+    import time
+    from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+
+    proc_info = InMemProcInfoRepository().get(job_id)
+    deadline = time.monotonic() + timeout
+    while proc_info.process_lock and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert not proc_info.process_lock, "bulk job never finished"
+    return proc_info
+
+
+def test_per_host_limit(monkeypatch):
+    executor = make_executor(monkeypatch, workers=4, per_host=2)
+
+    jobs = [(Server(f"a{i}"), ["cmd", "0"]) for i in range(5)]
+    jobs += [(Server(f"b{i}", install_host="host2"), ["cmd", "0"]) for i in range(2)]
+
+    job_id = executor.run(jobs)
+
+    # Waiting servers only get queued as their host frees up.
+    assert len(executor.jobs[job_id]["waiting"]) == 3
+
+    FakeCommandExecutor.release.set()
+    proc_info = wait_for_job(executor, job_id)
+
+    assert FakeCommandExecutor.max_running == {"host1": 2, "host2": 2}
+    assert proc_info.process_lock == False
+    assert proc_info.exit_status == 0
+    assert executor.host_running == {}
+    assert executor.jobs == {}
+
+
+def test_aggregate_progress(monkeypatch):
+    executor = make_executor(monkeypatch)
+    FakeCommandExecutor.release.set()
+
+    jobs = [
+        (Server("ok"), ["cmd", "0"]),
+        (Server("bad"), ["cmd", "1"]),
+        (Server("fail"), ["cmd", "0"]),
+    ]
+
+    job_id = executor.run(jobs)
+    proc_info = wait_for_job(executor, job_id)
+
+    assert proc_info.exit_status == 2
+    assert sum(line.endswith(": started\n") for line in proc_info.stdout) == 3
+    assert "[3/3]" in proc_info.stdout[-2]
+    assert proc_info.stdout[-1] == "Finished: 1 succeeded, 2 failed\n"
+    assert sorted(proc_info.stderr) == [
+        "server-bad: failed, exit status 1\n",
+        "server-fail: failed, exit status None\n",
+    ]
+
+
+def test_no_servers(monkeypatch):
+    executor = make_executor(monkeypatch)
+
+    job_id = executor.run([])
+    proc_info = wait_for_job(executor, job_id)
+
+    assert proc_info.process_lock == False
+    assert proc_info.exit_status == 0
+
+
+def test_job_owner(monkeypatch):
+    executor = make_executor(monkeypatch)
+
+    job_id = executor.run([], owner_id=3)
+    wait_for_job(executor, job_id)
+
+    assert job_id.startswith("bulk-3-")
+    assert executor.owner(job_id) == 3
+    assert executor.owner(executor.run([])) == None
+    assert executor.owner("bulk-3-invalid") == None
+    assert executor.owner("3") == None
+
+
+def test_app_context_popped_after_each_server(monkeypatch, app):
+    from flask import current_app, has_app_context
+    from app.infrastructure.system.command_executor.job_runner import JobRunner
+
+    # Single worker, so every command reuses the same pool thread.
+    executor = make_executor(monkeypatch, workers=1)
+    FakeCommandExecutor.release.set()
+    with app.app_context():
+        app_context = current_app.app_context()
+
+    job_id = executor.run([(Server(f"s{i}"), ["cmd", "0"]) for i in range(3)], app_context)
+    wait_for_job(executor, job_id)
+
+    after = threading.Event()
+    left_pushed = []
+    JobRunner().submit(lambda: (left_pushed.append(has_app_context()), after.set()))
+    assert after.wait(10)
+
+    assert FakeCommandExecutor.contexts == [True] * 3
+    assert left_pushed == [False]
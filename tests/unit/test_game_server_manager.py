@@ -0,0 +1,100 @@
+import threading
+
+
+class Server:
+    def __init__(self, id, install_type="remote", install_host="host1", username="user"):
+        self.id = id
+        self.install_type = install_type
+        self.install_host = install_host
+        self.username = username
+        self.script_name = "mcserver"
+
+
+class FakeTmuxSocketNameCache:
+    def get_tmux_socket_names(self, servers):
+        return {server.id: None if server.id == "nouid" else f"mcserver-{server.id}" for server in servers}
+
+
+class FakeCommandExecutor:
+    """Pretends sockets for servers with "on" in their id are running."""
+    cmds = []
+
+    def run(self, cmd, server=None, cmd_id=None, app_context=False):
+        import re
+        from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+
+        FakeCommandExecutor.cmds.append(cmd)
+        proc_info = InMemProcInfoRepository().get(cmd_id, create=True)
+        for socket in re.findall(r"web-lgsm-status:([\w-]+):", cmd[-1]):
+            exit_status = 0 if "on" in socket else 1
+            # Split line across reads, like a slow pipe might.
+            proc_info.stdout.extend([f"web-lgsm-status:{socket}", f":{exit_status}\n"])
+        proc_info.exit_status = 0
+        return proc_info
+
+
+def test_get_power_states_groups_by_host(monkeypatch):
+    from app.infrastructure.system.game_server.game_server_manager import GameServerManager
+
+    checked = []
+
+    def get_power_state(self, server):
+        checked.append((server.id, threading.current_thread().name))
+        return server.id != "off"
+
+    monkeypatch.setattr(GameServerManager, "get_power_state", get_power_state)
+    monkeypatch.setattr(GameServerManager, "_get_batch_power_states",
+                        lambda self, servers: {server.id: get_power_state(self, server) for server in servers})
+
+    servers = [
+        Server("a"),
+        Server("off"),
+        Server("b", install_host="host2"),
+        Server("c", install_type="local", install_host="127.0.0.1"),
+    ]
+
+    statuses = GameServerManager().get_power_states(servers)
+
+    assert statuses == {"a": True, "off": False, "b": True, "c": True}
+
+    # Servers on same host & user are checked by the same worker.
+    threads = dict(checked)
+    assert threads["a"] == threads["off"]
+
+
+def test_get_power_states_failed_group(monkeypatch):
+    from app.infrastructure.system.game_server.game_server_manager import GameServerManager
+
+    def get_power_state(self, server):
+        if server.install_host == "down":
+            raise OSError("unreachable")
+        return True
+
+    monkeypatch.setattr(GameServerManager, "get_power_state", get_power_state)
+
+    statuses = GameServerManager().get_power_states([Server("a"), Server("b", install_host="down")])
+
+    assert statuses == {"a": True, "b": None}
+
+
+def test_batch_power_states_one_cmd(monkeypatch):
+    from app.infrastructure.system.game_server import game_server_manager
+    from app.infrastructure.system.game_server.game_server_manager import GameServerManager
+
+    monkeypatch.setattr(game_server_manager, "TmuxSocketNameCache", FakeTmuxSocketNameCache)
+    monkeypatch.setattr(game_server_manager, "CommandExecutor", FakeCommandExecutor)
+    FakeCommandExecutor.cmds = []
+
+    statuses = GameServerManager()._get_batch_power_states(
+        [Server("on1"), Server("off1"), Server("on2"), Server("nouid")]
+    )
+
+    assert statuses == {"on1": True, "off1": False, "on2": True, "nouid": None}
+    assert len(FakeCommandExecutor.cmds) == 1
+    assert FakeCommandExecutor.cmds[0][:2] == ["/bin/sh", "-c"]
+
+
+def test_get_power_states_empty():
+    from app.infrastructure.system.game_server.game_server_manager import GameServerManager
+
+    assert GameServerManager().get_power_states([]) == {}
@@ -0,0 +1,84 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.infrastructure.persistence.models.game_server_model import GameServerModel
+from app.infrastructure.persistence.repositories.game_server_repo import SqlAlchemyGameServerRepository
+
+
+def add_servers(db_session, count):
+    ids = []
+    for i in range(count):
+        model = GameServerModel(
+            id=f"server-{i}",
+            install_type="local",
+            install_name=f"Server {i}",
+            install_path=f"/home/user/server{i}",
+            script_name="mcserver",
+            username="user",
+            sort_order=count - i,
+        )
+        db_session.session.add(model)
+        ids.append(model.id)
+    db_session.session.commit()
+    return ids
+
+
+@contextmanager
+def count_queries(db_session):
+    queries = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    engine = db_session.session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", before_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before_execute)
+
+
+def test_list_is_one_query(db_session):
+    add_servers(db_session, 5)
+    repo = SqlAlchemyGameServerRepository()
+
+    with count_queries(db_session) as queries:
+        servers = repo.list()
+
+    assert len(queries) == 1
+    assert [server.id for server in servers] == [f"server-{i}" for i in reversed(range(5))]
+    assert [server.sort_order for server in servers] == [1, 2, 3, 4, 5]
+
+
+def test_get_many(db_session):
+    add_servers(db_session, 5)
+    repo = SqlAlchemyGameServerRepository()
+
+    with count_queries(db_session) as queries:
+        servers = repo.get_many(["server-1", "server-3", "missing"])
+
+    assert len(queries) == 1
+    assert [server.id for server in servers] == ["server-3", "server-1"]
+    assert repo.get_many([]) == []
+
+
+def test_reorder_is_one_statement(db_session):
+    ids = add_servers(db_session, 5)
+    repo = SqlAlchemyGameServerRepository()
+
+    with count_queries(db_session) as queries:
+        assert repo.reorder(ids)
+
+    assert len([query for query in queries if query.startswith("UPDATE")]) == 1
+    assert [server.id for server in repo.list()] == ids
+
+
+def test_reorder_unknown_id_changes_nothing(db_session):
+    ids = add_servers(db_session, 3)
+    repo = SqlAlchemyGameServerRepository()
+
+    assert not repo.reorder(ids + ["missing"])
+    assert not repo.reorder([])
+
+    assert [server.sort_order for server in repo.list()] == [1, 2, 3]
@@ -0,0 +1,169 @@
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    import itertools
+    from app.infrastructure.system.config import ConfigManager
+    from app.infrastructure.system.command_executor.job_runner import JobRunner
+
+    settings = {"job_runner_workers": 2, "job_runner_per_server": 1}
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: settings.get(option, fallback))
+    monkeypatch.setattr(JobRunner, "pool", None)
+    monkeypatch.setattr(JobRunner, "queue", [])
+    monkeypatch.setattr(JobRunner, "seq", itertools.count())
+    monkeypatch.setattr(JobRunner, "running", dict())
+    monkeypatch.setattr(JobRunner, "server_running", dict())
+
+    yield JobRunner()
+
+    JobRunner.pool.shutdown(wait=True)
+
+
+def wait_until_idle(runner, timeout=10):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while runner.list() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert runner.list() == [], "jobs never finished"
+
+
+def wait_for_jobs(runner, names, timeout=10):
+    """Waits on finished jobs to drop out of list(), leaving just names."""
+    import time
+
+    deadline = time.monotonic() + timeout
+    while [job["name"] for job in runner.list()] != names and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert [job["name"] for job in runner.list()] == names
+
+
+def test_bounded_workers_and_priority(runner, monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 1)
+    release = threading.Event()
+    ran = []
+
+    # Fill the only worker and the high priority one, so everything after has
+    # to queue.
+    runner.submit(release.wait, (10,), name="blocker")
+    runner.submit(release.wait, (10,), name="high blocker", priority="high")
+
+    runner.submit(ran.append, ("low",), name="low", priority="low")
+    runner.submit(ran.append, ("normal1",), name="normal1")
+    runner.submit(ran.append, ("high",), name="high", priority="high")
+    runner.submit(ran.append, ("normal2",), name="normal2")
+
+    jobs = runner.list()
+    assert [job["status"] for job in jobs] == ["running"] * 2 + ["queued"] * 4
+    assert [job["name"] for job in jobs[2:]] == ["high", "normal1", "normal2", "low"]
+
+    release.set()
+    wait_until_idle(runner)
+
+    # Order is by priority, then by age.
+    assert ran == ["high", "normal1", "normal2", "low"]
+
+
+def test_high_priority_not_starved(runner, monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 1)
+    release = threading.Event()
+    ran = []
+
+    runner.submit(release.wait, (10,), name="update")
+    runner.submit(ran.append, ("normal",), name="normal")
+
+    # Gets the reserved worker, while the normal job keeps waiting.
+    sent = threading.Event()
+    runner.submit(sent.set, name="send command", priority="high")
+    assert sent.wait(10)
+
+    assert ran == []
+    wait_for_jobs(runner, ["update", "normal"])
+
+    release.set()
+    wait_until_idle(runner)
+
+    assert ran == ["normal"]
+
+
+def test_workers_fixed_at_pool_creation(runner, monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 1)
+    release = threading.Event()
+
+    runner.submit(release.wait, (10,), name="update")
+
+    # Pool was sized for one worker, raising the setting now can't make room.
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 4)
+    runner.submit(release.wait, (10,), name="install")
+
+    assert [job["status"] for job in runner.list()] == ["running", "queued"]
+
+    release.set()
+    wait_until_idle(runner)
+
+
+def test_per_server_limit(runner):
+    release = threading.Event()
+    ran = []
+
+    runner.submit(release.wait, (10,), name="install", server_id="a")
+    runner.submit(ran.append, ("a2",), name="clear", server_id="a")
+    runner.submit(ran.append, ("b",), name="start", server_id="b")
+
+    # Server b's job doesn't wait behind server a's.
+    wait_for = threading.Event()
+    runner.submit(wait_for.set, server_id="b")
+    assert wait_for.wait(10)
+
+    assert "a2" not in ran
+    wait_for_jobs(runner, ["install", "clear"])
+
+    release.set()
+    wait_until_idle(runner)
+
+    assert ran == ["b", "a2"]
+    assert runner.server_running == {}
+
+
+def test_failed_job_frees_worker(runner):
+    def boom():
+        raise OSError("boom")
+
+    done = threading.Event()
+    runner.submit(boom, server_id="a")
+    runner.submit(done.set, server_id="a")
+
+    assert done.wait(10)
+    wait_until_idle(runner)
+
+
+def test_app_context_popped_after_job(runner, app, monkeypatch):
+    from flask import current_app, has_app_context
+    from app.infrastructure.system.config import ConfigManager
+
+    # Single worker, so every job reuses the same pool thread.
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 1)
+    with app.app_context():
+        app_context = current_app.app_context()
+
+    seen = []
+    def check():
+        seen.append((has_app_context(), current_app._get_current_object()))
+
+    for _ in range(3):
+        runner.submit(check, app_context=app_context)
+    runner.submit(lambda: seen.append(has_app_context()))
+    wait_until_idle(runner)
+
+    assert seen == [(True, app)] * 3 + [False]
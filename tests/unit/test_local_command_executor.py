@@ -0,0 +1,141 @@
+import sys
+import time
+import threading
+
+from app.domain.entities.proc_info import ProcInfo
+
+
+class FakeConfig:
+    def getboolean(self, section, option, fallback=None):
+        return option == "clear_output_on_reload"
+
+    def get(self, section, option, fallback=None):
+        return fallback
+
+
+class FakeProcInfoRepo:
+    def __init__(self):
+        self.proc_info = ProcInfo()
+
+    def get(self, cmd_id, create=False, since=None):
+        return self.proc_info
+
+
+def make_executor():
+    from app.infrastructure.system.command_executor.local_command_executor import LocalCommandExecutor
+
+    executor = LocalCommandExecutor(FakeConfig())
+    executor.proc_info_repo = FakeProcInfoRepo()
+    return executor
+
+
+def run_with_timeout(executor, cmd, timeout=30):
+    result = {}
+    thread = threading.Thread(target=lambda: result.update(proc_info=executor.run(cmd)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "executor hung reading output"
+    return result["proc_info"]
+
+
+def test_captures_both_streams():
+    script = "import os, sys; os.write(1, b'out\\n'); os.write(2, b'err\\n'); sys.exit(3)"
+
+    proc_info = run_with_timeout(make_executor(), [sys.executable, "-c", script])
+
+    assert proc_info.stdout == ["out\n"]
+    assert proc_info.stderr == ["err\n"]
+    assert proc_info.exit_status == 3
+    assert proc_info.process_lock == False
+
+
+def test_full_stderr_pipe_does_not_deadlock():
+    # Way more than a pipe buffer worth of stderr, before any stdout.
+    script = "import os; os.write(2, b'e' * 200000); os.write(1, b'done\\n')"
+
+    proc_info = run_with_timeout(make_executor(), [sys.executable, "-c", script])
+
+    assert proc_info.stdout == ["done\n"]
+    assert "".join(proc_info.stderr).count("e") == 200000
+
+
+def test_stderr_arrives_before_exit(monkeypatch):
+    import subprocess
+    from app.infrastructure.system.command_executor import local_command_executor
+
+    executor = make_executor()
+    seen = threading.Event()
+    popen = subprocess.Popen
+
+    # Process blocks on stdin after writing to stderr, and is only let go
+    # once its stderr shows up in proc_info.
+    def fake_popen(cmd, **kwargs):
+        proc = popen(cmd, stdin=subprocess.PIPE, **kwargs)
+
+        def release():
+            while not executor.proc_info_repo.proc_info.stderr and proc.poll() is None:
+                time.sleep(0.01)
+            seen.set()
+            proc.stdin.close()
+
+        threading.Thread(target=release, daemon=True).start()
+        return proc
+
+    monkeypatch.setattr(local_command_executor.subprocess, "Popen", fake_popen)
+    script = "import os, sys; os.write(2, b'err\\n'); sys.stdin.read()"
+
+    proc_info = run_with_timeout(executor, [sys.executable, "-c", script], timeout=10)
+
+    assert seen.is_set()
+    assert proc_info.stderr == ["err\n"]
+
+
+def test_profile_resolved_once():
+    from app.infrastructure.system.command_executor.execution_profile import ExecutionProfile
+
+    class CountingConfig:
+        lookups = 0
+
+        def getboolean(self, section, option, fallback=None):
+            CountingConfig.lookups += 1
+            return option == "end_in_newlines"
+
+        def get(self, section, option, fallback=None):
+            CountingConfig.lookups += 1
+            return fallback
+
+    executor = make_executor()
+    executor.config = CountingConfig()
+    script = "import os\nfor i in range(50): os.write(1, b'line\\n')\nos.write(1, b'last')"
+
+    proc_info = run_with_timeout(executor, [sys.executable, "-c", script])
+
+    # One lookup per setting, not per line.
+    assert CountingConfig.lookups == 4
+    assert proc_info.stdout[-1] == "last\r\n"
+
+    # Explicit profile means no config lookups at all.
+    CountingConfig.lookups = 0
+    proc_info = executor.run([sys.executable, "-c", script], profile=ExecutionProfile())
+
+    assert CountingConfig.lookups == 0
+    assert proc_info.stdout[-1] == "last\r"
+
+
+def test_multibyte_split_across_reads():
+    # Each write is its own read1() chunk, splitting the characters in half.
+    script = (
+        "import os, time\n"
+        "data = 'Ünïcödé ✓\\n'.encode()\n"
+        "for i in range(len(data)):\n"
+        "    os.write(1, data[i:i+1]); time.sleep(0.002)\n"
+        "os.write(2, b'bad \\xff byte\\n')\n"
+        "os.write(1, b'dangling \\xe2\\x9c')\n"
+    )
+
+    proc_info = run_with_timeout(make_executor(), [sys.executable, "-c", script])
+
+    # Lone newline chunk gets dropped, same as any empty line.
+    assert "".join(proc_info.stdout).replace("\r", "") == "Ünïcödé ✓dangling \ufffd"
+    assert proc_info.stderr == ["bad \ufffd byte\n"]
+    assert proc_info.exit_status == 0
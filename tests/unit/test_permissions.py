@@ -0,0 +1,62 @@
+import json
+import pickle
+
+import pytest
+
+from app.domain.entities.user import User
+from app.domain.entities.permissions import Permissions
+
+
+def make_user(role="user", permissions=None):
+    return User(1, "bob", "hash", role, permissions, None, False, False)
+
+
+def test_compiled_once_per_version():
+    perms_json = json.dumps({"server_ids": ["a"], "routes": ["controls"], "controls": ["start"]})
+
+    first = Permissions.for_user(make_user(permissions=perms_json))
+    second = Permissions.for_user(make_user(permissions=perms_json))
+    changed = Permissions.for_user(make_user(permissions=json.dumps({"routes": ["controls"]})))
+
+    assert first is second
+    assert changed is not first
+    assert first.server_ids == frozenset(["a"])
+    assert changed.server_ids == frozenset()
+
+
+def test_allows():
+    perms = Permissions(server_ids=["a"], routes=["controls", "update-console"], controls=["start"])
+
+    assert perms.allows("controls")
+    assert perms.allows("controls", "a")
+    assert not perms.allows("controls", "b")
+    assert not perms.allows("settings")
+
+    # Console route also needs console control.
+    assert not perms.allows("update-console", "a")
+    assert Permissions(routes=["update-console"], controls=["console"]).allows("update-console")
+
+
+def test_admin_allowed_everything():
+    perms = Permissions.for_user(make_user(role="admin", permissions=json.dumps({"admin": True})))
+
+    assert perms.admin
+    assert perms.allows("settings", "any")
+    assert perms.has_server("any") and perms.has_route("jobs") and perms.has_control("stop")
+
+
+@pytest.mark.parametrize("perms_json", [None, "", "not json", "[1, 2]", '{"routes": null}'])
+def test_bad_permissions_mean_no_access(perms_json):
+    perms = Permissions.for_user(make_user(permissions=perms_json))
+
+    assert perms == Permissions()
+    assert not perms.allows("controls")
+
+
+def test_read_only_and_picklable():
+    perms = Permissions(server_ids=["a"])
+
+    with pytest.raises(AttributeError):
+        perms.admin = True
+
+    assert pickle.loads(pickle.dumps(perms)) == perms
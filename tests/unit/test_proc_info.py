@@ -0,0 +1,100 @@
+import json
+
+from app.domain.entities.proc_info import ProcInfo
+
+
+def test_seq_shared_between_streams():
+    proc_info = ProcInfo()
+    proc_info.stdout.append("out1\n")
+    proc_info.stderr.append("err1\n")
+    proc_info.stdout.append("out2\n")
+
+    assert proc_info.seq == 3
+    assert proc_info.stdout.since(1) == ["out2\n"]
+    assert proc_info.stderr.since(1) == ["err1\n"]
+    assert proc_info.stderr.since(2) == []
+
+
+def test_seq_survives_clear():
+    proc_info = ProcInfo()
+    proc_info.stdout.extend(["a\n", "b\n"])
+    proc_info.stdout.clear()
+    proc_info.stdout.append("c\n")
+
+    assert proc_info.seq == 3
+    assert proc_info.stdout == ["c\n"]
+    assert proc_info.stdout.since(2) == ["c\n"]
+
+
+def test_to_json_since():
+    proc_info = ProcInfo()
+    proc_info.stdout.extend(["a\n", "b\n", "c\n"])
+    proc_info.stderr.append("oops\n")
+
+    data = json.loads(proc_info.toJSON(since=2))
+
+    assert data["stdout"] == ["c\n"]
+    assert data["stderr"] == ["oops\n"]
+    assert data["seq"] == 4
+
+
+def test_to_json_since_unknown_cursor_returns_all():
+    proc_info = ProcInfo()
+    proc_info.stdout.extend(["a\n", "b\n"])
+
+    data = json.loads(proc_info.toJSON(since=100))
+
+    assert data["stdout"] == ["a\n", "b\n"]
+
+
+def test_to_json_full():
+    proc_info = ProcInfo()
+    proc_info.stdout.append("a\n")
+
+    data = json.loads(proc_info.toJSON())
+
+    assert data["stdout"] == ["a\n"]
+    assert data["stderr"] == []
+    assert data["process_lock"] is None
+
+
+def test_max_lines_trims_oldest():
+    proc_info = ProcInfo(max_lines=8)
+    proc_info.stdout.extend([f"{i}\n" for i in range(9)])
+
+    # Trimmed down to 3/4 of cap in one go.
+    assert proc_info.stdout == [f"{i}\n" for i in range(3, 9)]
+    assert proc_info.stdout.dropped == 3
+    assert proc_info.stdout.since(4) == [f"{i}\n" for i in range(4, 9)]
+    assert proc_info.stdout.since(0) == proc_info.stdout
+
+
+def test_max_bytes_trims_oldest():
+    proc_info = ProcInfo(max_bytes=20)
+    proc_info.stderr.extend(["aaaa\n"] * 5)
+
+    assert proc_info.stderr.size <= 15
+    assert proc_info.stderr.size == sum(len(line) for line in proc_info.stderr)
+    assert proc_info.seq == 5
+
+
+def test_spill_gets_dropped_lines():
+    spilled = []
+    proc_info = ProcInfo(max_lines=4, spill=lambda output_type, lines: spilled.append((output_type, lines)))
+    proc_info.stdout.extend(["a\n", "b\n", "c\n", "d\n", "e\n"])
+
+    assert spilled == [("stdout", ["a\n", "b\n"])]
+    assert proc_info.stdout == ["c\n", "d\n", "e\n"]
+
+
+def test_max_bytes_counts_encoded_bytes():
+    proc_info = ProcInfo(max_bytes=20)
+
+    # 5 chars, but 13 bytes as UTF-8.
+    proc_info.stdout.append("€€€€\n")
+    assert proc_info.stdout.size == 13
+
+    # Over the cap in bytes (though not in chars), so gets trimmed.
+    proc_info.stdout.extend(["ab\n"] * 3)
+    assert proc_info.stdout == ["ab\n"] * 3
+    assert proc_info.stdout.size == 9
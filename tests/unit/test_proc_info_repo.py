@@ -0,0 +1,79 @@
+import time
+import pytest
+from collections import OrderedDict
+
+from app.domain.entities.proc_info import ProcInfo
+from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    """Fresh repo state, without sweeper thread or main.conf lookups."""
+    monkeypatch.setattr(InMemProcInfoRepository, "processes", OrderedDict())
+    monkeypatch.setattr(InMemProcInfoRepository, "touched", dict())
+    monkeypatch.setattr(InMemProcInfoRepository, "_start_sweeper", lambda self: None)
+    return InMemProcInfoRepository()
+
+
+def test_get_create(repo):
+    assert repo.get("proc1") is None
+
+    proc_info = repo.get("proc1", create=True)
+
+    assert proc_info.server_id == "proc1"
+    assert repo.get("proc1") is proc_info
+
+
+def test_lru_evicts_oldest_finished(repo, monkeypatch):
+    monkeypatch.setattr(InMemProcInfoRepository, "max_entries", 2)
+
+    running = repo.add("running", ProcInfo())
+    running.process_lock = True
+    repo.add("old", ProcInfo())
+    repo.add("new", ProcInfo())
+
+    assert list(repo.list()) == ["running", "new"]
+
+
+def test_get_refreshes_lru_order(repo, monkeypatch):
+    monkeypatch.setattr(InMemProcInfoRepository, "max_entries", 2)
+
+    repo.add("a", ProcInfo())
+    repo.add("b", ProcInfo())
+    repo.get("a")
+    repo.add("c", ProcInfo())
+
+    assert list(repo.list()) == ["a", "c"]
+
+
+def test_sweep_ttl(repo, monkeypatch):
+    class Config:
+        def getint(self, section, option, fallback=None):
+            return {"proc_info_ttl": 10, "proc_info_max_entries": 0}[option]
+
+    monkeypatch.setattr(
+        "app.infrastructure.system.repositories.proc_info_repo.ConfigManager", Config
+    )
+
+    running = repo.add("running", ProcInfo())
+    running.process_lock = True
+    repo.add("stale", ProcInfo())
+    repo.add("fresh", ProcInfo())
+
+    InMemProcInfoRepository.touched["running"] -= 60
+    InMemProcInfoRepository.touched["stale"] -= 60
+
+    repo.sweep()
+
+    assert list(repo.list()) == ["running", "fresh"]
+    assert time.monotonic() - InMemProcInfoRepository.touched["running"] < 10
+
+
+def test_stats(repo):
+    proc_info = repo.add("proc1", ProcInfo())
+    proc_info.process_lock = True
+    proc_info.stdout.extend(["ab\n", "cd\n"])
+    proc_info.stderr.append("e\n")
+    repo.add("proc2", ProcInfo())
+
+    assert repo.stats() == {"count": 2, "running": 1, "lines": 3, "bytes": 8}
@@ -1,4 +1,9 @@
+import os
+import time
 import paramiko
+import threading
+
+from contextlib import contextmanager
 
 ## Ssh Test Classes
 class FakeChannel:
@@ -10,6 +15,16 @@ class FakeChannel:
         self._stdout_read = False
         self._stderr_read = False
 
+        self.eof_received = False
+        self.status_event = threading.Event()
+
+        # Always readable, all output is there from the start.
+        self._pipe_r, pipe_w = os.pipe()
+        os.write(pipe_w, b"x")
+
+    def fileno(self):
+        return self._pipe_r
+
     def set_combine_stderr(self, val):
         pass
 
@@ -66,11 +81,24 @@ class FakeSSHClientInterface:
     def get_client(self, username, hostname):
         return FakeSSHClient(self.channel)
 
+    @contextmanager
+    def session(self, username, hostname):
+        yield self.get_client(username, hostname)
+
 
 class DummyConfig:
+    def __init__(self, **settings):
+        self.settings = settings
+
     def getboolean(self, *_):
         return False
 
+    def get(self, section, option, fallback=None):
+        return self.settings.get(option, fallback)
+
+    def getint(self, section, option, fallback=None):
+        return self.settings.get(option, fallback)
+
 def test_run_success_stdout():
     from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
     from app.infrastructure.system.repositories.proc_info_repo import InMemProcInfoRepository
@@ -135,6 +163,10 @@ class FailingClientInterface:
     def get_client(self, username, hostname):
         raise paramiko.SSHException("connection failed")
 
+    @contextmanager
+    def session(self, username, hostname):
+        yield self.get_client(username, hostname)
+
 
 def test_ssh_exception_handling():
     from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
@@ -154,3 +186,202 @@ def test_ssh_exception_handling():
     assert result is False
     assert proc_info.exit_status == 5
     assert any("connection failed" in e for e in proc_info.stderr)
+
+
+class SlowChannel:
+    """Channel whose output shows up later, waking select like paramiko's does."""
+    def __init__(self):
+        self._pipe_r, self._pipe_w = os.pipe()
+        self._stdout = b""
+        self.done = False
+        self.eof_received = False
+
+    def fileno(self):
+        return self._pipe_r
+
+    def send_later(self, data, delay):
+        def send():
+            time.sleep(delay)
+            self._stdout = data
+            self.done = True
+            os.write(self._pipe_w, b"x")
+        threading.Thread(target=send, daemon=True).start()
+
+    def recv_ready(self):
+        return bool(self._stdout)
+
+    def recv(self, n):
+        data, self._stdout = self._stdout, b""
+        return data
+
+    def recv_stderr_ready(self):
+        return False
+
+    def exit_status_ready(self):
+        return self.done
+
+
+def test_read_wakes_on_output():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    executor = SshCommandExecutor(DummyConfig(), None)
+    channel = SlowChannel()
+    proc_info = ProcInfo()
+
+    start = time.monotonic()
+    channel.send_later(b"late\n", 0.05)
+    executor._read_ssh_output(channel, proc_info)
+
+    assert proc_info.stdout == ["late\n"]
+    assert time.monotonic() - start < SshCommandExecutor.SELECT_TIMEOUT
+
+
+class EofChannel(SlowChannel):
+    """
+    Channel that's hit EOF but has no exit status yet. Like paramiko's, its
+    fileno stays readable from then on.
+    """
+    def __init__(self):
+        super().__init__()
+        os.write(self._pipe_w, b"x")
+        self.eof_received = True
+        self.status_event = threading.Event()
+        self.polls = 0
+
+    def exit_later(self, delay):
+        def exit():
+            time.sleep(delay)
+            self.done = True
+            self.status_event.set()
+        threading.Thread(target=exit, daemon=True).start()
+
+    def recv_ready(self):
+        self.polls += 1
+        return super().recv_ready()
+
+
+def test_read_waits_for_exit_status_after_eof():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    executor = SshCommandExecutor(DummyConfig(), None)
+    channel = EofChannel()
+
+    start = time.monotonic()
+    channel.exit_later(0.2)
+    executor._read_ssh_output(channel, ProcInfo())
+
+    # Woken by the exit status, without spinning on the readable fileno.
+    assert time.monotonic() - start < SshCommandExecutor.SELECT_TIMEOUT
+    assert channel.polls <= 3
+
+
+def test_stderr_dedup_all():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    executor = SshCommandExecutor(DummyConfig(), None)
+    proc_info = ProcInfo()
+    proc_info.stderr.append("old\n")
+    seen = executor._stderr_dedup(proc_info)
+
+    executor._process_ssh_chunk("warn\nold\nwarn\nother\n", proc_info, "stderr", seen)
+    executor._process_ssh_chunk("warn\n", proc_info, "stderr", seen)
+    executor._process_ssh_chunk("same\nsame\n", proc_info, "stdout", seen)
+
+    assert proc_info.stderr == ["old\n", "warn\n", "other\n"]
+    assert proc_info.stdout == ["same\n", "same\n"]
+
+
+def test_stderr_dedup_window():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    config = DummyConfig(ssh_stderr_dedup="window", ssh_stderr_dedup_window=2)
+    executor = SshCommandExecutor(config, None)
+    proc_info = ProcInfo()
+    seen = executor._stderr_dedup(proc_info)
+
+    executor._process_ssh_chunk("a\nb\na\nc\nd\na\n", proc_info, "stderr", seen)
+
+    # Second "a" is within the window and dropped, the last one is not.
+    assert proc_info.stderr == ["a\n", "b\n", "c\n", "d\n", "a\n"]
+
+
+def test_stderr_dedup_off():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    executor = SshCommandExecutor(DummyConfig(ssh_stderr_dedup="off"), None)
+    proc_info = ProcInfo()
+
+    executor._process_ssh_chunk("a\na\n", proc_info, "stderr")
+
+    assert proc_info.stderr == ["a\n", "a\n"]
+
+
+def test_profile_used_over_config():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.execution_profile import ExecutionProfile
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    class NoLookupConfig(DummyConfig):
+        def getboolean(self, *_):
+            raise AssertionError("config looked up per line")
+
+    executor = SshCommandExecutor(NoLookupConfig(ssh_stderr_dedup="off"), None)
+    proc_info = ProcInfo()
+    profile = ExecutionProfile(end_in_newlines=True)
+
+    executor._process_ssh_chunk("a\nb", proc_info, "stdout", None, profile)
+
+    assert proc_info.stdout == ["a\n", "b\n"]
+
+
+def test_multibyte_split_across_recvs():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    class ChunkedChannel(FakeChannel):
+        """Hands out stdout one byte per recv."""
+        def recv_ready(self):
+            return bool(self._stdout)
+
+        def recv(self, n):
+            chunk, self._stdout = self._stdout[:1], self._stdout[1:]
+            return chunk
+
+        def exit_status_ready(self):
+            return not self._stdout and (self._stderr_read or not self._stderr)
+
+    channel = ChunkedChannel(stderr="bad ")
+    channel._stdout = "Spieler: Jürgen ✓\n".encode() + b"cut \xe2\x9c"
+    channel._stderr += b"\xff\n"
+    executor = SshCommandExecutor(DummyConfig(ssh_stderr_dedup="off"), None)
+    proc_info = ProcInfo()
+
+    executor._read_ssh_output(channel, proc_info)
+
+    assert "".join(proc_info.stdout) == "Spieler: Jürgen ✓\ncut �"
+    assert proc_info.stderr == ["bad �\n"]
+
+
+def test_no_per_line_logging_without_debug():
+    from app.domain.entities.proc_info import ProcInfo
+    from app.infrastructure.system.command_executor.remote_command_executor import SshCommandExecutor
+
+    class QuietLogger:
+        def isEnabledFor(self, level):
+            return False
+
+        def debug(self, msg):
+            raise AssertionError("debug line built with debug logging off")
+
+    executor = SshCommandExecutor(DummyConfig(ssh_stderr_dedup="off"), None)
+    executor.logger = QuietLogger()
+    proc_info = ProcInfo()
+
+    executor._process_ssh_chunk("a\nb\n", proc_info, "stdout", None)
+
+    assert proc_info.stdout == ["a\n", "b\n"]
@@ -1,3 +1,6 @@
+from contextlib import contextmanager
+
+
 class FakeFile:
     def __init__(self, content=b"", should_fail=False):
         self.content = content
@@ -28,6 +31,8 @@ class FakeSFTP:
         self.file_obj = file_obj
 
     def open(self, path, mode):
+        if path.endswith("missing"):
+            raise IOError("No such file")
         return self.file_obj
 
     def __enter__(self):
@@ -52,6 +57,11 @@ class FakeSSHClientInterface:
     def get_client(self, username, hostname):
         return FakeSSHClient(self.file_obj)
 
+    @contextmanager
+    def sftp(self, username, hostname):
+        with self.get_client(username, hostname).open_sftp() as sftp:
+            yield sftp
+
 def test_read_success():
     from app.infrastructure.system.file_system.remote_file_interface import SSHFileInterface
 
@@ -143,6 +153,10 @@ def test_write_uses_correct_mode():
         def get_client(self, *_):
             return Client()
 
+        @contextmanager
+        def sftp(self, username, hostname):
+            yield self.get_client(username, hostname).open_sftp()
+
     class Server:
         install_host = "host"
         username = "user"
@@ -153,3 +167,18 @@ def test_write_uses_correct_mode():
 
     assert sftp.last_path == "/tmp/test.txt"
     assert sftp.last_mode == "w"
+
+def test_read_many_skips_missing():
+    from app.infrastructure.system.file_system.remote_file_interface import SSHFileInterface
+
+    fake_file = FakeFile(content=b"hello")
+
+    class Server:
+        install_host = "host"
+        username = "user"
+
+    fs = SSHFileInterface(Server(), FakeSSHClientInterface(fake_file))
+
+    result = fs.read_many(["/a", "/missing", "/b"])
+
+    assert result == {"/a": "hello", "/missing": None, "/b": "hello"}
@@ -0,0 +1,154 @@
+import os
+import time
+import pytest
+import threading
+
+from app.domain.entities.proc_info import ProcInfo
+from app.infrastructure.system.repositories.sqlite_proc_info_repo import SqliteProcInfoRepository
+
+
+@pytest.fixture
+def repo(monkeypatch, tmp_path):
+    """Fresh db in tmp dir, without sweeper thread."""
+    monkeypatch.setattr(SqliteProcInfoRepository, "DB_PATH", str(tmp_path / "proc_info.db"))
+    monkeypatch.setattr(SqliteProcInfoRepository, "local", threading.local())
+    monkeypatch.setattr(SqliteProcInfoRepository, "_start_sweeper", lambda self: None)
+    return SqliteProcInfoRepository()
+
+
+def test_get_create(repo):
+    assert repo.get("proc1") is None
+
+    proc_info = repo.get("proc1", create=True)
+
+    assert proc_info.server_id == "proc1"
+    assert "proc1" in repo.list()
+
+
+def test_writes_through(repo):
+    proc_info = repo.get("proc1", create=True)
+    proc_info.process_lock = True
+    proc_info.pid = 1234
+    proc_info.stdout.append("a\n")
+    proc_info.stderr.append("b\n")
+    proc_info.stdout.append("c\n")
+    proc_info.exit_status = 0
+
+    # Fresh object, as if fetched by another worker.
+    fetched = repo.get("proc1")
+
+    assert fetched is not proc_info
+    assert fetched.process_lock == True
+    assert fetched.pid == 1234
+    assert fetched.exit_status == 0
+    assert fetched.stdout == ["a\n", "c\n"]
+    assert fetched.stderr == ["b\n"]
+    assert fetched.seq == proc_info.seq
+
+
+def test_since_cursor(repo):
+    proc_info = repo.get("proc1", create=True)
+    proc_info.stdout.extend(["a\n", "b\n"])
+    seq = proc_info.seq
+    proc_info.stdout.append("c\n")
+
+    fetched = repo.get("proc1", since=seq)
+
+    assert fetched.stdout == ["c\n"]
+    assert fetched.stdout.since(seq) == ["c\n"]
+    assert '"c\\n"' in fetched.toJSON(seq)
+
+
+def test_extend_inserts_in_one_batch(repo, monkeypatch):
+    proc_info = repo.get("proc1", create=True)
+    proc_info.stdout.append("a\n")
+
+    def single_insert(*args):
+        raise AssertionError("extend() shouldn't insert line by line")
+
+    monkeypatch.setattr(SqliteProcInfoRepository, "_insert_line", single_insert)
+    proc_info.stdout.extend(["b\n", "c\n", "d\n"])
+    proc_info.stderr.extend([])
+
+    fetched = repo.get("proc1")
+
+    assert fetched.stdout == ["a\n", "b\n", "c\n", "d\n"]
+    assert list(fetched.stdout._seqs) == list(proc_info.stdout._seqs)
+    assert proc_info.seq == fetched.seq == proc_info.stdout._seqs[-1]
+    assert fetched.stdout.since(proc_info.stdout._seqs[1]) == ["c\n", "d\n"]
+
+
+def test_clear(repo):
+    proc_info = repo.get("proc1", create=True)
+    proc_info.stdout.extend(["a\n", "b\n"])
+    proc_info.stdout.clear()
+    proc_info.stdout.append("c\n")
+
+    assert repo.get("proc1").stdout == ["c\n"]
+
+
+def test_add_replaces_output(repo):
+    repo.get("proc1", create=True).stdout.append("old\n")
+
+    new = ProcInfo()
+    new.stdout.append("new\n")
+    repo.add("proc1", new)
+
+    assert repo.get("proc1").stdout == ["new\n"]
+
+
+def test_trim_drops_rows(repo, monkeypatch):
+    monkeypatch.setattr(SqliteProcInfoRepository, "_caps", lambda self: (4, None))
+    proc_info = repo.get("proc1", create=True)
+    proc_info.stdout.extend([f"{i}\n" for i in range(5)])
+
+    assert repo.get("proc1").stdout == proc_info.stdout
+    assert repo.stats()["lines"] == len(proc_info.stdout)
+
+
+def test_trim_spills_to_disk(repo, monkeypatch, tmp_path):
+    from app.infrastructure.system.config import ConfigManager
+
+    monkeypatch.setattr(SqliteProcInfoRepository, "_caps", lambda self: (4, None))
+    monkeypatch.setattr(SqliteProcInfoRepository, "SPILL_DIR", str(tmp_path / "spill"))
+    monkeypatch.setattr(ConfigManager, "getboolean", lambda self, section, option, fallback=None: option == "output_spill_to_disk")
+
+    proc_info = repo.get("proc1", create=True)
+    proc_info.stdout.extend([f"{i}\n" for i in range(5)])
+    repo.get("proc1").stdout.extend([f"{i}\n" for i in range(5, 7)])
+
+    with open(tmp_path / "spill" / "proc1.stdout.log") as spill_file:
+        spilled = spill_file.readlines()
+
+    assert spilled + repo.get("proc1").stdout == [f"{i}\n" for i in range(7)]
+
+    # New process under the same id starts a fresh spill file.
+    repo.add("proc1", ProcInfo())
+    assert not os.path.exists(tmp_path / "spill" / "proc1.stdout.log")
+
+
+def test_remove_and_stats(repo):
+    repo.get("proc1", create=True).stdout.append("abc\n")
+    repo.get("proc2", create=True).process_lock = True
+
+    assert repo.stats() == {"count": 2, "running": 1, "lines": 1, "bytes": 4}
+
+    repo.remove("proc1")
+
+    assert repo.get("proc1") is None
+    assert repo.stats() == {"count": 1, "running": 1, "lines": 0, "bytes": 0}
+
+
+def test_sweep_unlocks_dead_owner_and_evicts(repo, monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 60 if option == "proc_info_ttl" else 0)
+
+    repo.get("orphan", create=True).process_lock = True
+    repo._conn().execute("UPDATE procs SET owner_pid = 0, touched = ?", (time.time() - 120,))
+    repo.get("live", create=True).process_lock = True
+
+    repo.sweep()
+
+    assert repo.get("live").process_lock == True
+    assert repo.get("orphan") is None
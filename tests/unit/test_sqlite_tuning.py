@@ -0,0 +1,71 @@
+from sqlalchemy import create_engine, text
+
+
+class FakeConfig:
+    def __init__(self, **settings):
+        self.settings = settings
+
+    def get(self, section, option, fallback=None):
+        return self.settings.get(option, fallback)
+
+    def getint(self, section, option, fallback=None):
+        return int(self.settings.get(option, fallback))
+
+    def getboolean(self, section, option, fallback=None):
+        return self.settings.get(option, fallback)
+
+
+def test_pragmas_from_settings():
+    from app.infrastructure.persistence.sqlite_tuning import sqlite_pragmas
+
+    pragmas = sqlite_pragmas(FakeConfig(
+        sqlite_journal_mode="DELETE",
+        sqlite_synchronous="full",
+        sqlite_busy_timeout=100,
+        sqlite_foreign_keys=True,
+    ))
+
+    assert pragmas == [
+        "PRAGMA journal_mode=delete",
+        "PRAGMA synchronous=full",
+        "PRAGMA busy_timeout=100",
+        "PRAGMA mmap_size=67108864",
+        "PRAGMA cache_size=-8000",
+        "PRAGMA foreign_keys=ON",
+    ]
+
+
+def test_invalid_modes_use_defaults():
+    from app.infrastructure.persistence.sqlite_tuning import sqlite_pragmas
+
+    pragmas = sqlite_pragmas(FakeConfig(
+        sqlite_journal_mode="wal; DROP TABLE user_model",
+        sqlite_synchronous="sometimes",
+    ))
+
+    assert pragmas[:2] == ["PRAGMA journal_mode=wal", "PRAGMA synchronous=normal"]
+
+
+def test_applied_on_connect(tmp_path):
+    from app.infrastructure.persistence.sqlite_tuning import tune_sqlite_engine
+
+    engine = tune_sqlite_engine(
+        create_engine(f"sqlite:///{tmp_path}/test.db"),
+        FakeConfig(sqlite_busy_timeout=1234, sqlite_foreign_keys=True),
+    )
+
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 1234
+        assert conn.execute(text("PRAGMA cache_size")).scalar() == -8000
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+
+
+def test_app_engine_tuned(app):
+    from app import db
+
+    with app.app_context():
+        with db.engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
@@ -0,0 +1,50 @@
+class FakeSource:
+    KEEPALIVE = 0.01
+    STREAM_MAX_AGE = 60
+
+    def __init__(self):
+        self.unsubscribed = []
+
+    def unsubscribe(self, subscription):
+        self.unsubscribed.append(subscription)
+
+
+def test_keepalive_when_idle():
+    from app.infrastructure.system.game_server.sse_subscription import SseSubscription
+
+    subscription = SseSubscription(FakeSource())
+    subscription.put({"n": 1})
+    events = iter(subscription)
+
+    assert next(events) == {"n": 1}
+    assert next(events) == None
+
+
+def test_dropped_when_full():
+    from app.infrastructure.system.game_server.sse_subscription import SseSubscription
+
+    source = FakeSource()
+    subscription = SseSubscription(source)
+    for n in range(SseSubscription.MAX_QUEUED + 1):
+        subscription.put({"n": n})
+
+    assert subscription.closed
+    assert list(subscription) == []
+
+    subscription.close()
+    assert source.unsubscribed == [subscription]
+
+
+def test_wants_filters_events():
+    from app.infrastructure.system.game_server.sse_subscription import SseSubscription
+
+    class OddSubscription(SseSubscription):
+        def wants(self, event):
+            return event["n"] % 2 == 1
+
+    subscription = OddSubscription(FakeSource())
+    for n in range(4):
+        subscription.put({"n": n})
+
+    assert [subscription.queue.get_nowait() for _ in range(2)] == [{"n": 1}, {"n": 3}]
+    assert subscription.queue.empty()
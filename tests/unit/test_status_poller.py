@@ -0,0 +1,137 @@
+import pytest
+
+
+class Server:
+    def __init__(self, id, install_host="host1"):
+        self.id = id
+        self.install_type = "remote"
+        self.install_host = install_host
+        self.username = "user"
+
+
+class FakeGameServerManager:
+    """Returns canned statuses, None for every server on a down host."""
+    statuses = dict()
+    down = set()
+    checked = []
+
+    def get_power_states(self, servers, app_context=None):
+        FakeGameServerManager.checked.append([server.id for server in servers])
+        return {
+            server.id: None if server.install_host in FakeGameServerManager.down
+            else FakeGameServerManager.statuses.get(server.id, False)
+            for server in servers
+        }
+
+
+@pytest.fixture
+def poller(monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+    from app.infrastructure.system.game_server import status_poller
+    from app.infrastructure.system.game_server.status_poller import StatusPoller
+
+    monkeypatch.setattr(status_poller, "GameServerManager", FakeGameServerManager)
+    monkeypatch.setattr(StatusPoller, "statuses", dict())
+    monkeypatch.setattr(StatusPoller, "watched", dict())
+    monkeypatch.setattr(StatusPoller, "backoff", dict())
+    monkeypatch.setattr(StatusPoller, "subscribers", set())
+    monkeypatch.setattr(StatusPoller, "_start", lambda self, app_context=None: None)
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: fallback)
+
+    FakeGameServerManager.statuses = dict()
+    FakeGameServerManager.down = set()
+    FakeGameServerManager.checked = []
+
+    return StatusPoller()
+
+
+def test_served_from_cache(poller):
+    FakeGameServerManager.statuses = {"a": True}
+
+    assert poller.get_power_states([Server("a"), Server("b")]) == {"a": True, "b": False}
+    assert poller.get_power_states([Server("a")]) == {"a": True}
+    assert FakeGameServerManager.checked == [["a", "b"]]
+
+
+def test_poll_publishes_changes(poller):
+    subscription = poller.subscribe([Server("a"), Server("b")])
+    snapshot = [subscription.queue.get_nowait() for _ in range(2)]
+    assert snapshot == [{"id": "a", "status": False}, {"id": "b", "status": False}]
+
+    FakeGameServerManager.statuses = {"a": True}
+    poller.poll()
+
+    assert subscription.queue.get_nowait() == {"id": "a", "status": True}
+    assert subscription.queue.empty()
+
+
+def test_subscription_filters_servers(poller):
+    subscription = poller.subscribe([Server("a")])
+    subscription.queue.get_nowait()
+
+    poller.get_power_states([Server("b")])
+    FakeGameServerManager.statuses = {"a": True, "b": True}
+    poller.poll()
+
+    assert subscription.queue.get_nowait() == {"id": "a", "status": True}
+    assert subscription.queue.empty()
+
+
+def test_unreachable_host_backs_off(poller):
+    FakeGameServerManager.down = {"down"}
+    poller.get_power_states([Server("a"), Server("b", install_host="down")])
+
+    poller.poll()
+    poller.poll()
+
+    # Down host was only checked the first time, then backed off.
+    assert FakeGameServerManager.checked[1:] == [["a", "b"], ["a"]]
+
+    failures, _ = poller.backoff[("remote", "down", "user")]
+    assert failures == 1
+
+
+def test_unwatched_servers_dropped(poller, monkeypatch):
+    from app.infrastructure.system.game_server.status_poller import StatusPoller
+
+    poller.get_power_states([Server("a")])
+    monkeypatch.setattr(StatusPoller, "WATCH_TTL", -1)
+
+    poller.poll()
+
+    assert poller.watched == {}
+    assert poller.statuses == {}
+
+
+def test_polling_off_checks_on_demand(poller, monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 0)
+
+    poller.get_power_states([Server("a")])
+    poller.get_power_states([Server("a")])
+
+    assert FakeGameServerManager.checked == [["a"], ["a"]]
+    assert poller.statuses == {}
+
+
+def test_forget_deleted_server(poller):
+    poller.get_power_states([Server("a"), Server("b")])
+
+    poller.forget("a")
+    poller.poll()
+
+    assert list(poller.watched) == ["b"]
+    assert poller.statuses == {"b": False}
+    assert FakeGameServerManager.checked[1:] == [["b"]]
+
+
+def test_forgotten_mid_check_not_stored(poller):
+    poller.get_power_states([Server("a")])
+
+    # Server deleted while its check is still running.
+    poller._update({"a": True, "b": True})
+    poller.forget("a")
+    poller._update({"a": False})
+
+    assert poller.statuses == {}
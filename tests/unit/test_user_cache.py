@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from app.domain.entities.user import User
+from app.domain.entities.permissions import Permissions
+
+
+def make_user(user_id=1, role="user", permissions=None):
+    permissions = permissions or {"server_ids": ["abc"], "routes": ["controls"], "controls": ["start"]}
+    return User(user_id, "bob", "hash", role, json.dumps(permissions), None, False, False)
+
+
+class Loader:
+    def __init__(self, user):
+        self.user = user
+        self.calls = 0
+
+    def __call__(self, user_id):
+        self.calls += 1
+        return self.user
+
+
+@pytest.fixture
+def user_cache(app, monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+    from app.infrastructure.persistence.repositories.user_cache import UserCache
+
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: fallback)
+    return UserCache()
+
+
+def test_loaded_once_per_request(app, user_cache):
+    loader = Loader(make_user())
+
+    with app.test_request_context():
+        user, perms = user_cache.get(1, loader)
+        assert user_cache.get("1", loader)[0] is user
+
+    assert loader.calls == 1
+    assert perms == Permissions(server_ids=["abc"], routes=["controls"], controls=["start"])
+
+
+def test_shared_across_requests_until_invalidated(app, user_cache):
+    loader = Loader(make_user())
+
+    with app.test_request_context():
+        user_cache.get(1, loader)
+    with app.test_request_context():
+        user_cache.get(1, loader)
+    assert loader.calls == 1
+
+    with app.test_request_context():
+        user_cache.invalidate(1)
+        user_cache.get(1, loader)
+        user_cache.get(1, loader)
+    assert loader.calls == 2
+
+
+def test_ttl_off_only_caches_per_request(app, user_cache, monkeypatch):
+    from app.infrastructure.system.config import ConfigManager
+
+    monkeypatch.setattr(ConfigManager, "getint", lambda self, section, option, fallback=None: 0)
+    loader = Loader(make_user())
+
+    for _ in range(2):
+        with app.test_request_context():
+            user_cache.get(1, loader)
+            user_cache.get(1, loader)
+
+    assert loader.calls == 2
+
+
+def test_missing_user_not_cached(app, user_cache):
+    loader = Loader(None)
+
+    with app.test_request_context():
+        assert user_cache.get(1, loader) == None
+        assert user_cache.get(1, loader) == None
+
+    assert loader.calls == 2
+
@@ -108,12 +108,16 @@ CONFIG.read(os.path.join(SCRIPTPATH, CONFIG_FILE))
 try:
     HOST = CONFIG["server"]["host"]
     PORT = CONFIG["server"]["port"]
+    THREADS = CONFIG["server"].get("threads", "8")
+    WORKERS = CONFIG["server"].get("workers", "1")
     DEBUG = CONFIG["debug"].getboolean("debug")
     LOG_LEVEL = CONFIG["debug"]["log_level"]
 except KeyError as e:
     print(f" [!] Configuration setting {e} not set.")
     HOST = "127.0.0.1"
     PORT = "12357"
+    THREADS = "8"
+    WORKERS = "1"
     DEBUG = False
     LOG_LEVEL = "info"
 
@@ -182,6 +186,13 @@ def start_server():
 
     print_start_banner()
 
+    # Every open live console holds a gunicorn thread, leave some for
+    # everything else.
+    max_streams = CONFIG.getint("settings", "console_max_streams", fallback=6)
+    if not max_streams or max_streams >= int(THREADS):
+        print(f" [!] console_max_streams ({max_streams}) should be set below threads ({THREADS}),")
+        print("     otherwise live consoles can tie up every server thread.")
+
     access_log = os.path.join(SCRIPTPATH, "logs/access.log")
     error_log = os.path.join(SCRIPTPATH, "logs/error.log")
 
@@ -196,6 +207,8 @@ def start_server():
             "--log-level",
             LOG_LEVEL,
             f"--bind={HOST}:{PORT}",
+            f"--threads={THREADS}",
+            f"--workers={WORKERS}",
             "--daemon",
             "app:create_app()",
         ]